@@ -0,0 +1,76 @@
+"""
+Benchmark cases that run the same corpora through headerparser and through
+the standard library's `email` package, for use with ``run.py --stdlib``.
+
+The stdlib parsers are used with their default ``compat32`` policy, which is
+the fastest one.  As the stdlib has no notion of stanzas, multi-stanza input
+is first split on blank lines, and the time spent splitting is included.
+"""
+
+from __future__ import annotations
+from collections.abc import Callable
+import email
+import email.parser
+from typing import Any
+import corpora
+from headerparser import Scanner, scan_stanzas
+
+#: The implementation against which all others are compared
+BASELINE = "email.parser.HeaderParser"
+
+
+def get_comparisons(scale: int) -> dict[str, tuple[str, dict[str, Callable[[], Any]]]]:
+    """
+    Return a mapping from corpus names to pairs of the corpus text and a
+    mapping from implementation names to functions that process the corpus
+    """
+    metadata = corpora.wheel_metadata()
+    email_text = corpora.email_headers(fields=40, fold_lines=8)
+    debian = corpora.debian_packages(200 * scale)
+    wheel_parser = corpora.wheel_parser()
+    email_parser = corpora.email_parser()
+    debian_parser = corpora.debian_parser()
+    stdlib_headers = email.parser.HeaderParser()
+
+    def stdlib_stanzas(text: str) -> None:
+        for chunk in text.split("\n\n"):
+            if chunk.strip():
+                stdlib_headers.parsestr(chunk)
+
+    return {
+        "wheel-metadata": (
+            metadata,
+            {
+                "headerparser.scan": lambda: list(Scanner(metadata).scan()),
+                "HeaderParser.parse": lambda: wheel_parser.parse(metadata),
+                BASELINE: lambda: stdlib_headers.parsestr(metadata),
+                "email.message_from_string": lambda: email.message_from_string(
+                    metadata
+                ),
+            },
+        ),
+        "email-folded": (
+            email_text,
+            {
+                "headerparser.scan": lambda: list(Scanner(email_text).scan()),
+                "HeaderParser.parse": lambda: email_parser.parse(email_text),
+                BASELINE: lambda: stdlib_headers.parsestr(email_text),
+                "email.message_from_string": lambda: email.message_from_string(
+                    email_text
+                ),
+            },
+        ),
+        "debian-packages": (
+            debian,
+            {
+                # Like the baseline, discard each stanza once it's been parsed:
+                "headerparser.scan_stanzas": lambda: sum(
+                    1 for _ in scan_stanzas(debian)
+                ),
+                "HeaderParser.parse_stanzas": lambda: sum(
+                    1 for _ in debian_parser.parse_stanzas(debian)
+                ),
+                BASELINE: lambda: stdlib_stanzas(debian),
+            },
+        ),
+    }
@@ -0,0 +1,167 @@
+"""
+Deterministic synthetic inputs for the benchmarks.  Every generator takes a
+``seed`` and returns the same text for the same arguments on every run and
+platform.
+"""
+
+from __future__ import annotations
+import random
+from headerparser import BOOL, HeaderParser
+
+PRIORITIES = ["required", "important", "standard", "optional", "extra"]
+SECTIONS = ["admin", "devel", "libs", "net", "python", "text", "utils", "web"]
+ARCHITECTURES = ["all", "amd64", "arm64", "armhf", "i386", "ppc64el", "s390x"]
+WORDS = (
+    "the quick brown fox jumps over lazy dog lorem ipsum dolor sit amet"
+    " parser header field value stanza folded continuation"
+).split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def debian_packages(stanzas: int, seed: int = 0) -> str:
+    """A Debian :file:`Packages` index with ``stanzas`` entries"""
+    rng = random.Random(seed)
+    out = []
+    for i in range(stanzas):
+        depends = ", ".join(
+            f"lib{rng.choice(WORDS)}{rng.randrange(10)}"
+            f" (>= {rng.randrange(5)}.{rng.randrange(20)})"
+            for _ in range(rng.randrange(1, 6))
+        )
+        desc = "\n".join(
+            " " + sentence(rng, rng.randrange(4, 12))
+            for _ in range(rng.randrange(1, 6))
+        )
+        out.append(
+            f"Package: pkg-{i}\n"
+            f"Version: {rng.randrange(10)}.{rng.randrange(100)}-{rng.randrange(5)}\n"
+            f"Architecture: {rng.choice(ARCHITECTURES)}\n"
+            f"Priority: {rng.choice(PRIORITIES)}\n"
+            f"Section: {rng.choice(SECTIONS)}\n"
+            f"Essential: {rng.choice(['yes', 'no'])}\n"
+            f"Installed-Size: {rng.randrange(1, 100000)}\n"
+            f"Maintainer: Maintainer {rng.randrange(500)}"
+            f" <m{rng.randrange(500)}@example.org>\n"
+            f"Depends: {depends}\n"
+            f"Filename: pool/main/p/pkg-{i}/pkg-{i}_{i}.deb\n"
+            f"Size: {rng.randrange(1, 10000000)}\n"
+            f"SHA256: {rng.getrandbits(256):064x}\n"
+            f"Description: {sentence(rng, 6)}\n"
+            f"{desc}\n"
+            "\n"
+        )
+    return "".join(out)
+
+
+def debian_parser() -> HeaderParser:
+    parser = HeaderParser()
+    parser.add_field("Package", required=True)
+    parser.add_field("Version", required=True)
+    parser.add_field("Architecture", choices=ARCHITECTURES)
+    parser.add_field("Priority", choices=PRIORITIES)
+    parser.add_field("Section", choices=SECTIONS)
+    parser.add_field("Essential", type=BOOL, default=False)
+    parser.add_field("Installed-Size", type=int)
+    parser.add_field("Size", type=int)
+    parser.add_field("Description", unfold=True)
+    parser.add_additional()
+    return parser
+
+
+def wheel_metadata(seed: int = 0, body_paragraphs: int = 20) -> str:
+    """A wheel :file:`METADATA` file with a long description as the body"""
+    rng = random.Random(seed)
+    classifiers = "".join(
+        f"Classifier: Topic :: {rng.choice(WORDS).title()}"
+        f" :: {rng.choice(WORDS).title()}\n"
+        for _ in range(25)
+    )
+    requires = "".join(
+        f"Requires-Dist: {rng.choice(WORDS)}-{i}"
+        f" >={rng.randrange(5)}.{rng.randrange(20)}"
+        f"; extra == '{rng.choice(WORDS)}'\n"
+        for i in range(15)
+    )
+    body = "\n".join(
+        "\n".join(sentence(rng, 12) for _ in range(rng.randrange(2, 8))) + "\n"
+        for _ in range(body_paragraphs)
+    )
+    return (
+        "Metadata-Version: 2.1\n"
+        "Name: example-package\n"
+        f"Version: {rng.randrange(10)}.{rng.randrange(10)}.{rng.randrange(10)}\n"
+        f"Summary: {sentence(rng, 10)}\n"
+        "Home-page: https://example.org/example-package\n"
+        "Author: Example Author\n"
+        "Author-email: author@example.org\n"
+        "License: MIT\n"
+        f"Keywords: {','.join(rng.choice(WORDS) for _ in range(8))}\n"
+        f"{classifiers}"
+        "Requires-Python: >=3.10\n"
+        f"{requires}"
+        "Description-Content-Type: text/markdown\n"
+        "\n"
+        f"{body}"
+    )
+
+
+def wheel_parser() -> HeaderParser:
+    parser = HeaderParser()
+    parser.add_field("Metadata-Version", required=True)
+    parser.add_field("Name", required=True)
+    parser.add_field("Version", required=True)
+    parser.add_field("Classifier", multiple=True)
+    parser.add_field("Requires-Dist", multiple=True)
+    parser.add_field("Keywords", type=lambda s: s.split(","))
+    parser.add_additional()
+    return parser
+
+
+def email_headers(fields: int, fold_lines: int, seed: int = 0) -> str:
+    """
+    An e-mail header section with ``fields`` fields, every fourth of which is
+    folded across ``fold_lines`` lines, followed by a short body
+    """
+    rng = random.Random(seed)
+    out = []
+    for i in range(fields):
+        if i % 4 == 0:
+            lines = [sentence(rng, 8) for _ in range(fold_lines)]
+            out.append(f"X-Header-{i}: " + "\n\t".join(lines) + "\n")
+        else:
+            out.append(f"X-Header-{i}: {sentence(rng, 6)}\n")
+    out.append("\n")
+    out.append(sentence(rng, 40) + "\n")
+    return "".join(out)
+
+
+def email_parser() -> HeaderParser:
+    parser = HeaderParser()
+    parser.add_additional(unfold=True)
+    return parser
+
+
+def long_folded_value(lines: int, seed: int = 0) -> str:
+    """A single field whose value is folded across ``lines`` lines"""
+    rng = random.Random(seed)
+    return (
+        "Field: start\n"
+        + "".join(f" {sentence(rng, 8)}\n" for _ in range(lines))
+        + "Other: end\n"
+    )
+
+
+def many_tiny_stanzas(stanzas: int) -> str:
+    """Many one-field stanzas separated by runs of blank lines"""
+    return "".join(f"K: {i}\n" + "\n" * (1 + i % 3) for i in range(stanzas))
+
+
+def huge_body(lines: int, seed: int = 0) -> str:
+    """A tiny header section followed by a body of ``lines`` lines"""
+    rng = random.Random(seed)
+    return "Subject: hello\n\n" + "".join(
+        sentence(rng, 12) + "\n" for _ in range(lines)
+    )
@@ -0,0 +1,119 @@
+"""
+Measure how long ``import headerparser`` takes and check that it doesn't drag
+in modules that are only needed by optional or deprecated functionality.
+
+Each statement is run in a fresh interpreter with ``-X importtime`` several
+times, and the fastest cumulative import time of the ``headerparser`` package
+is reported along with the submodules and dependencies that took the longest
+to import.  The script exits with status 1 if any of the statements imports a
+module that it should not need or if ``--max-ms`` is given and exceeded.
+
+Usage::
+
+    python benchmarks/import_time.py [--repeat N] [--top N] [--max-ms MS]
+                                     [-o results.json]
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import subprocess
+import sys
+from typing import Any
+
+#: Modules that are only needed once a deprecated function is called or files
+#: are parsed in bulk and so must never be imported up front
+FORBIDDEN = [
+    "attr",
+    "concurrent.futures",
+    "deprecated",
+    "headerparser.bulk",
+    "wrapt",
+    "zipfile",
+]
+
+#: A mapping from the statements to time to the modules they must not import
+STATEMENTS = {
+    "import headerparser": FORBIDDEN + ["headerparser.parser"],
+    "from headerparser import HeaderParser": FORBIDDEN,
+}
+
+
+def importtime(statement: str) -> dict[str, tuple[int, int]]:
+    """
+    Run ``statement`` in a new interpreter and return a mapping from the names
+    of the modules it imported to their self and cumulative import times in
+    microseconds
+    """
+    r = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in r.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            # Header line
+            continue
+        times[fields[2].strip()] = (self_us, cumulative_us)
+    return times
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--repeat", type=int, default=10, help="Number of interpreters to run"
+    )
+    ap.add_argument(
+        "--top", type=int, default=10, help="Number of slowest modules to show"
+    )
+    ap.add_argument(
+        "--max-ms",
+        type=float,
+        help="Fail if importing headerparser takes longer than this",
+    )
+    ap.add_argument("-o", "--output", help="Write results as JSON to this file")
+    args = ap.parse_args()
+    results: dict[str, Any] = {}
+    problems = []
+    for stmt, unwanted in STATEMENTS.items():
+        runs = [importtime(stmt) for _ in range(args.repeat)]
+        best = min(runs, key=lambda times: times["headerparser"][1])
+        total_ms = best["headerparser"][1] / 1000
+        forbidden = sorted(m for m in unwanted if m in best)
+        slowest = sorted(best.items(), key=lambda kv: kv[1][0], reverse=True)
+        results[stmt] = {
+            "headerparser_ms": total_ms,
+            "modules": len(best),
+            "forbidden": forbidden,
+            "slowest": {
+                name: {"self_ms": s / 1000, "cumulative_ms": c / 1000}
+                for name, (s, c) in slowest[: args.top]
+            },
+        }
+        print(f"{stmt}: {total_ms:.2f}ms, {len(best)} modules imported")
+        for name, (self_us, cumulative_us) in slowest[: args.top]:
+            print(
+                f"    {name:<40} {self_us / 1000:>7.2f}ms self"
+                f" {cumulative_us / 1000:>7.2f}ms cumulative"
+            )
+        if forbidden:
+            problems.append(f"{stmt!r} imports {', '.join(forbidden)}")
+        if args.max_ms is not None and total_ms > args.max_ms:
+            problems.append(f"{stmt!r} took {total_ms:.2f}ms > {args.max_ms:g}ms")
+    if args.output is not None:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=4)
+    if problems:
+        sys.exit("\n".join(problems))
+
+
+if __name__ == "__main__":
+    main()
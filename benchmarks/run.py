@@ -0,0 +1,357 @@
+"""
+Run the headerparser benchmark suite.
+
+Each benchmark case is run repeatedly on a deterministic synthetic corpus (see
+``corpora.py``), and its throughput, per-run latency percentiles, and peak
+memory allocated during a run (as measured by `tracemalloc`) are reported.
+Results can be written as JSON and compared against an earlier run.
+
+With ``--stdlib``, the same corpora are also run through the standard
+library's `email` header parsers (see ``compare_stdlib.py``), and each
+implementation's throughput and peak memory are reported relative to
+`email.parser.HeaderParser`.
+
+Usage::
+
+    python benchmarks/run.py [-k SUBSTRING] [--scale N] [--repeat N]
+                             [--stdlib] [-o results.json] [--compare old.json]
+"""
+
+from __future__ import annotations
+import argparse
+from collections.abc import Callable, Iterator
+import gc
+import json
+import math
+import platform
+import sys
+from time import perf_counter
+import tracemalloc
+from typing import Any, NamedTuple
+import compare_stdlib
+import corpora
+import headerparser
+from headerparser import (
+    NormalizedDict,
+    Scanner,
+    scan_stanza_views,
+    scan_stanzas,
+    scan_stanzas_into,
+)
+
+
+class Case(NamedTuple):
+    #: The name of the benchmark, of the form ``"operation/corpus"``
+    name: str
+    #: The function to time; called with no arguments
+    func: Callable[[], Any]
+    #: The number of characters of input processed by each call to ``func``
+    chars: int
+    #: The number of items (fields, stanzas, or operations) processed by each
+    #: call to ``func``
+    items: int
+
+
+def consume(it: Iterator[Any]) -> None:
+    for _ in it:
+        pass
+
+
+def scan_case(name: str, text: str) -> Case:
+    return Case(
+        f"scan/{name}",
+        lambda: consume(Scanner(text).scan()),
+        len(text),
+        sum(1 for _ in Scanner(text).scan()),
+    )
+
+
+def scan_stanzas_case(name: str, text: str) -> Case:
+    return Case(
+        f"scan_stanzas/{name}",
+        lambda: consume(scan_stanzas(text)),
+        len(text),
+        sum(1 for _ in scan_stanzas(text)),
+    )
+
+
+def scan_stanza_views_case(name: str, text: str) -> Case:
+    return Case(
+        f"scan_stanza_views/{name}",
+        lambda: consume(scan_stanza_views(text)),
+        len(text),
+        sum(1 for _ in scan_stanza_views(text)),
+    )
+
+
+def scan_stanza_views_access_case(name: str, text: str) -> Case:
+    def run() -> None:
+        for stanza in scan_stanza_views(text):
+            for view in stanza:
+                view.name
+                view.value
+
+    return Case(
+        f"scan_stanza_views+access/{name}",
+        run,
+        len(text),
+        sum(1 for _ in scan_stanza_views(text)),
+    )
+
+
+def scan_stanzas_lines_case(name: str, text: str) -> Case:
+    # Splitting is done up front so that only the scanning is timed and
+    # measured, for comparison with the views, which never split their input
+    lines = text.splitlines(keepends=True)
+    return Case(
+        f"scan_stanzas+presplit/{name}",
+        lambda: consume(scan_stanzas(lines)),
+        len(text),
+        sum(1 for _ in scan_stanzas(lines)),
+    )
+
+
+def get_cases(scale: int) -> list[Case]:
+    debian = corpora.debian_packages(200 * scale)
+    metadata = corpora.wheel_metadata()
+    email = corpora.email_headers(fields=40, fold_lines=8)
+    folded = corpora.long_folded_value(500 * scale)
+    tiny = corpora.many_tiny_stanzas(2000 * scale)
+    body = corpora.huge_body(2000 * scale)
+    debian_parser = corpora.debian_parser()
+    wheel_parser = corpora.wheel_parser()
+    email_parser = corpora.email_parser()
+    nstanzas = 200 * scale
+    keys = [f"X-Header-{i}" for i in range(1000)]
+    full = NormalizedDict((k, i) for i, k in enumerate(keys))
+
+    def normdict_set() -> None:
+        d = NormalizedDict()
+        for i, k in enumerate(keys):
+            d[k] = i
+
+    def normdict_get() -> None:
+        for k in keys:
+            full[k]
+
+    return [
+        scan_case("wheel-metadata", metadata),
+        scan_case("email-folded", email),
+        scan_case("long-folded-value", folded),
+        scan_case("huge-body", body),
+        scan_stanzas_case("debian-packages", debian),
+        scan_stanzas_case("tiny-stanzas", tiny),
+        scan_stanzas_lines_case("debian-packages", debian),
+        scan_stanzas_lines_case("tiny-stanzas", tiny),
+        scan_stanza_views_case("debian-packages", debian),
+        scan_stanza_views_case("tiny-stanzas", tiny),
+        scan_stanza_views_access_case("debian-packages", debian),
+        scan_stanza_views_access_case("tiny-stanzas", tiny),
+        Case(
+            "scan_stanzas_into/tiny-stanzas",
+            lambda: scan_stanzas_into(tiny, lambda _k, _v: None),
+            len(tiny),
+            2000 * scale,
+        ),
+        Case(
+            "scan_stanza_batches/tiny-stanzas",
+            lambda: consume(Scanner(tiny).scan_stanza_batches(1000)),
+            len(tiny),
+            2000 * scale,
+        ),
+        Case(
+            "parse/wheel-metadata",
+            lambda: wheel_parser.parse(metadata),
+            len(metadata),
+            1,
+        ),
+        Case(
+            "parse/email-folded",
+            lambda: email_parser.parse(email),
+            len(email),
+            1,
+        ),
+        Case(
+            "parse_stanzas/debian-packages",
+            lambda: consume(debian_parser.parse_stanzas(debian)),
+            len(debian),
+            nstanzas,
+        ),
+        Case(
+            "parse_stanzas_into/debian-packages",
+            lambda: debian_parser.parse_stanzas_into(debian, lambda _: None),
+            len(debian),
+            nstanzas,
+        ),
+        Case(
+            "parse_stanza_batches/debian-packages",
+            lambda: consume(debian_parser.parse_stanza_batches(debian, 1000)),
+            len(debian),
+            nstanzas,
+        ),
+        Case(
+            "validate_stanzas/debian-packages",
+            lambda: consume(debian_parser.validate_stanzas(debian)),
+            len(debian),
+            nstanzas,
+        ),
+        Case(
+            "audit_stanzas/debian-packages",
+            lambda: debian_parser.audit_stanzas(debian),
+            len(debian),
+            nstanzas,
+        ),
+        Case("normdict/setitem", normdict_set, 0, len(keys)),
+        Case("normdict/getitem", normdict_get, 0, len(keys)),
+        Case("normdict/iterate", lambda: list(full.items()), 0, len(keys)),
+        Case("normdict/eq", lambda: full == full.copy(), 0, len(keys)),
+    ]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already-sorted list"""
+    k = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+
+def measure(case: Case, repeat: int, min_time: float) -> dict[str, Any]:
+    case.func()  # Warm up
+    timings: list[float] = []
+    gc.collect()
+    total = 0.0
+    while len(timings) < repeat or total < min_time:
+        start = perf_counter()
+        case.func()
+        elapsed = perf_counter() - start
+        timings.append(elapsed)
+        total += elapsed
+    timings.sort()
+    gc.collect()
+    tracemalloc.start()
+    case.func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    median = percentile(timings, 50)
+    return {
+        "runs": len(timings),
+        "chars": case.chars,
+        "items": case.items,
+        "min": timings[0],
+        "p50": median,
+        "p90": percentile(timings, 90),
+        "p99": percentile(timings, 99),
+        "max": timings[-1],
+        "chars_per_sec": case.chars / median if case.chars else None,
+        "items_per_sec": case.items / median,
+        "peak_memory": peak,
+    }
+
+
+def fmt_rate(rate: float | None) -> str:
+    if rate is None:
+        return "-"
+    for unit in ["", "k", "M", "G"]:
+        if rate < 1000:
+            return f"{rate:.1f}{unit}"
+        rate /= 1000
+    return f"{rate:.1f}T"
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> None:
+    print()
+    print(f"{'benchmark':<36} {'old p50':>10} {'new p50':>10} {'change':>8}")
+    for name, result in new["results"].items():
+        before = old["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["p50"] / before["p50"]
+        print(
+            f"{name:<36} {before['p50'] * 1000:>8.3f}ms"
+            f" {result['p50'] * 1000:>8.3f}ms {(ratio - 1) * 100:>+7.1f}%"
+        )
+
+
+def run_stdlib_comparison(args: argparse.Namespace) -> dict[str, Any]:
+    comparison: dict[str, Any] = {}
+    print()
+    print(
+        f"{'corpus':<16} {'implementation':<28} {'p50':>9} {'chars/s':>8}"
+        f" {'speed':>6} {'peak mem':>9} {'memory':>6}"
+    )
+    for corpus, (text, impls) in compare_stdlib.get_comparisons(args.scale).items():
+        if args.filter is not None and args.filter not in corpus:
+            continue
+        measured = {
+            name: measure(Case(name, func, len(text), 1), args.repeat, args.min_time)
+            for name, func in impls.items()
+        }
+        base = measured[compare_stdlib.BASELINE]
+        for name, r in measured.items():
+            r["relative_speed"] = base["p50"] / r["p50"]
+            r["relative_memory"] = r["peak_memory"] / base["peak_memory"]
+            print(
+                f"{corpus:<16} {name:<28} {r['p50'] * 1000:>7.3f}ms"
+                f" {fmt_rate(r['chars_per_sec']):>8} {r['relative_speed']:>5.2f}x"
+                f" {r['peak_memory'] / 1024:>7.0f}KB {r['relative_memory']:>5.2f}x"
+            )
+        comparison[corpus] = measured
+    return comparison
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "-k", dest="filter", help="Only run benchmarks whose names contain this"
+    )
+    ap.add_argument(
+        "--scale", type=int, default=1, help="Multiply corpus sizes by this"
+    )
+    ap.add_argument("--repeat", type=int, default=20, help="Minimum runs per case")
+    ap.add_argument(
+        "--min-time",
+        type=float,
+        default=0.5,
+        help="Minimum total seconds to spend timing each case",
+    )
+    ap.add_argument(
+        "--stdlib",
+        action="store_true",
+        help="Also compare against the stdlib email header parsers",
+    )
+    ap.add_argument("-o", "--output", help="Write results as JSON to this file")
+    ap.add_argument("--compare", help="Compare against results in this JSON file")
+    args = ap.parse_args()
+    results: dict[str, Any] = {
+        "headerparser": headerparser.__version__,
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "results": {},
+    }
+    print(
+        f"{'benchmark':<36} {'p50':>9} {'p90':>9} {'p99':>9}"
+        f" {'chars/s':>8} {'items/s':>8} {'peak mem':>9}"
+    )
+    for case in get_cases(args.scale):
+        if args.filter is not None and args.filter not in case.name:
+            continue
+        r = measure(case, args.repeat, args.min_time)
+        results["results"][case.name] = r
+        print(
+            f"{case.name:<36} {r['p50'] * 1000:>7.3f}ms {r['p90'] * 1000:>7.3f}ms"
+            f" {r['p99'] * 1000:>7.3f}ms {fmt_rate(r['chars_per_sec']):>8}"
+            f" {fmt_rate(r['items_per_sec']):>8} {r['peak_memory'] / 1024:>7.0f}KB"
+        )
+    if args.stdlib:
+        results["stdlib_comparison"] = run_stdlib_comparison(args)
+    if args.output is not None:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=4)
+    if args.compare is not None:
+        with open(args.compare) as fp:
+            compare(json.load(fp), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Check how the running time of scanning and parsing grows with the size of
+various aspects of the input and the parser configuration.
+
+For each dimension, the operation is timed at a geometric series of sizes, and
+the growth exponent is estimated by a least-squares fit of log(time) against
+log(size).  An exponent of 1 means the time grows linearly with the size, 0
+means it does not grow at all, 2 means it grows quadratically, and so on.  Any
+dimension whose exponent exceeds its expected value by more than the tolerance
+is flagged, and the script exits with status 1 if anything was flagged.
+
+Usage::
+
+    python benchmarks/scaling.py [-k SUBSTRING] [--steps N] [--tolerance X]
+                                 [-o results.json]
+"""
+
+from __future__ import annotations
+import argparse
+from collections.abc import Callable
+import json
+import math
+import sys
+from time import perf_counter
+from typing import Any, NamedTuple
+import corpora
+from headerparser import HeaderParser, Scanner, scan_stanzas
+
+
+class Dimension(NamedTuple):
+    #: A description of what is being varied
+    name: str
+    #: The smallest size to measure; each subsequent size is double the
+    #: previous one
+    base: int
+    #: The expected growth exponent
+    expected: float
+    #: A function that takes a size and returns a function to time
+    setup: Callable[[int], Callable[[], Any]]
+
+
+def stanzas(n: int) -> Callable[[], Any]:
+    text = corpora.debian_packages(n)
+    parser = corpora.debian_parser()
+    return lambda: sum(1 for _ in parser.parse_stanzas(text))
+
+
+def fields_per_stanza(n: int) -> Callable[[], Any]:
+    text = "".join(f"Field-{i}: value {i}\n" for i in range(n))
+    parser = HeaderParser()
+    parser.add_additional()
+    return lambda: parser.parse(text)
+
+
+def folded_value_length(n: int) -> Callable[[], Any]:
+    text = corpora.long_folded_value(n)
+    return lambda: list(Scanner(text).scan())
+
+
+def unfolded_value_length(n: int) -> Callable[[], Any]:
+    text = corpora.long_folded_value(n)
+    parser = HeaderParser()
+    parser.add_additional(unfold=True)
+    return lambda: parser.parse(text)
+
+
+def body_size(n: int) -> Callable[[], Any]:
+    text = corpora.huge_body(n)
+    return lambda: list(Scanner(text).scan())
+
+
+def tiny_stanzas(n: int) -> Callable[[], Any]:
+    text = corpora.many_tiny_stanzas(n)
+    return lambda: sum(1 for _ in scan_stanzas(text))
+
+
+def defined_fields(n: int) -> Callable[[], Any]:
+    parser = HeaderParser()
+    for i in range(n):
+        parser.add_field(f"Field-{i}")
+    text = "Field-0: foo\nField-1: bar\n"
+    return lambda: parser.parse(text)
+
+
+def choices_length(n: int) -> Callable[[], Any]:
+    parser = HeaderParser()
+    choices = [f"choice-{i}" for i in range(n)]
+    parser.add_field("Color", choices=choices, multiple=True)
+    # Use the last choice so that a linear search has to look at all of them:
+    text = f"Color: {choices[-1]}\n" * 50
+    return lambda: parser.parse(text)
+
+
+DIMENSIONS = [
+    Dimension("number of stanzas", 50, 1, stanzas),
+    Dimension("number of fields per stanza", 50, 1, fields_per_stanza),
+    Dimension("length of folded value (scan)", 100, 1, folded_value_length),
+    Dimension("length of folded value (unfold)", 100, 1, unfolded_value_length),
+    Dimension("body size", 200, 1, body_size),
+    Dimension("number of tiny stanzas", 200, 1, tiny_stanzas),
+    # Every parse checks each defined field for a required value or default:
+    Dimension("number of defined fields", 50, 1, defined_fields),
+    Dimension("length of choices list", 50, 0, choices_length),
+]
+
+
+def best_time(func: Callable[[], Any], min_time: float) -> float:
+    """
+    Return the fastest time of at least five calls to ``func`` spread over at
+    least ``min_time`` seconds
+    """
+    best = math.inf
+    total = 0.0
+    runs = 0
+    while runs < 5 or total < min_time:
+        start = perf_counter()
+        func()
+        elapsed = perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        runs += 1
+    return best
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """Least-squares slope of log(time) against log(size)"""
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(t) for t in times]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    num = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    den = sum((x - mx) ** 2 for x in xs)
+    return num / den
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "-k", dest="filter", help="Only check dimensions whose names contain this"
+    )
+    ap.add_argument(
+        "--steps", type=int, default=6, help="Number of sizes to measure"
+    )
+    ap.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="How far an exponent may exceed its expected value",
+    )
+    ap.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="Minimum total seconds to spend timing each size",
+    )
+    ap.add_argument("-o", "--output", help="Write results as JSON to this file")
+    args = ap.parse_args()
+    results: dict[str, Any] = {}
+    flagged = []
+    for dim in DIMENSIONS:
+        if args.filter is not None and args.filter not in dim.name:
+            continue
+        sizes = [dim.base * 2**i for i in range(args.steps)]
+        times = [best_time(dim.setup(n), args.min_time) for n in sizes]
+        exponent = fit_exponent(sizes, times)
+        ok = exponent <= dim.expected + args.tolerance
+        results[dim.name] = {
+            "sizes": sizes,
+            "times": times,
+            "exponent": exponent,
+            "expected": dim.expected,
+            "ok": ok,
+        }
+        print(
+            f"{dim.name:<34} exponent {exponent:5.2f}"
+            f" (expected <= {dim.expected:g}){'' if ok else '  ** TOO STEEP **'}"
+        )
+        if not ok:
+            flagged.append(dim.name)
+    if args.output is not None:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=4)
+    if flagged:
+        sys.exit(f"Unexpected growth in: {', '.join(flagged)}")
+
+
+if __name__ == "__main__":
+    main()
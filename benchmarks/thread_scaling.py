@@ -0,0 +1,85 @@
+"""
+Measure how the throughput of a single shared `HeaderParser` scales with the
+number of threads calling `HeaderParser.parse_stanzas()` concurrently.  On a
+free-threaded build of Python, throughput should increase with the number of
+threads up to the number of available cores; on a build with the GIL, it is
+expected to stay flat.
+
+Usage::
+
+    python benchmarks/thread_scaling.py [--threads 1,2,4,8,16,32] [--json FILE]
+"""
+
+from __future__ import annotations
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import sys
+from time import perf_counter
+from corpora import debian_packages, debian_parser
+from headerparser import HeaderParser
+
+DEFAULT_THREADS = [1, 2, 4, 8, 16, 32]
+
+
+def run(parser: HeaderParser, corpus: str, threads: int, tasks: int) -> float:
+    """Parse ``corpus`` ``tasks`` times across ``threads`` threads"""
+
+    def task(_: int) -> int:
+        return sum(1 for _ in parser.parse_stanzas(corpus))
+
+    start = perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(task, range(tasks)))
+    return perf_counter() - start
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument(
+        "--threads",
+        type=lambda s: [int(n) for n in s.split(",")],
+        default=DEFAULT_THREADS,
+        help="Comma-separated thread counts to measure",
+    )
+    ap.add_argument("--stanzas", type=int, default=200, help="Stanzas per task")
+    ap.add_argument("--tasks", type=int, default=64, help="Parse calls per run")
+    ap.add_argument("--json", metavar="FILE", help="Write results as JSON to FILE")
+    args = ap.parse_args()
+    parser = debian_parser()
+    corpus = debian_packages(args.stanzas)
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    results = {
+        "python": sys.version,
+        "gil_enabled": is_gil_enabled(),
+        "cpu_count": os.cpu_count(),
+        "stanzas_per_task": args.stanzas,
+        "tasks": args.tasks,
+        "runs": [],
+    }
+    baseline: float | None = None
+    print(f"GIL enabled: {results['gil_enabled']}")
+    print(f"{'threads':>7}  {'seconds':>8}  {'stanzas/s':>10}  {'speedup':>7}")
+    for n in args.threads:
+        elapsed = run(parser, corpus, n, args.tasks)
+        rate = args.stanzas * args.tasks / elapsed
+        if baseline is None:
+            baseline = rate
+        speedup = rate / baseline
+        results["runs"].append(
+            {
+                "threads": n,
+                "seconds": elapsed,
+                "stanzas_per_sec": rate,
+                "speedup": speedup,
+            }
+        )
+        print(f"{n:>7}  {elapsed:>8.3f}  {rate:>10.0f}  {speedup:>7.2f}")
+    if args.json is not None:
+        with open(args.json, "w") as fp:
+            json.dump(results, fp, indent=4)
+
+
+if __name__ == "__main__":
+    main()
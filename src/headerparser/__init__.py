@@ -13,6 +13,9 @@ Visit <https://github.com/wheelodex/headerparser> or
 <http://headerparser.rtfd.io> for more information.
 """
 
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 from .errors import (
     BodyNotAllowedError,
     DuplicateFieldError,
@@ -28,18 +31,37 @@ from .errors import (
     UnexpectedFoldingError,
     UnknownFieldError,
 )
-from .normdict import NormalizedDict
-from .parser import HeaderParser
+from .normdict import LazyNormalizedDict, NormalizedDict
 from .scanner import (
     Scanner,
+    ScannerCheckpoint,
+    ScannerCounters,
+    follow,
     scan,
+    scan_into,
     scan_next_stanza,
     scan_next_stanza_string,
     scan_stanzas,
+    scan_stanzas_into,
     scan_stanzas_string,
     scan_string,
 )
-from .types import BOOL, lower, unfold
+from .types import (
+    BOOL,
+    CachedConverter,
+    load_choices,
+    lower,
+    memoize,
+    unfold,
+)
+
+if TYPE_CHECKING:
+    from .columns import Columns, scan_columns
+    from .hooks import ParseHook
+    from .parser import HeaderParser
+    from .report import Problem, ValidationReport
+    from .stats import ParseStats, PhaseStats
+    from .views import FieldView, scan_stanza_views, scan_views
 
 __version__ = "0.6.0.dev1"
 __author__ = "John Thorvald Wodder II"
@@ -50,27 +72,77 @@ __url__ = "https://github.com/wheelodex/headerparser"
 __all__ = [
     "BOOL",
     "BodyNotAllowedError",
+    "CachedConverter",
+    "Columns",
     "DuplicateFieldError",
     "Error",
+    "FieldView",
     "HeaderParser",
     "FieldTypeError",
     "InvalidChoiceError",
+    "LazyNormalizedDict",
     "MalformedHeaderError",
     "MissingBodyError",
     "MissingFieldError",
     "NormalizedDict",
+    "ParseHook",
+    "ParseStats",
     "ParserError",
+    "PhaseStats",
+    "Problem",
     "Scanner",
+    "ScannerCheckpoint",
+    "ScannerCounters",
     "ScannerEOFError",
     "ScannerError",
     "UnexpectedFoldingError",
     "UnknownFieldError",
+    "ValidationReport",
+    "follow",
+    "load_choices",
     "lower",
+    "memoize",
     "scan",
+    "scan_columns",
+    "scan_into",
     "scan_next_stanza",
     "scan_next_stanza_string",
+    "scan_stanza_views",
     "scan_stanzas",
+    "scan_stanzas_into",
     "scan_stanzas_string",
     "scan_string",
+    "scan_views",
     "unfold",
 ]
+
+#: Public names that are only imported from their submodules on first access
+#: in order to keep ``import headerparser`` fast; the scanning functions and
+#: the exceptions, by contrast, are always imported.
+_LAZY_ATTRS = {
+    "Columns": "columns",
+    "scan_columns": "columns",
+    "HeaderParser": "parser",
+    "ParseHook": "hooks",
+    "ParseStats": "stats",
+    "PhaseStats": "stats",
+    "Problem": "report",
+    "ValidationReport": "report",
+    "FieldView": "views",
+    "scan_stanza_views": "views",
+    "scan_views": "views",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        modname = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{modname}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
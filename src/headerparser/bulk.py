@@ -0,0 +1,165 @@
+from __future__ import annotations
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from fnmatch import fnmatchcase
+from io import TextIOWrapper
+from itertools import islice
+import os
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
+from zipfile import ZipFile
+
+if TYPE_CHECKING:
+    from .normdict import NormalizedDict
+    from .parser import HeaderParser
+
+T = TypeVar("T")
+
+#: A function that takes a `HeaderParser` and an input path and returns the
+#: parsed result
+Opener: TypeAlias = "Callable[[HeaderParser, Any], NormalizedDict]"
+
+#: The parser passed to `init_worker()` in the current worker process
+worker_parser: HeaderParser | None = None
+
+
+def parse_file(parser: HeaderParser, path: Any, encoding: str) -> NormalizedDict:
+    with open(path, encoding=encoding) as fp:
+        return parser._parse(fp, path)
+
+
+def find_member(zf: ZipFile, member: str) -> str:
+    """
+    Return the name of the shallowest member of ``zf`` whose name matches the
+    glob pattern ``member``.  Only the archive's central directory (which
+    `~zipfile.ZipFile` reads on opening) is consulted.
+    """
+    best: str | None = None
+    for name in zf.namelist():
+        if fnmatchcase(name, member) and (
+            best is None or name.count("/") < best.count("/")
+        ):
+            best = name
+    if best is None:
+        raise KeyError(f"no member matching {member!r} found in archive")
+    return best
+
+
+def parse_archive(
+    parser: HeaderParser, path: Any, member: str, encoding: str
+) -> NormalizedDict:
+    with ZipFile(path) as zf:
+        with zf.open(find_member(zf, member)) as fp:
+            return parser._parse(TextIOWrapper(fp, encoding=encoding), path)
+
+
+def parse_batch(
+    parser: HeaderParser, opener: Opener, batch: list[T]
+) -> list[tuple[T, NormalizedDict | Exception]]:
+    results: list[tuple[T, NormalizedDict | Exception]] = []
+    for path in batch:
+        try:
+            results.append((path, opener(parser, path)))
+        except Exception as e:
+            results.append((path, e))
+    return results
+
+
+def init_worker(parser: HeaderParser) -> None:
+    global worker_parser
+    worker_parser = parser
+
+
+def parse_batch_in_worker(
+    opener: Opener, batch: list[T]
+) -> list[tuple[T, NormalizedDict | Exception]]:
+    assert worker_parser is not None
+    return parse_batch(worker_parser, opener, batch)
+
+
+def parse_all(
+    parser: HeaderParser,
+    paths: Iterable[T],
+    opener: Opener,
+    workers: int | None,
+    executor: str,
+    ordered: bool,
+    chunksize: int,
+) -> Iterator[tuple[T, NormalizedDict | Exception]]:
+    """
+    Apply ``opener`` to each path in ``paths`` in a pool of threads or
+    processes, sending the paths to the workers in lists of ``chunksize``
+    paths, and return a generator of each path paired with its result or the
+    exception raised while processing it.  When using processes, ``parser`` is
+    sent to each worker only once, when the worker starts.
+
+    The arguments are validated immediately rather than when the generator is
+    first advanced.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive")
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+    if executor not in ("thread", "process"):
+        raise ValueError(f"executor must be 'thread' or 'process', not {executor!r}")
+    return _parse_all(parser, paths, opener, workers, executor, ordered, chunksize)
+
+
+def _parse_all(
+    parser: HeaderParser,
+    paths: Iterable[T],
+    opener: Opener,
+    workers: int | None,
+    executor: str,
+    ordered: bool,
+    chunksize: int,
+) -> Iterator[tuple[T, NormalizedDict | Exception]]:
+    pool: Executor
+    submit: Callable[[list[T]], Future[list[tuple[T, Any]]]]
+    if executor == "thread":
+        pool = ThreadPoolExecutor(workers)
+
+        def submit(batch: list[T]) -> Future[list[tuple[T, Any]]]:
+            return pool.submit(parse_batch, parser, opener, batch)
+
+    else:
+        pool = ProcessPoolExecutor(workers, initializer=init_worker, initargs=(parser,))
+
+        def submit(batch: list[T]) -> Future[list[tuple[T, Any]]]:
+            return pool.submit(parse_batch_in_worker, opener, batch)
+
+    # Limit the number of batches in flight so that memory use doesn't grow
+    # with the number of inputs:
+    window = 2 * (workers or os.cpu_count() or 1)
+    pathiter = iter(paths)
+    batches = iter(lambda: list(islice(pathiter, chunksize)), [])
+    try:
+        if ordered:
+            queue: deque[Future[list[tuple[T, Any]]]] = deque()
+            for batch in batches:
+                queue.append(submit(batch))
+                if len(queue) >= window:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+        else:
+            pending: set[Future[list[tuple[T, Any]]]] = set()
+            for batch in batches:
+                pending.add(submit(batch))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield from fut.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield from fut.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
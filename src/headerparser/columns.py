@@ -0,0 +1,219 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+from .errors import DuplicateFieldError, FieldTypeError
+from .scanner import Scanner
+
+#: Array typecodes for floating-point columns; all other typecodes are integer
+#: typecodes
+FLOAT_TYPECODES = frozenset("fd")
+
+
+class Columns(Mapping):
+    """
+    .. versionadded:: 0.6.0
+
+    The fields of a sequence of stanzas arranged in columns, as returned by
+    `scan_columns()`.  A `Columns` instance is a read-only mapping from field
+    names (in the order in which they were first encountered) to columns, each
+    of which has one entry per stanza.  A column is a `list` of `str` values,
+    with the ``missing`` marker for stanzas in which the field did not occur,
+    unless it was given a typecode, in which case it is an `array.array` of
+    converted values, with the ``fill`` value for stanzas lacking the field.
+    Use `mask()` to tell filled-in entries apart from real values.
+
+    Field names are compared exactly, without normalization.
+    """
+
+    def __init__(
+        self,
+        columns: dict[str, list | array],
+        rows: int,
+        missing: Any,
+        masks: dict[str, array] | None = None,
+    ) -> None:
+        self._columns = columns
+        #: For each `array.array` column, an array of flags that are 1 for
+        #: stanzas lacking the field
+        self._masks = masks if masks is not None else {}
+        #: The number of stanzas scanned
+        self.rows = rows
+        #: The marker used in `list` columns for stanzas lacking the field
+        self.missing = missing
+
+    def __getitem__(self, name: str) -> list | array:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__qualname__}(rows={self.rows!r},"
+            f" fields={list(self._columns)!r})"
+        )
+
+    def row(self, i: int) -> dict[str, Any]:
+        """
+        Return a `dict` of the fields present in the ``i``-th stanza.  Fields
+        in `list` columns whose value is the ``missing`` marker are omitted.
+        """
+        if not -self.rows <= i < self.rows:
+            raise IndexError("row index out of range")
+        return {
+            name: col[i]
+            for name, col in self._columns.items()
+            if isinstance(col, array) or col[i] is not self.missing
+        }
+
+    def mask(self, name: str) -> array:
+        """
+        Return an `array.array` of unsigned bytes (typecode ``"B"``) with one
+        entry per stanza: 1 if the stanza lacks the field ``name`` (and so its
+        entry in the column is the ``missing`` marker or the ``fill`` value),
+        0 if the field was present.  The result can be passed to
+        ``numpy.ma.masked_array(..., mask=...)`` after conversion with
+        ``numpy.frombuffer(..., dtype=bool)``.
+
+        :raises KeyError: if there is no column for ``name``
+        """
+        col = self._columns[name]
+        if isinstance(col, array):
+            return array("B", self._masks[name])
+        return array("B", [v is self.missing for v in col])
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Return a `dict` mapping field names to NumPy arrays.  `array.array`
+        columns are converted without copying; `list` columns become arrays
+        with ``dtype=object``.  Requires NumPy.
+        """
+        import numpy as np
+
+        return {
+            name: (
+                np.frombuffer(col, dtype=col.typecode)
+                if isinstance(col, array)
+                else np.array(col, dtype=object)
+            )
+            for name, col in self._columns.items()
+        }
+
+    def to_pandas(self) -> Any:
+        """
+        Return a `pandas.DataFrame` with one row per stanza and one column per
+        field.  Requires pandas.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.to_numpy())
+
+
+def scan_columns(
+    data: str | Iterable[str],
+    *,
+    fields: Iterable[str] | None = None,
+    typecodes: Mapping[str, str] | None = None,
+    missing: Any = None,
+    fill: int | float | None = None,
+    **kwargs: Any,
+) -> Columns:
+    """
+    .. versionadded:: 0.6.0
+
+    Scan zero or more stanzas as with `scan_stanzas()` and collect the fields
+    into per-field columns, returned as a `Columns` instance.  Each field name
+    is stored once, as a key of the result, rather than once per occurrence,
+    and no per-stanza `list` or `dict` is retained.
+
+    :param data: a string, text-file-like object, or iterable of lines
+    :param fields: If not `None`, only fields with these names are collected,
+        and all others are discarded.  The columns for these fields are
+        created up front, in the given order, even if the fields never occur.
+    :param typecodes: A mapping from field names to `array.array` typecodes.
+        The columns for these fields are stored as arrays of the given type,
+        with values converted by `int` or (for the ``"f"`` and ``"d"``
+        typecodes) `float`.
+    :param missing: the value stored in `list` columns for stanzas that lack
+        the field
+    :param fill: The value stored in `array.array` columns for stanzas that
+        lack the field.  The default is NaN for floating-point columns and 0
+        for integer columns.  `Columns.mask()` tells these entries apart from
+        real values.
+    :param kwargs: Passed to the `Scanner` constructor
+    :rtype: Columns
+    :raises ScannerError: if a header section is malformed
+    :raises DuplicateFieldError: if a field occurs more than once in a stanza
+    :raises FieldTypeError: if a value cannot be converted for a typed
+        column; the exception's ``stanza`` attribute gives the index of the
+        offending stanza
+    """
+    typecodes = dict(typecodes) if typecodes is not None else {}
+    columns: dict[str, list | array] = {}
+    #: For each typed column, flags recording which stanzas lack the field
+    masks: dict[str, array] = {}
+    #: The value appended to each column for stanzas that lack the field
+    fills: dict[str, Any] = {}
+    wanted: set[str] | None = None
+    rows = 0
+
+    def new_column(name: str) -> list | array:
+        col: list | array
+        if name in typecodes:
+            col = array(typecodes[name])
+            if fill is not None:
+                fills[name] = fill
+            elif col.typecode in FLOAT_TYPECODES:
+                fills[name] = float("nan")
+            else:
+                fills[name] = 0
+            masks[name] = array("B", [1] * rows)
+        else:
+            col = []
+            fills[name] = missing
+        col.extend([fills[name]] * rows)
+        columns[name] = col
+        return col
+
+    if fields is not None:
+        for name in fields:
+            new_column(name)
+        wanted = set(columns)
+
+    sc = Scanner(data, **kwargs)
+    # Drive the scanner's stanza loop directly so that no generator is
+    # involved and each stanza's list of fields is discarded as soon as its
+    # fields have been added to the columns:
+    sc._begin_stanzas()
+    while (stanza := sc._next_stanza()) is not None:
+        for name, value in stanza:
+            col = columns.get(name)
+            if col is None:
+                if wanted is not None:
+                    continue
+                col = new_column(name)
+            if len(col) > rows:
+                raise DuplicateFieldError(name)
+            if isinstance(col, array):
+                try:
+                    if col.typecode in FLOAT_TYPECODES:
+                        col.append(float(value))
+                    else:
+                        col.append(int(value))
+                except (ValueError, OverflowError) as e:
+                    raise FieldTypeError(name, value, e, stanza=rows) from e
+                masks[name].append(0)
+            else:
+                col.append(value)
+        rows += 1
+        for name, col in columns.items():
+            if len(col) < rows:
+                col.append(fills[name])
+                if name in masks:
+                    masks[name].append(1)
+    sc._end_stanzas()
+    return Columns(columns, rows, missing, masks)
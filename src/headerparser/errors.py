@@ -60,7 +60,13 @@ class DuplicateFieldError(ParserError):
 class FieldTypeError(ParserError):
     """Raised when a ``type`` callable raises an exception"""
 
-    def __init__(self, name: str, value: str, exc_value: BaseException) -> None:
+    def __init__(
+        self,
+        name: str,
+        value: str,
+        exc_value: BaseException,
+        stanza: int | None = None,
+    ) -> None:
         #: The name of the header field for which the ``type`` callable was
         #: called
         self.name: str = name
@@ -68,11 +74,17 @@ class FieldTypeError(ParserError):
         self.value: str = value
         #: The exception raised by the ``type`` callable
         self.exc_value: BaseException = exc_value
-        super().__init__(name, value, exc_value)
+        #: .. versionadded:: 0.6.0
+        #:
+        #: The index (counting from 0) of the stanza in which the field
+        #: occurred, if known; set by `scan_columns()`
+        self.stanza: int | None = stanza
+        super().__init__(name, value, exc_value, stanza)
 
     def __str__(self) -> str:
+        where = f" in stanza {self.stanza}" if self.stanza is not None else ""
         return (
-            f"Error while parsing {self.name!r}: {self.value!r}:"
+            f"Error while parsing {self.name!r}{where}: {self.value!r}:"
             f" {self.exc_value.__class__.__name__}: {self.exc_value}"
         )
 
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .normdict import NormalizedDict
+
+
+class ParseHook:
+    """
+    .. versionadded:: 0.6.0
+
+    Base class for objects that observe each call to a `HeaderParser`'s
+    `~HeaderParser.parse_stream()` method (and thus every call to
+    `~HeaderParser.parse()` and every stanza parsed by
+    `~HeaderParser.parse_stanzas()`).  Register an instance with
+    `HeaderParser.add_hook()`, overriding whichever methods are of interest;
+    the default implementations do nothing.
+
+    A hook may be called from multiple threads at once if the parser is
+    shared between threads.  To support this, any state for a single parse
+    should be returned from `on_parse_start()`, which is then passed back to
+    the other methods as ``ctx``.  For example, a hook that records an
+    OpenTelemetry span for each parse would start the span in
+    `on_parse_start()`, return it, and end it in `on_parse_end()` and
+    `on_error()`.
+
+    All times are wall-clock durations in seconds.
+    """
+
+    def on_parse_start(self, source: Any, stanza: int | None) -> Any:
+        """
+        Called when parsing begins.  The return value is passed as ``ctx`` to
+        the other methods for the same parse.
+
+        :param source: Identifies the input being parsed: the ``data``
+            argument passed to `~HeaderParser.parse()`,
+            `~HeaderParser.parse_stanzas()`, or a similar method, or the path
+            of the file being parsed by `~HeaderParser.parse_files()`,
+            `~HeaderParser.parse_archive()`, or
+            `~HeaderParser.parse_archives()`.  This is `None` when
+            `~HeaderParser.parse_stream()` or
+            `~HeaderParser.parse_stanzas_stream()` is called directly.
+        :param stanza: the index (counting from 0) of the stanza within
+            ``source`` when parsing stanzas, or `None` when parsing a single
+            header section
+        :type stanza: int or None
+        """
+        return None
+
+    def on_field(self, ctx: Any, name: str, value: str, elapsed: float) -> None:
+        """
+        Called after each header field has been processed (converted,
+        validated, and stored), with the field's name and unprocessed value as
+        scanned from the input and the time spent processing it.  This is not
+        called for the message body or for a field whose processing raised an
+        exception.
+        """
+
+    def on_parse_end(
+        self,
+        ctx: Any,
+        result: NormalizedDict,
+        fields: int,
+        chars: int,
+        elapsed: float,
+    ) -> None:
+        """
+        Called when parsing completes successfully with the parsed result, the
+        number of header fields in the input, the total number of characters
+        in the unprocessed field values and body, and the time spent on the
+        whole parse (including scanning the input)
+        """
+
+    def on_error(self, ctx: Any, exc: Exception, elapsed: float) -> None:
+        """
+        Called instead of `on_parse_end()` when parsing fails with the
+        exception that was raised and the time spent before it was raised.  The
+        exception is re-raised after all hooks have been called.
+        """
@@ -123,3 +123,144 @@ class NormalizedDict(MutableMapping):
         dup.normalizer = self.normalizer
         dup.body = self.body
         return dup
+
+
+class DeferredPlaceholder:
+    """Stands in for values not yet computed in a `LazyNormalizedDict` repr"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<deferred>"
+
+
+DEFERRED = DeferredPlaceholder()
+
+
+class LazyNormalizedDict(NormalizedDict):
+    """
+    .. versionadded:: 0.6.0
+
+    A `NormalizedDict` in which some values are computed only when first
+    accessed, as returned by the ``parse*()`` methods of a `HeaderParser`
+    constructed with ``lazy=True``.  A deferred value is computed by calling
+    a function with no arguments; the result replaces the function, so each
+    value is normally computed only once.  If the function raises an
+    exception, the exception propagates out of the access that triggered it,
+    and the value remains deferred.
+
+    As with `NormalizedDict`, an instance may be read from multiple threads
+    at once.  If several threads read the same deferred value for the first
+    time simultaneously, the function may be called more than once, so it
+    must be safe to repeat (as the functions supplied by `HeaderParser` are
+    when the fields' ``type`` callables are pure).
+
+    Iterating over the keys, testing for membership, and taking the length do
+    not compute any values, but anything that needs the values (including
+    `~collections.abc.Mapping.values()`, `~collections.abc.Mapping.items()`,
+    comparisons, and `normalized_dict()`) computes all of them.  `repr()`
+    shows values that have yet to be computed as ``<deferred>`` without
+    computing them.
+    """
+
+    def __init__(
+        self,
+        data: None | Mapping | Iterable[tuple[Any, Any]] = None,
+        normalizer: Callable[[Any], Any] | None = None,
+        body: str | None = None,
+    ) -> None:
+        #: A mapping from normalized keys to the functions that compute their
+        #: values
+        self._deferred: dict[Any, Callable[[], Any]] = {}
+        super().__init__(data, normalizer=normalizer, body=body)
+
+    def __getitem__(self, key: Any) -> Any:
+        nkey = self.normalizer(key)
+        if nkey in self._deferred:
+            return self._resolve(nkey)
+        return self._data[nkey][1]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        nkey = self.normalizer(key)
+        self._deferred.pop(nkey, None)
+        self._data[nkey] = (key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        nkey = self.normalizer(key)
+        del self._data[nkey]
+        self._deferred.pop(nkey, None)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.normalizer(key) in self._data
+
+    def __repr__(self) -> str:
+        shown = {
+            key: DEFERRED if nkey in self._deferred else value
+            for nkey, (key, value) in list(self._data.items())
+        }
+        return (
+            "{0.__module__}.{0.__name__}"
+            "({2!r}, normalizer={1.normalizer!r}, body={1.body!r})".format(
+                type(self), self, shown
+            )
+        )
+
+    def defer(self, key: Any, func: Callable[[], Any]) -> None:
+        """
+        Set ``key`` to a value that will be computed by calling ``func`` when
+        it is first accessed
+        """
+        nkey = self.normalizer(key)
+        self._data[nkey] = (key, None)
+        self._deferred[nkey] = func
+
+    def deferred(self, key: Any) -> Callable[[], Any] | None:
+        """
+        Return the function that will compute the value for ``key``, or `None`
+        if the value is not deferred (or ``key`` is not present)
+        """
+        return self._deferred.get(self.normalizer(key))
+
+    def is_deferred(self, key: Any) -> bool:
+        """Return whether the value for ``key`` has yet to be computed"""
+        return self.normalizer(key) in self._deferred
+
+    def _resolve(self, nkey: Any) -> Any:
+        func = self._deferred.get(nkey)
+        if func is None:
+            # Another thread got here first.
+            return self._data[nkey][1]
+        value = func()
+        # Store the value before removing the function so that concurrent
+        # readers always find one or the other:
+        self._data[nkey] = (self._data[nkey][0], value)
+        self._deferred.pop(nkey, None)
+        return value
+
+    def validate(self) -> None:
+        """
+        Compute all deferred values now, in the order in which they were
+        deferred, raising the first exception encountered
+        """
+        for nkey in list(self._deferred):
+            self._resolve(nkey)
+
+    def materialize(self) -> NormalizedDict:
+        """
+        Compute all deferred values as with `validate()` and return the
+        contents as a plain `NormalizedDict`
+        """
+        self.validate()
+        return NormalizedDict(
+            self._data.values(), normalizer=self.normalizer, body=self.body
+        )
+
+    def normalized_dict(self) -> dict:
+        self.validate()
+        return super().normalized_dict()
+
+    def copy(self) -> LazyNormalizedDict:
+        dup = super().copy()
+        assert isinstance(dup, LazyNormalizedDict)
+        dup._deferred = self._deferred.copy()
+        return dup
@@ -1,11 +1,22 @@
 from __future__ import annotations
 from collections.abc import Callable, Iterable, Iterator
-from typing import Any
-from deprecated import deprecated
+from functools import partial
+import os
+from time import perf_counter
+from typing import IO, TYPE_CHECKING, Any, TypeVar
 from . import errors, scanner
-from .normdict import NormalizedDict
+from .hooks import ParseHook
+from .normdict import LazyNormalizedDict, NormalizedDict
 from .scanner import Scanner, scan_stanzas
-from .types import lower, unfold
+from .stats import ParseStats
+from .types import CachedConverter, lower, memoize, unfold
+from .util import InternPool, deprecated
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+    from .report import ValidationReport
+
+PathT = TypeVar("PathT", bound="str | os.PathLike[str]")
 
 
 class HeaderParser:
@@ -27,13 +38,68 @@ class HeaderParser:
         the header section; `True` means a body is required, `False` means a
         body is prohibited, and `None` (the default) means a body is optional
 
-    :param kwargs: Passed to the `Scanner` constructor
+    :param int intern_pool_size: the maximum number of distinct values to
+        keep in the pool shared by all fields defined with ``intern=True``
+
+    :param bool lazy: If `True` (default `False`), the `!parse_*()` methods
+        return `LazyNormalizedDict` instances in which ``unfold``, ``type``,
+        and ``choices`` are only applied to a field's value when it is first
+        read.  Errors from those steps (`FieldTypeError` and
+        `InvalidChoiceError`) are then raised when the value is read or when
+        `LazyNormalizedDict.validate()` or
+        `~LazyNormalizedDict.materialize()` is called.  All other checks (for
+        unknown, missing, and duplicate fields and for the body) are still
+        performed during parsing, and fields with an ``action`` are always
+        processed immediately.  Deferred processing is not timed by
+        `enable_stats()`.
+
+    :param kwargs: Passed to the `Scanner` constructor.  In particular,
+        passing ``intern_names=True`` causes every occurrence of a given field
+        name in the input to share a single string object.
+
+    .. versionchanged:: 0.6.0
+        ``intern_pool_size`` and ``lazy`` arguments added
+
+    Once all fields have been defined, a single `HeaderParser` may be shared by
+    any number of threads.  The `!parse_*()` methods keep their per-call state
+    in a new `Scanner` and result dictionary for each call and never modify
+    the field definitions, so no locking is needed.  Parsing does update a few
+    pieces of shared state, each of which is safe to update concurrently,
+    including under free-threaded Python:
+
+    - the pool of values for fields with ``intern=True``, which is only ever
+      updated with single `dict` operations (``setdefault()``), so that
+      concurrent callers still get the same canonical string, though the pool
+      may end up a few entries over ``intern_pool_size``;
+
+    - the caches of fields with ``cache`` set and of `CachedConverter`
+      instances, which use `functools.lru_cache` and so are internally
+      locked, though a ``type`` may be called more than once for the same
+      value if several threads miss the cache at once; and
+
+    - the `ParseStats` instance set up by `enable_stats()`, which takes a lock
+      on every update.
+
+    Hooks registered with `add_hook()` are called from whichever thread is
+    parsing and must do their own locking if needed.  `add_field()`,
+    `add_additional()`, `add_hook()`, `remove_hook()`, `enable_stats()`, and
+    `disable_stats()` must not be called while another thread is parsing.
+
+    The `NormalizedDict` instances returned by the parser are ordinary
+    mappings without any locking; they may be read from multiple threads but
+    not modified concurrently.  This includes the `LazyNormalizedDict`
+    instances returned when ``lazy`` is true, although a field's ``type`` may
+    then be called more than once for the same value if several threads read
+    the field for the first time at once.
     """
 
     def __init__(
         self,
         normalizer: Callable[[str], Any] | None = None,
         body: bool | None = None,
+        *,
+        intern_pool_size: int = 4096,
+        lazy: bool = False,
         **kwargs: Any,
     ) -> None:
         #: The ``normalizer`` argument passed to the constructor, or `lower` if
@@ -41,8 +107,12 @@ class HeaderParser:
         self._normalizer = normalizer if normalizer is not None else lower
         #: The ``body`` argument passed to the constructor
         self._body = body
+        #: Whether to defer processing of field values until they are read
+        self._lazy = lazy
         #: Scanner options
         self._scan_opts = kwargs
+        #: The pool of interned values for fields with ``intern=True``
+        self._intern_pool = InternPool(intern_pool_size)
         #: A mapping from normalized field names to `NamedField` instances
         self._fielddefs: dict[Any, NamedField] = {}
         #: The set of all normalized ``dest`` values for all named fields
@@ -54,6 +124,11 @@ class HeaderParser:
         #: Whether any fields with custom ``dest`` values have been defined,
         #: thereby precluding `add_additional()`
         self._custom_dests: bool = False
+        #: If statistics are enabled, this is the `ParseStats` instance to
+        #: which they are added; otherwise, it is `None`.
+        self._stats: ParseStats | None = None
+        #: The `ParseHook` instances registered with `add_hook()`
+        self._hooks: tuple[ParseHook, ...] = ()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, HeaderParser):
@@ -72,6 +147,9 @@ class HeaderParser:
         .. versionchanged:: 0.2.0
             ``action`` argument added
 
+        .. versionchanged:: 0.6.0
+            ``intern``, ``cache``, and ``slow`` arguments added
+
         :param string name: the primary name for the field, used in error
             messages and as the default value of ``dest``
 
@@ -108,11 +186,19 @@ class HeaderParser:
         :param callable type: a callable to apply to the field value before
             storing it in the result dictionary
 
+        :param int cache: If set, ``type`` is wrapped with `memoize()` so that
+            up to this many of its most recently used results are cached and
+            reused for repeated values of the field.  Only use this if
+            ``type`` is pure and its results are not mutated.  Cache
+            statistics can be retrieved with `cache_info()`.
+
         :param iterable choices: A sequence of values which the field is
             allowed to have.  If ``choices`` is defined, all occurrences of the
             field in the input must have one of the given values (after
             applying ``type``) or else an
-            `~headerparser.errors.InvalidChoiceError` is raised.
+            `~headerparser.errors.InvalidChoiceError` is raised.  Hashable
+            choices are checked in constant time, so large sets of choices
+            (such as those returned by `load_choices()`) are fine.
 
         :param callable action: A callable to invoke whenever the field is
             encountered in the input.  The callable will be passed the current
@@ -123,10 +209,26 @@ class HeaderParser:
             callable must explicitly store the values if desired.  When
             ``action`` is defined for a field, ``dest`` cannot be.
 
+        :param bool intern: If `True` (default `False`), string values of the
+            field (after applying ``type``) are deduplicated through a pool
+            shared by all such fields, so that every occurrence of a common
+            value shares a single string object.  This is intended for fields
+            with a small set of recurring values, such as ``Architecture`` or
+            ``Priority`` in a Debian package index.  The pool's size is set by
+            the parser's ``intern_pool_size`` argument; once it is full, new
+            values are stored as-is.
+
+        :param bool slow: If `True` (default `False`), ``type`` is assumed to
+            be slow (e.g., because it performs I/O), and
+            `parse_stanza_batches()` will call it on many values at once in a
+            thread pool.  ``type`` must then be thread-safe.  ``action`` is
+            always called serially.
+
         :return: `None`
         :raises ValueError:
             - if another field with the same name or ``dest`` was already
               defined
+            - if ``cache`` is set but ``type`` is not
             - if ``dest`` is not one of the field's names and `add_additional`
               is enabled
             - if ``default`` is defined and ``required`` is true
@@ -139,8 +241,7 @@ class HeaderParser:
         if "action" in kwargs and "dest" in kwargs:
             raise ValueError("`action` and `dest` are mutually exclusive")
         kwargs.setdefault("dest", name)
-        if "type" in kwargs:
-            kwargs["type_"] = kwargs.pop("type")
+        self._convert_field_opts(kwargs)
         hd = NamedField(name=name, **kwargs)
         normed: set = set(map(self._normalizer, (name,) + altnames))
         # Error before modifying anything:
@@ -157,6 +258,115 @@ class HeaderParser:
             self._fielddefs[n] = hd
         self._dests.add(self._normalizer(hd.dest))
 
+    def _convert_field_opts(self, kwargs: dict[str, Any]) -> None:
+        """
+        Convert the public options of `add_field` and `add_additional` into
+        `FieldDef` constructor arguments in place
+        """
+        if "type" in kwargs:
+            kwargs["type_"] = kwargs.pop("type")
+        cache = kwargs.pop("cache", None)
+        if cache is not None:
+            if kwargs.get("type_") is None:
+                raise ValueError("`cache` requires `type`")
+            kwargs["type_"] = memoize(kwargs["type_"], cache)
+        if "intern" in kwargs:
+            kwargs["intern"] = self._intern_pool if kwargs["intern"] else None
+
+    def cache_info(self) -> dict[str | None, Any]:
+        """
+        .. versionadded:: 0.6.0
+
+        Return the cache statistics for each field whose ``type`` is a
+        `CachedConverter` (i.e., was wrapped with `memoize()` or defined with
+        ``cache``) as a `dict` mapping field names (as passed to `add_field`)
+        to the named tuples returned by `CachedConverter.cache_info()`.  The
+        statistics for additional fields, if applicable, are stored under
+        `None`.
+
+        :rtype: dict
+        """
+        info: dict[str | None, Any] = {}
+        for hd in self._fielddefs.values():
+            if isinstance(hd.type_, CachedConverter):
+                info[hd.name] = hd.type_.cache_info()
+        if self._additional is not None and isinstance(
+            self._additional.type_, CachedConverter
+        ):
+            info[None] = self._additional.type_.cache_info()
+        return info
+
+    def enable_stats(self) -> ParseStats:
+        """
+        .. versionadded:: 0.6.0
+
+        Start accumulating the time spent in each phase of parsing (scanning,
+        name normalization, and the ``unfold``, ``type``, ``choices``, and
+        ``action`` options) in a `ParseStats` instance, both in total and for
+        each field, and return that instance.  The same instance is also
+        available as `stats`.  If statistics are already enabled, the existing
+        instance is returned.
+
+        When statistics are disabled (the default), none of this bookkeeping
+        is performed.
+
+        If the parser was constructed with ``lazy=True``, the ``unfold``,
+        ``type``, and ``choices`` phases of fields whose processing is
+        deferred happen after parsing has finished and are not recorded.
+
+        :rtype: ParseStats
+        """
+        if self._stats is None:
+            self._stats = ParseStats()
+        return self._stats
+
+    def disable_stats(self) -> None:
+        """
+        .. versionadded:: 0.6.0
+
+        Stop accumulating statistics.  The `ParseStats` instance previously
+        returned by `enable_stats()` retains the statistics accumulated so far.
+        """
+        self._stats = None
+
+    @property
+    def stats(self) -> ParseStats | None:
+        """
+        .. versionadded:: 0.6.0
+
+        The `ParseStats` instance to which statistics are being added, or
+        `None` if statistics are not enabled
+        """
+        return self._stats
+
+    def add_hook(self, hook: ParseHook) -> None:
+        """
+        .. versionadded:: 0.6.0
+
+        Register a `ParseHook` to be notified of the start and end of each
+        parse, each field processed, and any errors.  When no hooks are
+        registered and statistics are disabled, parsing does not perform any
+        of the associated bookkeeping.
+
+        :param ParseHook hook: the hook to register
+        :return: `None`
+        """
+        self._hooks = self._hooks + (hook,)
+
+    def remove_hook(self, hook: ParseHook) -> None:
+        """
+        .. versionadded:: 0.6.0
+
+        Unregister a hook previously registered with `add_hook()`
+
+        :param ParseHook hook: the hook to unregister
+        :return: `None`
+        :raises ValueError: if ``hook`` is not registered
+        """
+        hooks = list(self._hooks)
+        hooks.remove(hook)
+        self._hooks = tuple(hooks)
+
     def add_additional(self, enable: bool = True, **kwargs: Any) -> None:
         """
         Specify how the parser should handle fields in the input that were not
@@ -180,6 +390,9 @@ class HeaderParser:
         .. versionchanged:: 0.2.0
             ``action`` argument added
 
+        .. versionchanged:: 0.6.0
+            ``intern``, ``cache``, and ``slow`` arguments added
+
         :param bool enable: whether the parser should accept input fields that
             were not registered with `add_field`; setting this to `False`
             disables additional fields and restores the parser's default
@@ -199,6 +412,10 @@ class HeaderParser:
         :param callable type: a callable to apply to additional field values
             before storing them in the result dictionary
 
+        :param int cache: If set, ``type`` is wrapped with `memoize()` as for
+            the ``cache`` argument to `add_field`.  All additional fields share
+            a single cache.
+
         :param iterable choices: A sequence of values which additional fields
             are allowed to have.  If ``choices`` is defined, all additional
             field values in the input must have one of the given values (after
@@ -213,17 +430,25 @@ class HeaderParser:
             of storing the field's values in the result dictionary, and so the
             callable must explicitly store the values if desired.
 
+        :param bool intern: If `True` (default `False`), string values of
+            additional fields are deduplicated through the parser's intern
+            pool as for the ``intern`` argument to `add_field`
+
+        :param bool slow: If `True` (default `False`), `parse_stanza_batches()`
+            will apply ``type`` to additional field values in a thread pool as
+            for the ``slow`` argument to `add_field`
+
         :return: `None`
         :raises ValueError:
             - if ``enable`` is true and a previous call to `add_field` used a
               custom ``dest``
+            - if ``cache`` is set but ``type`` is not
             - if ``choices`` is an empty sequence
         """
         if enable:
             if self._custom_dests:
                 raise ValueError("add_additional and `dest` are mutually exclusive")
-            if "type" in kwargs:
-                kwargs["type_"] = kwargs.pop("type")
+            self._convert_field_opts(kwargs)
             self._additional = FieldDef(**kwargs)
         else:
             self._additional = None
@@ -242,7 +467,87 @@ class HeaderParser:
             definitions declared with `add_field` and `add_additional`
         :raises ValueError: if the input contains more than one body pair
         """
-        data: NormalizedDict = NormalizedDict(normalizer=self._normalizer)
+        return self._parse_stream_from(fields, None, None)
+
+    def _parse_stream_from(
+        self,
+        fields: Iterable[tuple[str | None, str]],
+        source: Any,
+        stanza: int | None,
+    ) -> NormalizedDict:
+        """
+        Like `parse_stream()`, but with the input identifier and stanza index
+        to pass to hooks
+        """
+        if self._stats is None and not self._hooks:
+            return self._parse_stream(fields, None)
+        else:
+            return self._parse_stream_instrumented(fields, source, stanza)
+
+    def _parse_stream_instrumented(
+        self,
+        fields: Iterable[tuple[str | None, str]],
+        source: Any,
+        stanza: int | None,
+    ) -> NormalizedDict:
+        shared_stats = self._stats
+        # Accumulate statistics locally so that other threads don't have to
+        # wait on the shared instance's lock for every field:
+        stats = ParseStats() if shared_stats is not None else None
+        hooks = self._hooks
+        if not hooks:
+            try:
+                return self._parse_stream(fields, stats)
+            finally:
+                if shared_stats is not None:
+                    assert stats is not None
+                    shared_stats.merge(stats)
+        ctxs = [h.on_parse_start(source, stanza) for h in hooks]
+        sizes = [0, 0]  # number of fields, number of characters
+
+        def observe(
+            fields: Iterable[tuple[str | None, str]],
+        ) -> Iterator[tuple[str | None, str]]:
+            for k, v in fields:
+                sizes[1] += len(v)
+                if k is None:
+                    yield (k, v)
+                    continue
+                sizes[0] += 1
+                t0 = perf_counter()
+                yield (k, v)
+                # `_parse_stream()` only asks for the next field once it's
+                # finished processing this one:
+                elapsed = perf_counter() - t0
+                for h, c in zip(hooks, ctxs):
+                    h.on_field(c, k, v, elapsed)
+
+        start = perf_counter()
+        try:
+            data = self._parse_stream(observe(fields), stats)
+        except Exception as e:
+            elapsed = perf_counter() - start
+            for h, c in zip(hooks, ctxs):
+                h.on_error(c, e, elapsed)
+            raise
+        finally:
+            if shared_stats is not None:
+                assert stats is not None
+                shared_stats.merge(stats)
+        elapsed = perf_counter() - start
+        for h, c in zip(hooks, ctxs):
+            h.on_parse_end(c, data, sizes[0], sizes[1], elapsed)
+        return data
+
+    def _parse_stream(
+        self, fields: Iterable[tuple[str | None, str]], stats: ParseStats | None
+    ) -> NormalizedDict:
+        data: NormalizedDict
+        lazy_data: LazyNormalizedDict | None = None
+        if self._lazy:
+            data = lazy_data = LazyNormalizedDict(normalizer=self._normalizer)
+        else:
+            data = NormalizedDict(normalizer=self._normalizer)
         fields_seen: set[str] = set()
         body_seen = False
         for k, v in fields:
@@ -255,8 +560,13 @@ class HeaderParser:
                 body_seen = True
             else:
                 hd: FieldDef
+                if stats is None:
+                    key = self._normalizer(k)
+                else:
+                    with stats.timer("normalize"):
+                        key = self._normalizer(k)
                 try:
-                    hd = self._fielddefs[self._normalizer(k)]
+                    hd = self._fielddefs[key]
                 except KeyError:
                     if self._additional is not None:
                         hd = self._additional
@@ -264,7 +574,10 @@ class HeaderParser:
                         raise errors.UnknownFieldError(k)
                 else:
                     fields_seen.add(hd.name)
-                hd.process(data, k, v)
+                if lazy_data is not None:
+                    hd.defer(lazy_data, k, v)
+                else:
+                    hd.process(data, k, v, stats)
         for hd in self._fielddefs.values():
             if hd.name not in fields_seen:
                 if hd.required:
@@ -296,7 +609,148 @@ class HeaderParser:
             definitions declared with `add_field` and `add_additional`
         :raises ScannerError: if the header section is malformed
         """
-        return self.parse_stream(scanner.scan(data, **self._scan_opts))
+        return self._parse(data, data)
+
+    def _parse(self, data: str | Iterable[str], source: Any) -> NormalizedDict:
+        """
+        Like `parse()`, but with the input identifier to pass to hooks
+        """
+        if self._stats is None:
+            fields = scanner.scan(data, **self._scan_opts)
+        else:
+            fields = self._scanner(data).scan()
+        return self._parse_stream_from(fields, source, None)
+
+    def parse_files(
+        self,
+        paths: Iterable[PathT],
+        *,
+        workers: int | None = None,
+        executor: str = "thread",
+        ordered: bool = True,
+        chunksize: int = 16,
+        encoding: str = "utf-8",
+    ) -> Iterator[tuple[PathT, NormalizedDict | Exception]]:
+        """
+        .. versionadded:: 0.6.0
+
+        Parse each of the given files with `parse()` in a pool of worker
+        threads or processes and return a generator of ``(path, result)``
+        pairs, where ``result`` is either the `NormalizedDict` parsed from
+        ``path`` or the exception raised while opening or parsing it.
+
+        Paths are sent to the workers in batches of ``chunksize`` paths at a
+        time in order to reduce per-file overhead.  When using processes, the
+        parser is pickled and sent to each worker process only once; the
+        parser's ``normalizer``, ``type``, and ``action`` callables must
+        therefore be picklable.
+
+        :param paths: an iterable of paths to files to parse
+        :param workers: the maximum number of worker threads or processes;
+            defaults to the executor's own default
+        :type workers: int or None
+        :param str executor: ``"thread"`` (the default) to parse in a
+            `~concurrent.futures.ThreadPoolExecutor` or ``"process"`` to parse
+            in a `~concurrent.futures.ProcessPoolExecutor`
+        :param bool ordered: If `True` (the default), results are yielded in
+            the same order as ``paths``.  If `False`, results are yielded as
+            soon as each batch is completed.
+        :param int chunksize: the number of paths to send to a worker at once
+        :param str encoding: the encoding with which to open the files
+        :rtype: generator of pairs of a path and a `NormalizedDict` or
+            exception
+        :raises ValueError: if ``workers``, ``executor``, or ``chunksize`` is
+            invalid
+        """
+        from . import bulk
+
+        return bulk.parse_all(
+            self,
+            paths,
+            partial(bulk.parse_file, encoding=encoding),
+            workers=workers,
+            executor=executor,
+            ordered=ordered,
+            chunksize=chunksize,
+        )
+
+    def parse_archive(
+        self,
+        path: str | os.PathLike[str] | IO[bytes],
+        member: str = "*.dist-info/METADATA",
+        *,
+        encoding: str = "utf-8",
+    ) -> NormalizedDict:
+        """
+        .. versionadded:: 0.6.0
+
+        Parse a file contained in a zip archive (such as the
+        :file:`*.dist-info/METADATA` file in a wheel) with `parse()`.  The
+        member to parse is found by matching the glob pattern ``member``
+        against the names in the archive's central directory, so none of the
+        other members are read, and the member is parsed directly from the
+        decompression stream without being extracted.
+
+        If more than one member matches ``member``, the one with the fewest
+        directory components is used.  Note that ``*`` in ``member`` also
+        matches ``/``.
+
+        :param path: the path to a zip archive or a binary file-like object
+            containing one
+        :param str member: a glob pattern matching the name of the archive
+            member to parse; defaults to the metadata file of a wheel
+        :param str encoding: the encoding of the archive member
+        :rtype: NormalizedDict
+        :raises KeyError: if no member of the archive matches ``member``
+        :raises zipfile.BadZipFile: if ``path`` is not a zip archive
+        :raises ParserError: if the input fields do not conform to the field
+            definitions declared with `add_field` and `add_additional`
+        :raises ScannerError: if the header section is malformed
+        """
+        from . import bulk
+
+        return bulk.parse_archive(self, path, member, encoding)
+
+    def parse_archives(
+        self,
+        paths: Iterable[PathT],
+        member: str = "*.dist-info/METADATA",
+        *,
+        workers: int | None = None,
+        executor: str = "thread",
+        ordered: bool = True,
+        chunksize: int = 16,
+        encoding: str = "utf-8",
+    ) -> Iterator[tuple[PathT, NormalizedDict | Exception]]:
+        """
+        .. versionadded:: 0.6.0
+
+        Parse a member of each of the given zip archives with
+        `parse_archive()` in a pool of worker threads or processes and return
+        a generator of ``(path, result)`` pairs, where ``result`` is either the
+        `NormalizedDict` parsed from the archive at ``path`` or the exception
+        raised while opening or parsing it.  See `parse_files()` for the
+        meanings of the worker pool options.
+
+        :param paths: an iterable of paths to zip archives
+        :param str member: a glob pattern matching the name of the archive
+            member to parse; defaults to the metadata file of a wheel
+        :rtype: generator of pairs of a path and a `NormalizedDict` or
+            exception
+        :raises ValueError: if ``workers``, ``executor``, or ``chunksize`` is
+            invalid
+        """
+        from . import bulk
+
+        return bulk.parse_all(
+            self,
+            paths,
+            partial(bulk.parse_archive, member=member, encoding=encoding),
+            workers=workers,
+            executor=executor,
+            ordered=ordered,
+            chunksize=chunksize,
+        )
 
     @deprecated(version="0.5.0", reason="use parse() instead")
     def parse_string(self, s: str) -> NormalizedDict:
@@ -338,7 +792,305 @@ class HeaderParser:
             definitions declared with `add_field` and `add_additional`
         :raises ScannerError: if a header section is malformed
         """
-        return self.parse_stanzas_stream(scan_stanzas(data, **self._scan_opts))
+        if self._stats is None:
+            stanzas = scan_stanzas(data, **self._scan_opts)
+        else:
+            stanzas = self._scanner(data).scan_stanzas()
+        return self._parse_stanzas(stanzas, data)
+
+    def _parse_stanzas(
+        self, stanzas: Iterable[Iterable[tuple[str, str]]], source: Any
+    ) -> Iterator[NormalizedDict]:
+        for i, stanza in enumerate(stanzas):
+            yield self._parse_stream_from(stanza, source, i)
+
+    def parse_stanzas_into(
+        self,
+        data: str | Iterable[str],
+        on_stanza: Callable[[NormalizedDict], Any],
+    ) -> int:
+        """
+        .. versionadded:: 0.6.0
+
+        Like `parse_stanzas()`, but instead of returning a generator, call
+        ``on_stanza(dict)`` with the dictionary of header fields for each
+        stanza as soon as it has been parsed.  Scanning and parsing are done in
+        a single loop without any generators, which is faster when the
+        stanzas are small.
+
+        :param data: a string, text-file-like object, or iterable of lines to
+            parse
+        :param on_stanza: a callable taking a `NormalizedDict`
+        :return: the number of stanzas parsed
+        :rtype: int
+        :raises ParserError: if the input fields do not conform to the field
+            definitions declared with `add_field` and `add_additional`
+        :raises ScannerError: if a header section is malformed
+        """
+        sc = self._scanner(data)
+        instrumented = self._stats is not None or bool(self._hooks)
+        count = 0
+        sc._begin_stanzas()
+        while True:
+            fields = sc._next_stanza()
+            if fields is None:
+                break
+            if instrumented:
+                on_stanza(self._parse_stream_instrumented(fields, data, count))
+            else:
+                on_stanza(self._parse_stream(fields, None))
+            count += 1
+        sc._end_stanzas()
+        return count
+
+    def parse_stanza_batches(
+        self,
+        data: str | Iterable[str],
+        batch_size: int,
+        *,
+        workers: int | None = None,
+    ) -> Iterator[list[NormalizedDict]]:
+        """
+        .. versionadded:: 0.6.0
+
+        Like `parse_stanzas()`, but the dictionaries are yielded in lists of
+        ``batch_size`` dictionaries each (except for the last list, which may
+        be shorter).  The input is scanned with
+        `Scanner.scan_stanza_batches()`, and each batch is parsed in a single
+        loop, which amortizes the overhead of the generators over many stanzas
+        and makes it easy to hand whole batches to executors or bulk sinks.
+
+        If a stanza fails to parse, the error is raised when its batch is
+        requested, and none of the other stanzas in that batch are returned.
+
+        The values of fields defined with ``slow=True`` are
+        unfolded and converted by their ``type`` concurrently in a
+        `~concurrent.futures.ThreadPoolExecutor`, with all of the values in a
+        batch submitted at once.  The dictionaries are still assembled (and
+        ``choices`` and ``action`` still applied) one field at a time in input
+        order, and a conversion error is raised for the first stanza in which
+        it occurs, just as when parsing serially.  This does not apply while
+        stats are enabled or hooks are registered.
+
+        To convert numeric fields of many stanzas into arrays, use
+        `scan_columns()` with ``typecodes`` instead.
+
+        :param data: a string, text-file-like object, or iterable of lines to
+            parse
+        :param int batch_size: the number of dictionaries in each list
+        :param workers: the maximum number of threads with which to convert
+            the values of ``slow`` fields; defaults to the
+            `~concurrent.futures.ThreadPoolExecutor` default
+        :type workers: int or None
+        :rtype: generator of lists of `NormalizedDict`
+        :raises ValueError: if ``batch_size`` is less than 1
+        :raises ParserError: if the input fields do not conform to the field
+            definitions declared with `add_field` and `add_additional`
+        :raises ScannerError: if a header section is malformed
+        """
+        return self._parse_batches(
+            self._scanner(data).scan_stanza_batches(batch_size), workers, data
+        )
+
+    def _parse_batches(
+        self,
+        batches: Iterable[list[list[tuple[str, str]]]],
+        workers: int | None,
+        source: Any,
+    ) -> Iterator[list[NormalizedDict]]:
+        executor: Executor | None = None
+        #: The index of the first stanza in the current batch
+        start = 0
+        try:
+            for batch in batches:
+                if self._stats is None and not self._hooks:
+                    if self._has_slow_fields():
+                        if executor is None:
+                            from concurrent.futures import ThreadPoolExecutor
+
+                            executor = ThreadPoolExecutor(workers)
+                        self._preconvert(batch, executor)
+                    parse = self._parse_stream
+                    yield [parse(stanza, None) for stanza in batch]
+                else:
+                    parse_from = self._parse_stream_from
+                    yield [
+                        parse_from(stanza, source, start + i)
+                        for i, stanza in enumerate(batch)
+                    ]
+                start += len(batch)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def _has_slow_fields(self) -> bool:
+        fielddefs: list[FieldDef] = list(self._fielddefs.values())
+        if self._additional is not None:
+            fielddefs.append(self._additional)
+        return any(hd.slow for hd in fielddefs)
+
+    def _preconvert(self, batch: list[list[Any]], executor: Executor) -> None:
+        """
+        Convert the values of all ``slow`` fields in ``batch`` in
+        ``executor``, replacing the raw values in the stanzas with `Converted`
+        wrappers
+        """
+        #: A mapping from raw field names to the pending conversions for their
+        #: definitions, or to `None` if their values are not ``slow``
+        by_name: dict[str | None, PendingConversion | None] = {}
+        #: A mapping from the IDs of field definitions to their pending
+        #: conversions
+        by_def: dict[int, PendingConversion] = {}
+        for stanza in batch:
+            for i, (k, v) in enumerate(stanza):
+                try:
+                    pending = by_name[k]
+                except KeyError:
+                    pending = by_name[k] = None
+                    if k is not None:
+                        hd = self._fielddefs.get(self._normalizer(k), self._additional)
+                        if hd is not None and hd.slow:
+                            pending = by_name[k] = by_def.setdefault(
+                                id(hd), PendingConversion(hd)
+                            )
+                if pending is not None:
+                    pending.spots.append((stanza, i))
+                    pending.values.append(v)
+        for pending in by_def.values():
+            pending.start(executor)
+        for pending in by_def.values():
+            pending.finish()
+
+    def _scanner(self, data: str | Iterable[str]) -> Scanner:
+        return Scanner(data, stats=self._stats, **self._scan_opts)
+
+    def validate(self, data: str | Iterable[str]) -> list[errors.ParserError]:
+        """
+        .. versionadded:: 0.6.0
+
+        Check whether an RFC 822-style header section (possibly followed by a
+        message body) conforms to the parser's field definitions without
+        building a dictionary, and return a list of all of the problems found
+        as `ParserError` instances, in the order in which they were found.  An
+        empty list means that `parse()` would succeed on the same input;
+        otherwise, the first problem in the list is the one that `parse()`
+        would raise.
+
+        All of the checks performed by `parse()` are performed, including
+        applying ``unfold`` and ``type`` in order to check ``choices``, but
+        the values are not stored, and ``action`` callables are not called.
+        Unlike `parse()`, checking continues past the first problem, so (for
+        example) every unknown field is reported, not just the first.
+
+        :param data: a string, text-file-like object, or iterable of lines to
+            validate
+        :rtype: list of `ParserError`
+        :raises ScannerError: if the header section is malformed
+        """
+        return self._validate_stream(scanner.scan(data, **self._scan_opts))
+
+    def validate_stanzas(
+        self, data: str | Iterable[str]
+    ) -> Iterator[list[errors.ParserError]]:
+        """
+        .. versionadded:: 0.6.0
+
+        Check each of zero or more stanzas of RFC 822-style header fields as
+        with `validate()`, and return a generator that yields a list of the
+        problems found in each stanza (an empty list for each valid stanza).
+
+        :param data: a string, text-file-like object, or iterable of lines to
+            validate
+        :rtype: generator of lists of `ParserError`
+        :raises ScannerError: if a header section is malformed
+        """
+        for stanza in self._scanner(data).scan_stanzas():
+            yield self._validate_stream(stanza)
+
+    def audit_stanzas(
+        self, data: str | Iterable[str], *, max_problems: int | None = None
+    ) -> ValidationReport:
+        """
+        .. versionadded:: 0.6.0
+
+        Check all of the stanzas in ``data`` as with `validate_stanzas()`,
+        collecting every problem found into a `ValidationReport` along with
+        the index and line number of its stanza.  Unlike
+        `validate_stanzas()`, malformed stanzas do not stop the scan: each
+        `ScannerError` is recorded, the rest of the offending stanza (up
+        through the next blank line) is skipped, and checking resumes with the
+        next stanza.  Each stanza is scanned and checked in a single pass, and
+        no dictionaries are built.
+
+        :param data: a string, text-file-like object, or iterable of lines to
+            check
+        :param max_problems: the maximum number of individual problems to
+            keep in the report's `~ValidationReport.problems` list; the counts
+            always cover all problems
+        :type max_problems: int or None
+        :rtype: ValidationReport
+        """
+        from .report import ValidationReport
+
+        report = ValidationReport(max_problems)
+        sc = self._scanner(data)
+
+        def on_error(e: errors.ScannerError, lineno: int) -> None:
+            # The skipped stanza has already been counted:
+            report.add(sc.counters.stanzas - 1, lineno, [e])
+
+        for fields in sc.scan_stanzas(on_error=on_error):
+            report.add(
+                sc.counters.stanzas - 1, sc.stanza_lineno, self._validate_stream(fields)
+            )
+        return report
+
+    def _validate_stream(
+        self, fields: Iterable[tuple[str | None, str]]
+    ) -> list[errors.ParserError]:
+        problems: list[errors.ParserError] = []
+        #: The `id()`s of the named fields seen so far
+        named_seen: set[int] = set()
+        #: The normalized names of the additional fields seen so far
+        additional_seen: set = set()
+        body_seen = False
+        for k, v in fields:
+            if k is None:
+                if body_seen:
+                    raise ValueError("Body appears twice in input")
+                if self._body is not None and not self._body:
+                    problems.append(errors.BodyNotAllowedError())
+                body_seen = True
+                continue
+            key = self._normalizer(k)
+            hd: FieldDef
+            try:
+                hd = self._fielddefs[key]
+            except KeyError:
+                if self._additional is None:
+                    problems.append(errors.UnknownFieldError(k))
+                    continue
+                hd = self._additional
+                name, seen, marker = k, additional_seen, key
+            else:
+                name, seen, marker = hd.name, named_seen, id(hd)
+            try:
+                hd._check(name, v)
+            except errors.ParserError as e:
+                problems.append(e)
+            # As in `FieldDef._store()`, duplicates are checked for after the
+            # value:
+            if marker in seen and not hd.multiple and hd.action is None:
+                problems.append(errors.DuplicateFieldError(name))
+            seen.add(marker)
+        for hd in self._fielddefs.values():
+            if hd.required and id(hd) not in named_seen:
+                problems.append(errors.MissingFieldError(hd.name))
+                # Fields with multiple names appear once per name:
+                named_seen.add(id(hd))
+        if self._body and not body_seen:
+            problems.append(errors.MissingBodyError())
+        return problems
 
     @deprecated(version="0.5.0", reason="use parse_stanzas() instead")
     def parse_stanzas_string(self, s: str) -> Iterator[NormalizedDict]:
@@ -382,8 +1134,7 @@ class HeaderParser:
             definitions declared with `add_field` and `add_additional`
         :raises ScannerError: if a header section is malformed
         """
-        for stanza in fields:
-            yield self.parse_stream(stanza)
+        return self._parse_stanzas(fields, None)
 
     @deprecated(version="0.5.0")
     def parse_next_stanza(self, iterator: Iterator[str]) -> NormalizedDict:
@@ -437,6 +1188,60 @@ class HeaderParser:
         return (self.parse_stream(fields), extra)
 
 
+class PendingConversion:
+    """
+    The values of one field definition collected from a batch of stanzas by
+    `HeaderParser._preconvert()`, along with where they were found
+    """
+
+    __slots__ = ("fielddef", "spots", "values", "futures")
+
+    def __init__(self, fielddef: FieldDef) -> None:
+        self.fielddef = fielddef
+        #: The stanzas containing the values and their indices therein
+        self.spots: list[tuple[list, int]] = []
+        self.values: list[str] = []
+        self.futures: list[Future[Converted]] = []
+
+    def start(self, executor: Executor) -> None:
+        """Submit the values to ``executor`` for conversion"""
+        convert = self.fielddef._preconvert_value
+        self.futures = [executor.submit(convert, v) for v in self.values]
+
+    def finish(self) -> None:
+        """
+        Wait for the conversions and replace the values in their stanzas with
+        the resulting `Converted` instances
+        """
+        for (stanza, i), f in zip(self.spots, self.futures):
+            stanza[i] = (stanza[i][0], f.result())
+
+
+class Converted:
+    """
+    A field value that has already been converted by its field's ``type``,
+    or the (unfolded) value and the exception raised when converting it
+    """
+
+    __slots__ = ("value", "error")
+
+    def __init__(self, value: Any, error: Exception | None = None) -> None:
+        self.value = value
+        self.error = error
+
+    def unwrap(self, name: str) -> Any:
+        """
+        Return the converted value, or raise the conversion error as
+        `FieldDef._convert()` would
+        """
+        if self.error is None:
+            return self.value
+        elif isinstance(self.error, errors.FieldTypeError):
+            raise self.error
+        else:
+            raise errors.FieldTypeError(name, self.value, self.error)
+
+
 class FieldDef:
     def __init__(
         self,
@@ -445,6 +1250,8 @@ class FieldDef:
         unfold: bool = False,
         choices: Iterable | None = None,
         action: Callable[[NormalizedDict, str, Any], Any] | None = None,
+        intern: InternPool | None = None,
+        slow: bool = False,
     ):
         self.type_ = type_
         self.multiple = multiple
@@ -454,7 +1261,44 @@ class FieldDef:
             if not choices:
                 raise ValueError("empty list supplied for choices")
         self.choices: list | None = choices
+        #: The hashable elements of ``choices``, for fast membership tests
+        self._choice_set: frozenset = frozenset()
+        #: The unhashable elements of ``choices``, which have to be searched
+        #: linearly
+        self._unhashable_choices: list = []
+        if choices is not None:
+            hashable = []
+            for c in choices:
+                try:
+                    hash(c)
+                except TypeError:
+                    self._unhashable_choices.append(c)
+                else:
+                    hashable.append(c)
+            self._choice_set = frozenset(hashable)
         self.action = action
+        self.intern = intern
+        self.slow = slow
+
+    @property
+    def deferrable(self) -> bool:
+        """
+        Whether processing of the field's values can be deferred by a lazy
+        parser
+        """
+        return self.action is None and (
+            self.unfold or self.type_ is not None or self.choices is not None
+        )
+
+    def _preconvert_value(self, value: str) -> Converted:
+        if self.unfold:
+            value = unfold(value)
+        if self.type_ is None:
+            return Converted(value)
+        try:
+            return Converted(self.type_(value))
+        except Exception as e:
+            return Converted(value, e)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, FieldDef):
@@ -462,18 +1306,66 @@ class FieldDef:
         else:  # pragma: no cover
             return NotImplemented
 
-    def _process(self, data: NormalizedDict, name: str, dest: Any, value: str) -> None:
+    def _process(
+        self,
+        data: NormalizedDict,
+        name: str,
+        dest: Any,
+        value: str | Converted,
+        stats: ParseStats | None = None,
+    ) -> None:
+        if isinstance(value, Converted):
+            value = value.unwrap(name)
+        else:
+            if stats is not None:
+                self._process_timed(data, name, dest, value, stats)
+                return
+            if self.unfold:
+                value = unfold(value)
+            if self.type_ is not None:
+                value = self._convert(name, value)
+        if self.choices is not None and not self._is_choice(value):
+            raise errors.InvalidChoiceError(name, value)
+        self._store(data, name, dest, value)
+
+    def _process_timed(
+        self, data: NormalizedDict, name: str, dest: Any, value: str, stats: ParseStats
+    ) -> None:
         if self.unfold:
-            value = unfold(value)
+            with stats.timer("unfold", name):
+                value = unfold(value)
         if self.type_ is not None:
-            try:
-                value = self.type_(value)
-            except errors.FieldTypeError:
-                raise
-            except Exception as e:
-                raise errors.FieldTypeError(name, value, e)
-        if self.choices is not None and value not in self.choices:
-            raise errors.InvalidChoiceError(name, value)
+            with stats.timer("type", name):
+                value = self._convert(name, value)
+        if self.choices is not None:
+            with stats.timer("choices", name):
+                if not self._is_choice(value):
+                    raise errors.InvalidChoiceError(name, value)
+        with stats.timer("action" if self.action is not None else "store", name):
+            self._store(data, name, dest, value)
+
+    def _is_choice(self, value: Any) -> bool:
+        try:
+            if value in self._choice_set:
+                return True
+        except TypeError:
+            # `value` is unhashable
+            assert self.choices is not None
+            return value in self.choices
+        return value in self._unhashable_choices
+
+    def _convert(self, name: str, value: str) -> Any:
+        assert self.type_ is not None
+        try:
+            return self.type_(value)
+        except errors.FieldTypeError:
+            raise
+        except Exception as e:
+            raise errors.FieldTypeError(name, value, e)
+
+    def _store(self, data: NormalizedDict, name: str, dest: Any, value: Any) -> None:
+        if self.intern is not None and isinstance(value, str):
+            value = self.intern(value)
         if self.action is not None:
             self.action(data, name, value)
         elif self.multiple:
@@ -483,8 +1375,61 @@ class FieldDef:
         else:
             data[dest] = value
 
-    def process(self, data: NormalizedDict, name: str, value: str) -> None:
-        self._process(data, name, name, value)
+    def _defer(
+        self,
+        data: LazyNormalizedDict,
+        name: str,
+        dest: Any,
+        value: str | Converted,
+    ) -> None:
+        if isinstance(value, Converted) or not self.deferrable:
+            self._process(data, name, dest, value)
+            return
+        deferred = data.deferred(dest)
+        if isinstance(deferred, DeferredValue) and self.multiple:
+            deferred.values.append(value)
+        elif dest in data:
+            if self.multiple:
+                self._process(data, name, dest, value)
+            else:
+                raise errors.DuplicateFieldError(name)
+        else:
+            data.defer(dest, DeferredValue(self, name, value))
+
+    def _check(self, name: str, value: str) -> Any:
+        """
+        Apply ``unfold``, ``type``, and ``choices`` to a value and return the
+        result
+        """
+        if self.unfold:
+            value = unfold(value)
+        if self.type_ is not None:
+            value = self._convert(name, value)
+        if self.choices is not None and not self._is_choice(value):
+            raise errors.InvalidChoiceError(name, value)
+        return value
+
+    def _finish(self, name: str, value: str) -> Any:
+        """
+        Apply ``unfold``, ``type``, ``choices``, and ``intern`` to a value
+        whose processing was deferred
+        """
+        value = self._check(name, value)
+        if self.intern is not None and isinstance(value, str):
+            value = self.intern(value)
+        return value
+
+    def process(
+        self,
+        data: NormalizedDict,
+        name: str,
+        value: str,
+        stats: ParseStats | None = None,
+    ) -> None:
+        self._process(data, name, name, value, stats)
+
+    def defer(self, data: LazyNormalizedDict, name: str, value: str) -> None:
+        self._defer(data, name, name, value)
 
 
 class NamedField(FieldDef):
@@ -502,5 +1447,38 @@ class NamedField(FieldDef):
             self.default = kwargs.pop("default")
         super().__init__(**kwargs)
 
-    def process(self, data: NormalizedDict, _: str, value: str) -> None:
-        self._process(data, self.name, self.dest, value)
+    def process(
+        self,
+        data: NormalizedDict,
+        _: str,
+        value: str,
+        stats: ParseStats | None = None,
+    ) -> None:
+        self._process(data, self.name, self.dest, value, stats)
+
+    def defer(self, data: LazyNormalizedDict, _: str, value: str) -> None:
+        self._defer(data, self.name, self.dest, value)
+
+
+class DeferredValue:
+    """
+    The raw value(s) of a field whose processing was deferred by a lazy
+    parser, stored in a `LazyNormalizedDict` and called to compute the field's
+    final value when it is first read
+    """
+
+    __slots__ = ("fielddef", "name", "values")
+
+    def __init__(self, fielddef: FieldDef, name: str, value: str) -> None:
+        self.fielddef = fielddef
+        self.name = name
+        #: The raw values; there is more than one only for ``multiple``
+        #: fields
+        self.values = [value]
+
+    def __call__(self) -> Any:
+        hd = self.fielddef
+        if hd.multiple:
+            return [hd._finish(self.name, v) for v in self.values]
+        else:
+            return hd._finish(self.name, self.values[0])
@@ -0,0 +1,107 @@
+from __future__ import annotations
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+from .errors import Error
+
+
+class Problem(NamedTuple):
+    """
+    .. versionadded:: 0.6.0
+
+    A problem found in the input by `HeaderParser.audit_stanzas()`
+    """
+
+    #: The index of the stanza in which the problem was found, counting from 0
+    stanza: int
+    #: For a `ScannerError`, the number of the offending line; for a
+    #: `ParserError`, the number of the first line of the stanza.  Lines are
+    #: counted from 1.
+    lineno: int
+    #: The exception describing the problem
+    error: Error
+
+
+class ValidationReport:
+    """
+    .. versionadded:: 0.6.0
+
+    A summary of all of the problems found in a sequence of stanzas, as
+    returned by `HeaderParser.audit_stanzas()`
+    """
+
+    def __init__(self, max_problems: int | None = None) -> None:
+        #: The maximum number of `Problem` records to keep in `problems`, or
+        #: `None` for no limit.  Problems beyond the limit are still counted.
+        self.max_problems = max_problems
+        #: The number of stanzas checked
+        self.stanzas = 0
+        #: The number of stanzas with at least one problem
+        self.invalid_stanzas = 0
+        #: The problems found, in input order
+        self.problems: list[Problem] = []
+        #: A mapping from exception class names to the number of problems of
+        #: that type
+        self.by_type: Counter[str] = Counter()
+        #: A mapping from field names to the number of problems involving the
+        #: field.  Problems that do not involve a field (such as scanner
+        #: errors and body errors) are not counted here.  Additional fields
+        #: are recorded under the names they have in the input.
+        self.by_field: Counter[str] = Counter()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ValidationReport):
+            return vars(self) == vars(other)
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__module__}.{type(self).__name__}"
+            f"(stanzas={self.stanzas!r}, invalid_stanzas={self.invalid_stanzas!r},"
+            f" by_type={dict(self.by_type)!r}, by_field={dict(self.by_field)!r})"
+        )
+
+    @property
+    def total(self) -> int:
+        """The total number of problems found"""
+        return sum(self.by_type.values())
+
+    @property
+    def ok(self) -> bool:
+        """`True` iff no problems were found"""
+        return not self.by_type
+
+    def add(self, stanza: int, lineno: int, errors: Sequence[Error]) -> None:
+        """
+        Record the results of checking the ``stanza``-th stanza, which begins
+        (or, for a scanner error, went wrong) on line ``lineno``
+        """
+        self.stanzas += 1
+        if not errors:
+            return
+        self.invalid_stanzas += 1
+        for e in errors:
+            self.by_type[type(e).__name__] += 1
+            name = getattr(e, "name", None)
+            if name is not None:
+                self.by_field[name] += 1
+            if self.max_problems is None or len(self.problems) < self.max_problems:
+                self.problems.append(Problem(stanza, lineno, e))
+
+    def summary(self) -> str:
+        """
+        Return a short multiline description of the counts, suitable for
+        printing
+        """
+        lines = [
+            f"{self.stanzas} stanzas checked, {self.invalid_stanzas} invalid,"
+            f" {self.total} problems"
+        ]
+        for name, n in self.by_type.most_common():
+            lines.append(f"    {name}: {n}")
+        if self.by_field:
+            lines.append("By field:")
+            for name, n in self.by_field.most_common():
+                lines.append(f"    {name}: {n}")
+        return "\n".join(lines)
@@ -1,25 +1,97 @@
 from __future__ import annotations
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 import re
-from typing import TypeAlias
-import attr
-from deprecated import deprecated
-from .errors import MalformedHeaderError, ScannerEOFError, UnexpectedFoldingError
-from .util import ascii_splitlines
+import sys
+from time import monotonic, perf_counter, sleep
+from typing import IO, TYPE_CHECKING, Any, NamedTuple, TypeAlias
+from .errors import (
+    MalformedHeaderError,
+    ScannerEOFError,
+    ScannerError,
+    UnexpectedFoldingError,
+)
+from .util import ascii_splitlines, deprecated
+
+if TYPE_CHECKING:
+    from .stats import ParseStats
 
 RgxType: TypeAlias = str | re.Pattern[str]
 
+#: The type of the ``on_error`` callbacks taken by `Scanner.scan_stanzas()`
+ErrorCallback: TypeAlias = Callable[[ScannerError, int], Any]
+
 FieldType: TypeAlias = tuple[str | None, str]
 
 DEFAULT_SEPARATOR_REGEX = re.compile(r"[ \t]*:[ \t]*")
 
 
+class ScannerCheckpoint(NamedTuple):
+    """
+    .. versionadded:: 0.6.0
+
+    A snapshot of how much input a `Scanner` has consumed, as returned by
+    `Scanner.checkpoint()` and accepted by `Scanner.from_checkpoint()`.
+    Checkpoints are plain tuples and so can be pickled or serialized as JSON
+    (e.g., via ``list(checkpoint)`` or ``checkpoint._asdict()``) and
+    reconstructed with ``ScannerCheckpoint(*values)``.
+    """
+
+    #: The number of characters of input consumed so far
+    offset: int
+    #: The number of lines of input consumed so far
+    lineno: int
+    #: The number of stanzas scanned by `Scanner.scan_stanzas()` so far,
+    #: including any malformed stanzas skipped via ``on_error``
+    stanzas: int
+    #: Whether leading blank lines are to be skipped when scanning resumes
+    skip_leading_newlines: bool
+    #: If the input is a seekable text file, the file's position as returned
+    #: by its ``tell()`` method; otherwise, `None`
+    position: int | None = None
+
+
+class ScannerCounters(NamedTuple):
+    """
+    .. versionadded:: 0.6.0
+
+    Running totals of the work done by a `Scanner`, as returned by
+    `Scanner.counters` and passed to a scanner's ``progress`` callback
+    """
+
+    #: The number of lines of input consumed
+    lines: int
+    #: The number of characters of input consumed, including any body
+    chars: int
+    #: The number of header fields scanned
+    fields: int
+    #: The number of folded (indented) continuation lines scanned
+    continuation_lines: int
+    #: The number of stanzas scanned by `Scanner.scan_stanzas()`, including
+    #: any malformed stanzas skipped via ``on_error``
+    stanzas: int
+    #: The number of characters of body returned by `Scanner.get_unscanned()`
+    #: (and thus also by `Scanner.scan()`)
+    body_chars: int
+
+
 def data2iter(data: str | Iterable[str]) -> Iterator[str]:
     if isinstance(data, str):
         data = ascii_splitlines(data)
     return iter(data)
 
 
+def seekable_file(data: str | Iterable[str]) -> IO[str] | None:
+    if (
+        not isinstance(data, str)
+        and hasattr(data, "readline")
+        and hasattr(data, "tell")
+        and getattr(data, "seekable", lambda: False)()
+    ):
+        return data  # type: ignore[return-value]
+    return None
+
+
 def convert_sep(v: RgxType | None) -> re.Pattern[str]:
     if v is None:
         return DEFAULT_SEPARATOR_REGEX
@@ -31,7 +103,6 @@ def none2false(v: bool | None) -> bool:
     return False if v is None else v
 
 
-@attr.define
 class Scanner:
     """
     .. versionadded:: 0.5.0
@@ -59,18 +130,253 @@ class Scanner:
         If `True`, blank lines at the beginning of the input will be discarded.
         If `False`, a blank line at the beginning of the input marks the end of
         an empty header section.
+
+    :param bool intern_names:
+        If `True`, field names are interned with `sys.intern()` so that every
+        occurrence of a given name shares a single string object.  This can
+        greatly reduce memory usage when keeping the results of scanning (or
+        parsing) a large number of stanzas with the same fields.
+
+    :param stats:
+        If not `None`, the time spent scanning each stanza (not counting time
+        spent by the caller between fields) is added to this object's
+        ``"scan"`` phase.  See `HeaderParser.enable_stats()`.
+    :type stats: ParseStats or None
+
+    :param progress:
+        If not `None`, a callable that will be passed the scanner's `counters`
+        periodically while `scan_stanzas()` is running: after every
+        ``progress_every`` stanzas, whenever at least ``progress_interval``
+        seconds have passed since the previous call, and once more after the
+        last stanza.  If neither ``progress_every`` nor ``progress_interval``
+        is set, the callable is only called after the last stanza.
+    :param progress_every:
+        call ``progress`` after every this many stanzas
+    :type progress_every: int or None
+    :param progress_interval:
+        call ``progress`` after the first stanza that ends at least this many
+        seconds after the previous call
+    :type progress_interval: float or None
+
+    .. versionchanged:: 0.6.0
+        ``intern_names``, ``stats``, ``progress``, ``progress_every``, and
+        ``progress_interval`` arguments added
+
+    A `Scanner` consumes its input as it goes and so must not be used from
+    more than one thread at a time.  The module-level scanning functions
+    create a new `Scanner` on each call and are safe to call concurrently.
     """
 
-    _data: Iterator[str] = attr.field(converter=data2iter)
-    separator_regex: re.Pattern[str] = attr.field(
-        default=DEFAULT_SEPARATOR_REGEX,
-        converter=convert_sep,
-        kw_only=True,
-    )
-    skip_leading_newlines: bool = attr.field(
-        default=False, kw_only=True, converter=none2false
+    __slots__ = (
+        "_data",
+        "_fp",
+        "separator_regex",
+        "skip_leading_newlines",
+        "intern_names",
+        "stats",
+        "progress",
+        "progress_every",
+        "progress_interval",
+        "_eof",
+        "_between_stanzas",
+        "_offset",
+        "_lineno",
+        "_stanza_lineno",
+        "_stanzas",
+        "_fields",
+        "_continuations",
+        "_body_chars",
+        "_reported",
+        "_next_report",
     )
-    _eof: bool = attr.field(default=False, init=False)
+
+    # This class is written out by hand rather than with `attrs` so that the
+    # core scanner can be imported without importing `attrs`.
+    def __init__(
+        self,
+        data: str | Iterable[str],
+        *,
+        separator_regex: RgxType | None = DEFAULT_SEPARATOR_REGEX,
+        skip_leading_newlines: bool | None = False,
+        intern_names: bool = False,
+        stats: ParseStats | None = None,
+        progress: Callable[[ScannerCounters], Any] | None = None,
+        progress_every: int | None = None,
+        progress_interval: float | None = None,
+    ) -> None:
+        self._fp = seekable_file(data)
+        self._data: Iterator[str]
+        if self._fp is not None:
+            # Read with `readline()` rather than by iterating over the file so
+            # that `checkpoint()` can still call `tell()`:
+            self._data = iter(self._fp.readline, "")
+        else:
+            self._data = data2iter(data)
+        self.separator_regex: re.Pattern[str] = convert_sep(separator_regex)
+        self.skip_leading_newlines: bool = none2false(skip_leading_newlines)
+        self.intern_names = intern_names
+        self.stats = stats
+        self.progress = progress
+        self.progress_every = progress_every
+        self.progress_interval = progress_interval
+        # Per-scan cursor state (as opposed to the configuration above) is
+        # kept in private attributes so that scanning never modifies the
+        # configuration:
+        self._eof = False
+        #: Whether `scan_stanzas()` has yielded a stanza, after which leading
+        #: blank lines are always skipped
+        self._between_stanzas = False
+        self._offset = 0
+        self._lineno = 0
+        #: The line number of the first line of the stanza most recently read
+        #: by `_read_stanza()`
+        self._stanza_lineno = 0
+        self._stanzas = 0
+        self._fields = 0
+        self._continuations = 0
+        self._body_chars = 0
+        #: The value of ``_stanzas`` when ``progress`` was last called
+        self._reported = 0
+        #: The `monotonic()` time after which ``progress`` is next due
+        self._next_report = 0.0
+
+    # `__repr__()` and `__eq__()` match the methods that `attrs` generated for
+    # this class before 0.6.0, extended to cover the options added since.
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__qualname__}(_data={self._data!r},"
+            f" separator_regex={self.separator_regex!r},"
+            f" skip_leading_newlines={self.skip_leading_newlines!r},"
+            f" intern_names={self.intern_names!r},"
+            f" stats={self.stats!r}, progress={self.progress!r},"
+            f" progress_every={self.progress_every!r},"
+            f" progress_interval={self.progress_interval!r},"
+            f" _eof={self._eof!r})"
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def _astuple(self) -> tuple:
+        return (
+            self._data,
+            self.separator_regex,
+            self.skip_leading_newlines,
+            self.intern_names,
+            self.stats,
+            self.progress,
+            self.progress_every,
+            self.progress_interval,
+            self._eof,
+        )
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        data: str | Iterable[str],
+        checkpoint: ScannerCheckpoint,
+        **kwargs: Any,
+    ) -> Scanner:
+        """
+        .. versionadded:: 0.6.0
+
+        Create a `Scanner` that resumes scanning ``data`` from the position
+        recorded in ``checkpoint``, which must have been obtained from a
+        `Scanner` over the same input.  If ``data`` is a string, scanning
+        resumes at the checkpoint's character offset.  If ``data`` is a
+        seekable text file and the checkpoint records a file position, the
+        file is seeked to that position.  Otherwise, the number of lines
+        recorded in the checkpoint are read from ``data`` and discarded
+        without being scanned.
+
+        The new scanner's own checkpoints continue counting from those in
+        ``checkpoint``.
+
+        :param data: the same input that the checkpointed scanner was given
+        :param ScannerCheckpoint checkpoint: a checkpoint returned by
+            `checkpoint()`
+        :param kwargs: any other keyword arguments accepted by the `Scanner`
+            constructor other than ``skip_leading_newlines``, which is taken
+            from ``checkpoint``
+        :rtype: Scanner
+        """
+        fp = seekable_file(data)
+        if isinstance(data, str):
+            data = data[checkpoint.offset :]
+        elif fp is not None and checkpoint.position is not None:
+            fp.seek(checkpoint.position)
+        else:
+            lines = iter(fp.readline, "") if fp is not None else iter(data)
+            next(islice(lines, checkpoint.lineno, checkpoint.lineno), None)
+            if fp is None:
+                data = lines
+        sc = cls(
+            data, skip_leading_newlines=checkpoint.skip_leading_newlines, **kwargs
+        )
+        sc._offset = checkpoint.offset
+        sc._lineno = checkpoint.lineno
+        sc._stanzas = checkpoint.stanzas
+        return sc
+
+    @property
+    def counters(self) -> ScannerCounters:
+        """
+        .. versionadded:: 0.6.0
+
+        A `ScannerCounters` instance giving the amount of input processed so
+        far.  As with `checkpoint()`, the counts are only brought up to date
+        between stanzas.
+        """
+        return ScannerCounters(
+            lines=self._lineno,
+            chars=self._offset,
+            fields=self._fields,
+            continuation_lines=self._continuations,
+            stanzas=self._stanzas,
+            body_chars=self._body_chars,
+        )
+
+    @property
+    def stanza_lineno(self) -> int:
+        """
+        .. versionadded:: 0.6.0
+
+        The line number (counting from 1) of the first line of the stanza
+        most recently read by `scan_next_stanza()`, `scan_stanzas()`, or
+        similar, not counting any leading blank lines that were skipped; 0 if
+        no stanza has been read yet
+        """
+        return self._stanza_lineno
+
+    def checkpoint(self) -> ScannerCheckpoint:
+        """
+        .. versionadded:: 0.6.0
+
+        Return a `ScannerCheckpoint` recording how much of the input has been
+        consumed so far.  Passing the checkpoint to `from_checkpoint()` along
+        with the same input produces a scanner that picks up where this one
+        left off.
+
+        Checkpoints are only meaningful between stanzas, e.g., after each
+        stanza yielded by `scan_stanzas()` or after a generator returned by
+        `scan_next_stanza()` has been exhausted.
+
+        If the scanner's input is a seekable text file, the checkpoint also
+        records the file's current position so that `from_checkpoint()` can
+        seek straight to it instead of rereading the lines before it.
+
+        :rtype: ScannerCheckpoint
+        """
+        return ScannerCheckpoint(
+            offset=self._offset,
+            lineno=self._lineno,
+            stanzas=self._stanzas,
+            skip_leading_newlines=self.skip_leading_newlines or self._between_stanzas,
+            position=self._fp.tell() if self._fp is not None else None,
+        )
 
     def scan(self) -> Iterator[FieldType]:
         """
@@ -108,45 +414,88 @@ class Scanner:
         (If ``skip_leading_newlines`` is true, the function only stops on a
         blank line after a non-blank line.)
 
+        .. versionchanged:: 0.6.0
+            The whole header section is now read before any fields are
+            yielded, so a malformed header section raises an error before any
+            of its fields are generated.
+
         :raises ScannerError: if the header section is malformed
         :raises ScannerEOFError: if all of the input has already been consumed
         """
+        yield from self._read_stanza()
+
+    def _read_stanza(self) -> list[tuple[str, str]]:
+        """
+        Read the next stanza's header fields into a list.  This is the one loop
+        over input lines shared by `scan_next_stanza()`, `scan_stanzas()`, and
+        the other stanza-scanning methods.
+        """
         if self._eof:
             raise ScannerEOFError()
+        fields: list[tuple[str, str]] = []
         name: str | None = None
         value = ""
+        skip_leading_newlines = self.skip_leading_newlines or self._between_stanzas
         begun = False
         more_left = False
-        for line in self._data:
-            line = line.rstrip("\r\n")
-            if line.startswith((" ", "\t")):
-                begun = True
-                if name is not None:
-                    value += "\n" + line
-                else:
-                    raise UnexpectedFoldingError(line)
-            else:
-                m = self.separator_regex.search(line)
-                if m:
+        offset = self._offset
+        lineno = self._lineno
+        first_lineno = lineno + 1
+        nfields = self._fields
+        continuations = self._continuations
+        intern_names = self.intern_names
+        search = self.separator_regex.search
+        stats = self.stats
+        started = perf_counter() if stats is not None else 0.0
+        try:
+            for line in self._data:
+                offset += len(line)
+                lineno += 1
+                line = line.rstrip("\r\n")
+                if line.startswith((" ", "\t")):
                     begun = True
                     if name is not None:
-                        yield (name, value)
-                    name = line[: m.start()]
-                    value = line[m.end() :]
-                elif line == "":
-                    if self.skip_leading_newlines and not begun:
-                        continue
+                        value += "\n" + line
+                        continuations += 1
                     else:
-                        more_left = True
-                        break
+                        raise UnexpectedFoldingError(line)
                 else:
-                    raise MalformedHeaderError(line)
-        if name is not None:
-            yield (name, value)
+                    m = search(line)
+                    if m:
+                        begun = True
+                        if name is not None:
+                            fields.append((name, value))
+                        name = line[: m.start()]
+                        if intern_names:
+                            name = sys.intern(name)
+                        value = line[m.end() :]
+                        nfields += 1
+                    elif line == "":
+                        if skip_leading_newlines and not begun:
+                            first_lineno = lineno + 1
+                            continue
+                        else:
+                            more_left = True
+                            break
+                    else:
+                        raise MalformedHeaderError(line)
+            if name is not None:
+                fields.append((name, value))
+        finally:
+            self._offset = offset
+            self._lineno = lineno
+            self._stanza_lineno = first_lineno
+            self._fields = nfields
+            self._continuations = continuations
+            if stats is not None:
+                stats.add("scan", perf_counter() - started)
         if not more_left:
             self._eof = True
+        return fields
 
-    def scan_stanzas(self) -> Iterator[list[tuple[str, str]]]:
+    def scan_stanzas(
+        self, *, on_error: ErrorCallback | None = None
+    ) -> Iterator[list[tuple[str, str]]]:
         """
         Scan the remaining input for zero or more stanzas of RFC 822-style
         header fields and return a generator of lists of ``(name, value)``
@@ -157,21 +506,193 @@ class Scanner:
         between stanzas are treated as a single blank line.  Blank lines at the
         end of the input are discarded without creating a new stanza.
 
+        By default, a malformed stanza ends the scan with a `ScannerError`.
+        If ``on_error`` is given, the scan instead recovers: the rest of the
+        malformed stanza is discarded up through the next blank line, and
+        ``on_error`` is called with the exception and the number of the
+        offending line (counting from 1) before scanning continues with the
+        next stanza.  The discarded stanza still counts towards
+        `counters`, and a `checkpoint()` taken from within ``on_error`` points
+        to the start of the next stanza.
+
+        .. versionchanged:: 0.6.0
+            ``on_error`` argument added
+
+        :param on_error: a callable taking a `ScannerError` and a line number
+        :raises ScannerError: if a header section is malformed and
+            ``on_error`` is `None`
+        :raises ScannerEOFError: if all of the input has already been consumed
+        """
+        for batch in self._scan_stanza_batches(1, on_error):
+            yield batch[0]
+
+    def scan_stanza_batches(
+        self, batch_size: int, *, on_error: ErrorCallback | None = None
+    ) -> Iterator[list[list[tuple[str, str]]]]:
+        """
+        .. versionadded:: 0.6.0
+
+        Like `scan_stanzas()`, but the stanzas are yielded in lists of
+        ``batch_size`` stanzas each (except for the last list, which may be
+        shorter).  This reduces the per-stanza overhead of the generator and is
+        convenient for handing stanzas to executors or bulk consumers.
+
+        :param int batch_size: the number of stanzas in each list
+        :param on_error: as for `scan_stanzas()`
+        :raises ValueError: if ``batch_size`` is less than 1
+        :raises ScannerError: if a header section is malformed and
+            ``on_error`` is `None`
+        :raises ScannerEOFError: if all of the input has already been consumed
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        return self._scan_stanza_batches(batch_size, on_error)
+
+    def _scan_stanza_batches(
+        self, batch_size: int, on_error: ErrorCallback | None = None
+    ) -> Iterator[list[list[tuple[str, str]]]]:
+        self._begin_stanzas()
+        batch: list[list[tuple[str, str]]] = []
+        while True:
+            try:
+                fields = self._next_stanza()
+            except ScannerError as e:
+                if on_error is None:
+                    raise
+                lineno = self._lineno
+                self._skip_stanza()
+                on_error(e, lineno)
+                continue
+            if fields is None:
+                break
+            batch.append(fields)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        self._end_stanzas()
+
+    def scan_into(self, on_field: Callable[[str | None, str], Any]) -> None:
+        """
+        .. versionadded:: 0.6.0
+
+        Like `scan()`, but instead of returning a generator, call
+        ``on_field(name, value)`` for each header field and
+        ``on_field(None, body)`` for the body (if any).  The input is processed
+        in a single loop without any generators, which is faster when there
+        are many small inputs.
+
+        :param on_field: a callable taking a field name (or `None`) and value
         :raises ScannerError: if the header section is malformed
         :raises ScannerEOFError: if all of the input has already been consumed
         """
+        for name, value in self._read_stanza():
+            on_field(name, value)
+        if not self._eof:
+            on_field(None, self.get_unscanned())
+
+    def scan_stanzas_into(
+        self,
+        on_field: Callable[[str, str], Any],
+        on_stanza_end: Callable[[], Any] | None = None,
+    ) -> int:
+        """
+        .. versionadded:: 0.6.0
+
+        Like `scan_stanzas()`, but instead of returning a generator, call
+        ``on_field(name, value)`` for each header field and then
+        ``on_stanza_end()`` (if given) at the end of each stanza.  The input is
+        processed in a single loop without any generators, which is faster
+        when the stanzas are small.
+
+        Each stanza is scanned in full before ``on_field`` is called for any of
+        its fields, so if a stanza is malformed, no callbacks are made for it.
+
+        :param on_field: a callable taking a field name and value
+        :param on_stanza_end: a callable taking no arguments
+        :return: the number of stanzas scanned
+        :rtype: int
+        :raises ScannerError: if a header section is malformed
+        :raises ScannerEOFError: if all of the input has already been consumed
+        """
+        self._begin_stanzas()
+        count = 0
+        while True:
+            fields = self._next_stanza()
+            if fields is None:
+                break
+            for name, value in fields:
+                on_field(name, value)
+            if on_stanza_end is not None:
+                on_stanza_end()
+            count += 1
+        self._end_stanzas()
+        return count
+
+    # The following three methods implement the stanza loop shared by
+    # `scan_stanzas()`, `scan_stanza_batches()`, `scan_stanzas_into()`, and
+    # `HeaderParser.parse_stanzas_into()`:
+
+    def _begin_stanzas(self) -> None:
         if self._eof:
             raise ScannerEOFError()
-        while True:
-            try:
-                fields = list(self.scan_next_stanza())
-            except ScannerEOFError:
+        self._reported = self._stanzas
+        if self.progress is not None and self.progress_interval is not None:
+            self._next_report = monotonic() + self.progress_interval
+
+    def _next_stanza(self) -> list[tuple[str, str]] | None:
+        """
+        Read the next stanza, count it, and report progress if due.  Returns
+        `None` once there are no more stanzas.
+        """
+        fields = self._read_stanza() if not self._eof else None
+        if fields is None or (not fields and self._eof):
+            return None
+        self._stanzas += 1
+        self._between_stanzas = True
+        progress = self.progress
+        if progress is not None and (
+            (
+                self.progress_every is not None
+                and self._stanzas - self._reported >= self.progress_every
+            )
+            or (
+                self.progress_interval is not None
+                and monotonic() >= self._next_report
+            )
+        ):
+            progress(self.counters)
+            self._reported = self._stanzas
+            if self.progress_interval is not None:
+                self._next_report = monotonic() + self.progress_interval
+        return fields
+
+    def _end_stanzas(self) -> None:
+        if self.progress is not None and self._reported != self._stanzas:
+            self.progress(self.counters)
+
+    def _skip_stanza(self) -> None:
+        """
+        After `_read_stanza()` has raised a `ScannerError`, discard the rest
+        of the offending stanza up through the next blank line and count it as
+        a stanza, so that the stanza loop can carry on with the next one
+        """
+        offset = self._offset
+        lineno = self._lineno
+        more_left = False
+        for line in self._data:
+            offset += len(line)
+            lineno += 1
+            if line.rstrip("\r\n") == "":
+                more_left = True
                 break
-            if fields or not self._eof:
-                yield fields
-            else:
-                break  # type: ignore[unreachable]
-            self.skip_leading_newlines = True
+        self._offset = offset
+        self._lineno = lineno
+        self._stanzas += 1
+        self._between_stanzas = True
+        if not more_left:
+            self._eof = True
 
     def get_unscanned(self) -> str:
         """
@@ -184,7 +705,12 @@ class Scanner:
         if self._eof:
             raise ScannerEOFError()
         else:
-            return "".join(self._data)
+            lines = list(self._data)
+            body = "".join(lines)
+            self._lineno += len(lines)
+            self._offset += len(body)
+            self._body_chars += len(body)
+            return body
 
 
 @deprecated(version="0.5.0", reason="use scan() instead")
@@ -222,6 +748,7 @@ def scan(
     *,
     separator_regex: RgxType | None = None,
     skip_leading_newlines: bool = False,
+    **kwargs: Any,
 ) -> Iterator[FieldType]:
     """
     .. versionadded:: 0.4.0
@@ -256,6 +783,7 @@ def scan(
         data,
         separator_regex=separator_regex,
         skip_leading_newlines=skip_leading_newlines,
+        **kwargs,
     ).scan()
 
 
@@ -336,6 +864,8 @@ def scan_stanzas(
     *,
     separator_regex: RgxType | None = None,
     skip_leading_newlines: bool = False,
+    on_error: ErrorCallback | None = None,
+    **kwargs: Any,
 ) -> Iterator[list[tuple[str, str]]]:
     """
     .. versionadded:: 0.4.0
@@ -355,17 +885,124 @@ def scan_stanzas(
     .. versionchanged:: 0.5.0
         ``data`` can now be a string.
 
+    .. versionchanged:: 0.6.0
+        ``on_error`` argument added
+
     :param data: a string, text-file-like object, or iterable of strings
         representing lines of input
+    :param on_error: If given, malformed stanzas are skipped and reported to
+        this callable instead of ending the scan; see `Scanner.scan_stanzas()`
     :param kwargs: Passed to the `Scanner` constructor
     :rtype: generator of lists of pairs of strings
-    :raises ScannerError: if the header section is malformed
+    :raises ScannerError: if a header section is malformed and ``on_error`` is
+        `None`
     """
     return Scanner(
         data,
         separator_regex=separator_regex,
         skip_leading_newlines=skip_leading_newlines,
-    ).scan_stanzas()
+        **kwargs,
+    ).scan_stanzas(on_error=on_error)
+
+
+def scan_into(
+    data: str | Iterable[str],
+    on_field: Callable[[str | None, str], Any],
+    **kwargs: Any,
+) -> None:
+    """
+    .. versionadded:: 0.6.0
+
+    Like `scan()`, but call ``on_field(name, value)`` for each header field
+    and ``on_field(None, body)`` for the body (if any) instead of returning a
+    generator.  See `Scanner.scan_into()`.
+
+    :param data: a string, text-file-like object, or iterable of strings
+        representing lines of input
+    :param on_field: a callable taking a field name (or `None`) and value
+    :param kwargs: Passed to the `Scanner` constructor
+    :raises ScannerError: if the header section is malformed
+    """
+    Scanner(data, **kwargs).scan_into(on_field)
+
+
+def scan_stanzas_into(
+    data: str | Iterable[str],
+    on_field: Callable[[str, str], Any],
+    on_stanza_end: Callable[[], Any] | None = None,
+    **kwargs: Any,
+) -> int:
+    """
+    .. versionadded:: 0.6.0
+
+    Like `scan_stanzas()`, but call ``on_field(name, value)`` for each header
+    field and ``on_stanza_end()`` (if given) at the end of each stanza instead
+    of returning a generator.  See `Scanner.scan_stanzas_into()`.
+
+    :param data: a string, text-file-like object, or iterable of strings
+        representing lines of input
+    :param on_field: a callable taking a field name and value
+    :param on_stanza_end: a callable taking no arguments
+    :param kwargs: Passed to the `Scanner` constructor
+    :return: the number of stanzas scanned
+    :rtype: int
+    :raises ScannerError: if a header section is malformed
+    """
+    return Scanner(data, **kwargs).scan_stanzas_into(on_field, on_stanza_end)
+
+
+def follow(
+    fp: IO[str], *, poll_interval: float = 1.0, idle_timeout: float | None = None
+) -> Iterator[str]:
+    """
+    .. versionadded:: 0.6.0
+
+    Read lines from a text file that is being appended to, in the manner of
+    :command:`tail -f`, and return a generator of each complete line as soon as
+    its line terminator has been written.  When the end of the file is reached,
+    the generator sleeps for ``poll_interval`` seconds and then checks for new
+    data, picking up where it left off instead of rereading the file.
+
+    Passing the result to `Scanner` or `scan_stanzas()` produces each stanza of
+    a growing stanza log as soon as its terminating blank line is written:
+
+    .. code:: python
+
+        with open("records.log", encoding="utf-8") as fp:
+            for stanza in scan_stanzas(follow(fp)):
+                ...
+
+    :param fp: a text-file-like object with a ``readline()`` method
+    :param float poll_interval: how many seconds to wait before checking again
+        for new data at the end of the file
+    :param idle_timeout: If not `None`, the generator stops once no new data
+        has been written for this many seconds, first yielding any trailing
+        line that lacks a line terminator.  If `None` (the default), the
+        generator never stops on its own.
+    :type idle_timeout: float or None
+    :rtype: generator of strings
+    """
+    partial = ""
+    idle_since: float | None = None
+    while True:
+        line = fp.readline()
+        if line:
+            idle_since = None
+            if line.endswith(("\n", "\r")):
+                yield partial + line
+                partial = ""
+            else:
+                partial += line
+        else:
+            if idle_timeout is not None:
+                now = monotonic()
+                if idle_since is None:
+                    idle_since = now
+                elif now - idle_since >= idle_timeout:
+                    if partial:
+                        yield partial
+                    return
+            sleep(poll_interval)
 
 
 @deprecated(version="0.5.0", reason="use scan_stanzas() instead")
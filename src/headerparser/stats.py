@@ -0,0 +1,139 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from contextlib import contextmanager
+import threading
+from time import perf_counter
+from typing import Any, NamedTuple
+
+
+class PhaseStats(NamedTuple):
+    """
+    .. versionadded:: 0.6.0
+
+    The accumulated cost of one phase of parsing
+    """
+
+    #: The number of times the phase was run
+    calls: int
+    #: The total wall-clock time spent in the phase, in seconds
+    time: float
+
+
+class ParseStats:
+    """
+    .. versionadded:: 0.6.0
+
+    Wall-clock time and call counts accumulated by a `HeaderParser` or
+    `Scanner` with statistics enabled, broken down by phase and by field.  See
+    `HeaderParser.enable_stats()`.
+
+    The phases are:
+
+    ``"scan"``
+        breaking the input into fields, counted once per stanza
+
+    ``"normalize"``
+        normalizing field names in order to look up their definitions
+
+    ``"unfold"``, ``"type"``, ``"choices"``, ``"action"``
+        applying the corresponding `~HeaderParser.add_field()` options
+
+    ``"store"``
+        storing values in the result dictionary (for fields without an
+        ``action``)
+
+    A single `ParseStats` instance may be updated by multiple threads at once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        #: A mapping from phase names to `PhaseStats` for all fields combined
+        self.phases: dict[str, PhaseStats] = {}
+        #: A mapping from field names to mappings from phase names to
+        #: `PhaseStats` for the phases that are specific to individual field
+        #: definitions.  Additional fields are recorded under the names they
+        #: have in the input.
+        self.fields: dict[str, dict[str, PhaseStats]] = {}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ParseStats):
+            return (self.phases, self.fields) == (other.phases, other.fields)
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__module__}.{type(self).__name__}"
+            f"(phases={self.phases!r}, fields={self.fields!r})"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        with self._lock:
+            return {"phases": self.phases.copy(), "fields": self.fields.copy()}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._lock = threading.Lock()
+        self.phases = state["phases"]
+        self.fields = state["fields"]
+
+    def add(self, phase: str, elapsed: float, field: str | None = None) -> None:
+        """
+        Record one run of ``phase`` taking ``elapsed`` seconds, attributed to
+        the field named ``field`` if not `None`
+        """
+        with self._lock:
+            self._add(phase, 1, elapsed, field)
+
+    def _add(self, phase: str, calls: int, elapsed: float, field: str | None) -> None:
+        calls0, time0 = self.phases.get(phase, (0, 0.0))
+        self.phases[phase] = PhaseStats(calls0 + calls, time0 + elapsed)
+        if field is not None:
+            fieldstats = self.fields.setdefault(field, {})
+            calls0, time0 = fieldstats.get(phase, (0, 0.0))
+            fieldstats[phase] = PhaseStats(calls0 + calls, time0 + elapsed)
+
+    @contextmanager
+    def timer(self, phase: str, field: str | None = None) -> Iterator[None]:
+        """
+        A context manager that records the time spent in its body as one run
+        of ``phase``, even if the body raises an exception
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, perf_counter() - start, field)
+
+    def merge(self, other: ParseStats) -> None:
+        """Add the statistics from ``other`` to this instance"""
+        with self._lock:
+            for phase, ps in other.phases.items():
+                self._add(phase, ps.calls, ps.time, None)
+            for field, fieldstats in other.fields.items():
+                for phase, ps in fieldstats.items():
+                    calls0, time0 = self.fields.setdefault(field, {}).get(
+                        phase, (0, 0.0)
+                    )
+                    self.fields[field][phase] = PhaseStats(
+                        calls0 + ps.calls, time0 + ps.time
+                    )
+
+    def reset(self) -> None:
+        """Discard all accumulated statistics"""
+        with self._lock:
+            self.phases = {}
+            self.fields = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Return the statistics as a `dict` of plain `dict`\\s, `int`\\s, and
+        `float`\\s suitable for serializing as JSON
+        """
+        with self._lock:
+            return {
+                "phases": {k: v._asdict() for k, v in self.phases.items()},
+                "fields": {
+                    f: {k: v._asdict() for k, v in fs.items()}
+                    for f, fs in self.fields.items()
+                },
+            }
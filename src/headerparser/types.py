@@ -1,3 +1,6 @@
+from collections.abc import Callable
+import functools
+import os
 import re
 from typing import Any
 
@@ -55,3 +58,106 @@ def unfold(s: str) -> str:
     :rtype: string
     """
     return re.sub(r"[ \t]*[\r\n][ \t\r\n]*", " ", s).strip(" ")
+
+
+def load_choices(path: "str | os.PathLike[str]", encoding: str = "utf-8") -> frozenset:
+    """
+    .. versionadded:: 0.6.0
+
+    Read a set of allowed field values, for use as the ``choices`` argument to
+    `HeaderParser.add_field()`, from a text file containing one value per
+    line.  Leading & trailing whitespace is stripped from each line, and blank
+    lines and lines starting with ``#`` are ignored.
+
+    :param path: the path to the file
+    :param str encoding: the file's encoding
+    :rtype: frozenset of strings
+    """
+    with open(path, encoding=encoding) as fp:
+        return frozenset(
+            line for line in map(str.strip, fp) if line and not line.startswith("#")
+        )
+
+
+class CachedConverter:
+    """
+    .. versionadded:: 0.6.0
+
+    A ``type`` callable wrapped in a bounded LRU cache, as returned by
+    `memoize()`.  Calling the instance with a string returns the wrapped
+    callable's result for that string, computing it only if it is not already
+    in the cache.  Exceptions are not cached, so a value that fails to convert
+    raises the same exception (and thus the same `FieldTypeError` when used as
+    a ``type``) every time it is encountered.
+
+    Instances can be pickled (e.g., for use with process pools); the cache
+    contents are not included.
+    """
+
+    def __init__(self, func: Callable[[str], Any], maxsize: int | None) -> None:
+        #: The wrapped callable
+        self.func = func
+        #: The maximum number of results to cache, or `None` for no limit
+        self.maxsize = maxsize
+        self._cached = functools.lru_cache(maxsize=maxsize)(func)
+
+    def __call__(self, s: str) -> Any:
+        return self._cached(s)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CachedConverter):
+            return (self.func, self.maxsize) == (other.func, other.maxsize)
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.func, self.maxsize))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__qualname__}(func={self.func!r},"
+            f" maxsize={self.maxsize!r})"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"func": self.func, "maxsize": self.maxsize}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["func"], state["maxsize"])  # type: ignore[misc]
+
+    def cache_info(self) -> "functools._CacheInfo":
+        """
+        Return a named tuple of the cache's ``hits``, ``misses``, ``maxsize``,
+        and ``currsize``, as for `functools.lru_cache`
+        """
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        """Discard all cached results and reset the statistics"""
+        self._cached.cache_clear()
+
+
+def memoize(
+    func: Callable[[str], Any], maxsize: int | None = 1024
+) -> CachedConverter:
+    """
+    .. versionadded:: 0.6.0
+
+    Wrap a pure ``type`` callable in a bounded LRU cache so that repeated
+    field values are only converted once.  This is worthwhile for expensive
+    conversions (such as parsing versions, dates, or dependency
+    specifications) of values that recur across many stanzas.  The same
+    effect can be had by passing ``cache=maxsize`` to
+    `HeaderParser.add_field()`.
+
+    Note that every stanza with the same value will receive the same result
+    object, so the results should not be mutated.
+
+    :param callable func: the callable to wrap; it must always return equal
+        results for equal inputs
+    :param maxsize: the maximum number of results to cache, or `None` for no
+        limit
+    :type maxsize: int or None
+    :rtype: CachedConverter
+    """
+    return CachedConverter(func, maxsize)
@@ -1,5 +1,10 @@
 from __future__ import annotations
+from collections.abc import Callable
+from functools import wraps
 import re
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 def ascii_splitlines(s: str) -> list[str]:
@@ -11,3 +16,79 @@ def ascii_splitlines(s: str) -> list[str]:
     if lastend < len(s):
         lines.append(s[lastend:])
     return lines
+
+
+class InternPool:
+    """
+    A bounded pool of canonical `str` instances.  Calling the pool with a
+    string returns the first equal string that was passed to it, so that
+    repeated values can share a single object.  Once the pool holds
+    ``maxsize`` strings, new strings are returned as-is without being added.
+
+    Two pools are equal if they have the same ``maxsize``, regardless of their
+    contents.
+    """
+
+    __slots__ = ("maxsize", "_pool")
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("intern pool size must be nonnegative")
+        self.maxsize = maxsize
+        self._pool: dict[str, str] = {}
+
+    def __call__(self, s: str) -> str:
+        try:
+            return self._pool[s]
+        except KeyError:
+            if len(self._pool) < self.maxsize:
+                return self._pool.setdefault(s, s)
+            return s
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, InternPool):
+            return self.maxsize == other.maxsize
+        else:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}(maxsize={self.maxsize!r})"
+
+    def clear(self) -> None:
+        self._pool.clear()
+
+
+def deprecated(version: str, reason: str = "") -> Callable[[F], F]:
+    """
+    Like ``deprecated.deprecated()``, but the ``deprecated`` package (and
+    ``wrapt`` with it) is only imported the first time a decorated callable is
+    actually called, so that importing ``headerparser`` stays cheap.
+    ``func`` is assumed to be a method if it is defined inside a class body.
+    """
+
+    def decorator(func: F) -> F:
+        qualname = func.__qualname__.split(".")
+        is_method = len(qualname) > 1 and qualname[-2] != "<locals>"
+        real: Any = None
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal real
+            if real is None:
+                from deprecated import deprecated as _deprecated
+
+                real = _deprecated(
+                    version=version, reason=reason, extra_stacklevel=1
+                )(func)
+            if is_method:
+                self, *args2 = args
+                return real.__get__(self, type(self))(*args2, **kwargs)
+            else:
+                return real(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,217 @@
+from __future__ import annotations
+from collections.abc import Iterator
+import re
+from typing import Any
+from .errors import MalformedHeaderError, UnexpectedFoldingError
+from .scanner import RgxType, convert_sep
+
+EOL = re.compile(r"\r\n?|\n")
+
+
+class FieldView:
+    """
+    .. versionadded:: 0.6.0
+
+    A header field (or message body) located in a string of input, as yielded
+    by `scan_views()` and `scan_stanza_views()`.  A `FieldView` only records
+    the offsets of the field's name and value in the input; the `name` and
+    `value` strings are not created until they are first accessed, after which
+    they are cached.
+
+    A `FieldView` can be unpacked like the ``(name, value)`` pairs returned by
+    `scan()` and compares equal to the corresponding pair.
+
+    Every view keeps a reference to the entire input string in `buffer`, so
+    holding on to even a single view keeps the whole document in memory.  To
+    keep a field around after the rest of the input is no longer needed, copy
+    out its `name` and `value` (e.g., with ``tuple(view)``) and drop the view.
+    """
+
+    __slots__ = (
+        "buffer",
+        "_name_start",
+        "_name_end",
+        "start",
+        "end",
+        "_folded",
+        "_name",
+        "_value",
+    )
+
+    def __init__(
+        self,
+        buffer: str,
+        name_start: int,
+        name_end: int,
+        start: int,
+        end: int,
+        folded: bool = False,
+    ) -> None:
+        #: The input string
+        self.buffer = buffer
+        self._name_start = name_start
+        self._name_end = name_end
+        #: The offset in `buffer` at which the value begins
+        self.start = start
+        #: The offset in `buffer` at which the value ends
+        self.end = end
+        self._folded = folded
+        self._name: str | None = None
+        self._value: str | None = None
+
+    @property
+    def name(self) -> str | None:
+        """The field name, or `None` if this view represents a message body"""
+        if self._name is None and self._name_start >= 0:
+            self._name = self.buffer[self._name_start : self._name_end]
+        return self._name
+
+    @property
+    def value(self) -> str:
+        """
+        The field value, with line endings in folded values converted to
+        ``"\\n"`` as by `scan()`, or the message body
+        """
+        if self._value is None:
+            v = self.buffer[self.start : self.end]
+            if self._folded:
+                v = EOL.sub("\n", v)
+            self._value = v
+        return self._value
+
+    def __iter__(self) -> Iterator[Any]:
+        yield self.name
+        yield self.value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (FieldView, tuple)):
+            return (self.name, self.value) == tuple(other)
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.value))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}(name={self.name!r}, value={self.value!r})"
+
+
+def scan_stanza(
+    buf: str, pos: int, separator_regex: re.Pattern[str], skip_leading_newlines: bool
+) -> tuple[list[FieldView], int, bool]:
+    """
+    Scan the stanza in ``buf`` starting at offset ``pos``.  Returns the fields,
+    the offset just past the terminating blank line (or the end of ``buf``),
+    and whether a terminating blank line was found.
+    """
+    fields: list[FieldView] = []
+    size = len(buf)
+    begun = False
+    name_start = name_end = value_start = value_end = -1
+    folded = False
+    while pos < size:
+        m = EOL.search(buf, pos)
+        if m is None:
+            eol = nxt = size
+        else:
+            eol, nxt = m.span()
+        if buf.startswith((" ", "\t"), pos, eol):
+            begun = True
+            if name_start < 0:
+                raise UnexpectedFoldingError(buf[pos:eol])
+            value_end = eol
+            folded = True
+        elif eol == pos:
+            if skip_leading_newlines and not begun:
+                pos = nxt
+                continue
+            if name_start >= 0:
+                fields.append(
+                    FieldView(buf, name_start, name_end, value_start, value_end, folded)
+                )
+            return (fields, nxt, True)
+        else:
+            sm = separator_regex.search(buf, pos, eol)
+            if sm is None:
+                raise MalformedHeaderError(buf[pos:eol])
+            begun = True
+            if name_start >= 0:
+                fields.append(
+                    FieldView(buf, name_start, name_end, value_start, value_end, folded)
+                )
+            name_start = pos
+            name_end, value_start = sm.span()
+            value_end = eol
+            folded = False
+        pos = nxt
+    if name_start >= 0:
+        fields.append(
+            FieldView(buf, name_start, name_end, value_start, value_end, folded)
+        )
+    return (fields, pos, False)
+
+
+def scan_views(
+    data: str,
+    *,
+    separator_regex: RgxType | None = None,
+    skip_leading_newlines: bool = False,
+) -> Iterator[FieldView]:
+    """
+    .. versionadded:: 0.6.0
+
+    Like `scan()`, but ``data`` must be a string, and the fields (and body, if
+    any) are returned as `FieldView` instances whose names and values are only
+    sliced out of ``data`` when accessed.  Because ``data`` is scanned in
+    place instead of first being split into lines, peak memory stays small
+    even for large strings.  This is not a speedup, though: scanning input
+    that is already split into lines with `scan()` is faster, even when the
+    views' names and values are never accessed.
+
+    ``separator_regex`` is matched against ``data`` in place, starting at the
+    beginning of each line, so a ``^`` anchor or a lookbehind assertion in it
+    will not see line boundaries.
+
+    :param str data: the text to scan
+    :param separator_regex: as for the `Scanner` constructor
+    :param bool skip_leading_newlines: as for the `Scanner` constructor
+    :rtype: generator of `FieldView`
+    :raises ScannerError: if the header section is malformed
+    """
+    fields, pos, more_left = scan_stanza(
+        data, 0, convert_sep(separator_regex), skip_leading_newlines
+    )
+    yield from fields
+    if more_left:
+        yield FieldView(data, -1, -1, pos, len(data))
+
+
+def scan_stanza_views(
+    data: str,
+    *,
+    separator_regex: RgxType | None = None,
+    skip_leading_newlines: bool = False,
+) -> Iterator[list[FieldView]]:
+    """
+    .. versionadded:: 0.6.0
+
+    Like `scan_stanzas()`, but ``data`` must be a string, and each stanza is
+    returned as a list of `FieldView` instances whose names and values are
+    only sliced out of ``data`` when accessed.  The same caveat about
+    ``separator_regex`` applies as for `scan_views()`.
+
+    :param str data: the text to scan
+    :param separator_regex: as for the `Scanner` constructor
+    :param bool skip_leading_newlines: as for the `Scanner` constructor
+    :rtype: generator of lists of `FieldView`
+    :raises ScannerError: if a header section is malformed
+    """
+    sep = convert_sep(separator_regex)
+    pos = 0
+    more_left = True
+    skip = skip_leading_newlines
+    while more_left:
+        fields, pos, more_left = scan_stanza(data, pos, sep, skip)
+        if fields or more_left:
+            yield fields
+        skip = True
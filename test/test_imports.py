@@ -0,0 +1,70 @@
+from __future__ import annotations
+import subprocess
+import sys
+import pytest
+import headerparser
+from headerparser import HeaderParser, scan_string
+
+
+def imported_modules(statement: str) -> set[str]:
+    r = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{statement}\nprint('\\n'.join(sys.modules))",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return set(r.stdout.splitlines())
+
+
+def test_import_is_lazy() -> None:
+    modules = imported_modules("import headerparser")
+    assert "headerparser.scanner" in modules
+    for mod in ["attr", "deprecated", "wrapt", "headerparser.parser", "zipfile"]:
+        assert mod not in modules
+
+
+def test_import_header_parser() -> None:
+    modules = imported_modules("from headerparser import HeaderParser")
+    assert "headerparser.parser" in modules
+    for mod in ["deprecated", "headerparser.bulk", "concurrent.futures"]:
+        assert mod not in modules
+
+
+def test_lazy_attrs() -> None:
+    from headerparser.parser import HeaderParser as HP
+
+    assert headerparser.HeaderParser is HP
+    assert "HeaderParser" in dir(headerparser)
+    for name in headerparser.__all__:
+        assert hasattr(headerparser, name)
+    with pytest.raises(AttributeError) as excinfo:
+        headerparser.NoSuchThing  # noqa: B018
+    assert str(excinfo.value) == (
+        "module 'headerparser' has no attribute 'NoSuchThing'"
+    )
+
+
+def test_deprecated_function() -> None:
+    with pytest.deprecated_call() as record:
+        assert list(scan_string("Foo: bar\n")) == [("Foo", "bar")]
+    assert str(record[0].message) == (
+        "Call to deprecated function (or staticmethod) scan_string. (use scan()"
+        " instead) -- Deprecated since version 0.5.0."
+    )
+    assert record[0].filename == __file__
+
+
+def test_deprecated_method() -> None:
+    parser = HeaderParser()
+    parser.add_field("Foo")
+    with pytest.deprecated_call() as record:
+        assert parser.parse_string("Foo: bar\n") == {"Foo": "bar"}
+    assert str(record[0].message) == (
+        "Call to deprecated method parse_string. (use parse() instead) --"
+        " Deprecated since version 0.5.0."
+    )
+    assert record[0].filename == __file__
@@ -0,0 +1,145 @@
+from __future__ import annotations
+import threading
+import time
+import pytest
+from headerparser import LazyNormalizedDict, NormalizedDict
+
+
+class Thunk:
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self.calls = 0
+
+    def __call__(self) -> object:
+        self.calls += 1
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+def test_defer() -> None:
+    nd = LazyNormalizedDict({"Foo": "bar"})
+    thunk = Thunk(42)
+    nd.defer("Size", thunk)
+    assert list(nd) == ["Foo", "Size"]
+    assert len(nd) == 2
+    assert "size" in nd
+    assert nd.is_deferred("SIZE")
+    assert thunk.calls == 0
+    assert nd["size"] == 42
+    assert nd["Size"] == 42
+    assert thunk.calls == 1
+    assert not nd.is_deferred("Size")
+    assert nd.deferred("Size") is None
+
+
+def test_repr() -> None:
+    nd = LazyNormalizedDict({"Foo": "bar"}, body="Body")
+    thunk = Thunk(ValueError("bad"))
+    nd.defer("Size", thunk)
+    assert repr(nd) == (
+        "headerparser.normdict.LazyNormalizedDict({'Foo': 'bar', 'Size':"
+        f" <deferred>}}, normalizer={nd.normalizer!r}, body='Body')"
+    )
+    assert thunk.calls == 0
+    assert nd.is_deferred("Size")
+    nd.defer("Size", Thunk(42))
+    nd["Size"]
+    assert "'Size': 42" in repr(nd)
+
+
+def test_deferred() -> None:
+    nd = LazyNormalizedDict({"Foo": "bar"})
+    thunk = Thunk(42)
+    nd.defer("Size", thunk)
+    assert nd.deferred("size") is thunk
+    assert nd.deferred("Foo") is None
+    assert nd.deferred("Bar") is None
+
+
+def test_defer_error_stays_deferred() -> None:
+    nd = LazyNormalizedDict()
+    thunk = Thunk(ValueError("bad"))
+    nd.defer("Size", thunk)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            nd["Size"]
+    assert thunk.calls == 2
+    assert nd.is_deferred("Size")
+    with pytest.raises(ValueError):
+        nd.validate()
+
+
+def test_set_and_del_deferred() -> None:
+    nd = LazyNormalizedDict()
+    nd.defer("Foo", Thunk(ValueError("bad")))
+    nd["FOO"] = 1
+    assert not nd.is_deferred("foo")
+    assert dict(nd) == {"FOO": 1}
+    nd.defer("Bar", Thunk(2))
+    del nd["bar"]
+    assert dict(nd) == {"FOO": 1}
+    assert not nd.is_deferred("bar")
+
+
+def test_validate_order() -> None:
+    nd = LazyNormalizedDict()
+    nd.defer("A", Thunk(ValueError("a")))
+    nd.defer("B", Thunk(TypeError("b")))
+    with pytest.raises(ValueError):
+        nd.validate()
+
+
+def test_materialize() -> None:
+    nd = LazyNormalizedDict({"Foo": "bar"}, body="Body")
+    nd.defer("Size", Thunk(42))
+    md = nd.materialize()
+    assert type(md) is NormalizedDict
+    assert md == NormalizedDict({"Foo": "bar", "Size": 42}, body="Body")
+    assert not nd.is_deferred("Size")
+
+
+def test_eq_and_copy() -> None:
+    nd = LazyNormalizedDict()
+    nd.defer("Size", Thunk(42))
+    dup = nd.copy()
+    assert isinstance(dup, LazyNormalizedDict)
+    assert dup.is_deferred("Size")
+    assert nd == {"size": 42}
+    assert not nd.is_deferred("Size")
+    assert dup.is_deferred("Size")
+    assert dup.normalized_dict() == {"size": 42}
+
+
+def test_concurrent_reads() -> None:
+    calls: list[None] = []
+    barrier = threading.Barrier(4)
+
+    def compute() -> int:
+        calls.append(None)
+        time.sleep(0.01)
+        return 42
+
+    for _ in range(10):
+        nd = LazyNormalizedDict()
+        nd.defer("X", compute)
+        nd.defer("Y", compute)
+        results: list[object] = []
+
+        def read(nd: LazyNormalizedDict = nd, results: list[object] = results) -> None:
+            barrier.wait()
+            try:
+                results.append(nd["x"])
+                nd.validate()
+            except Exception as e:  # pragma: no cover
+                results.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [42] * 4
+        assert nd == {"X": 42, "Y": 42}
+        assert not nd.is_deferred("X")
+    assert calls
@@ -0,0 +1,81 @@
+from __future__ import annotations
+from io import BytesIO
+from pathlib import Path
+from zipfile import BadZipFile, ZipFile
+import pytest
+from headerparser import HeaderParser, NormalizedDict
+
+
+def make_wheel(path: Path | BytesIO, name: str) -> None:
+    with ZipFile(path, "w") as zf:
+        zf.writestr(f"{name}/__init__.py", "")
+        zf.writestr(
+            f"{name}/_vendor/dep-1.0.dist-info/METADATA",
+            "Metadata-Version: 2.1\nName: dep\n",
+        )
+        zf.writestr(
+            f"{name}-1.0.dist-info/METADATA",
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n\nA package.\n",
+        )
+        zf.writestr(f"{name}-1.0.dist-info/RECORD", "")
+
+
+def test_parse_archive(tmp_path: Path) -> None:
+    whl = tmp_path / "foo-1.0-py3-none-any.whl"
+    make_wheel(whl, "foo")
+    parser = HeaderParser()
+    parser.add_additional()
+    msg = parser.parse_archive(whl)
+    assert msg == NormalizedDict(
+        {"Metadata-Version": "2.1", "Name": "foo", "Version": "1.0"},
+        body="A package.\n",
+    )
+
+
+def test_parse_archive_fileobj_member() -> None:
+    buf = BytesIO()
+    make_wheel(buf, "foo")
+    parser = HeaderParser()
+    parser.add_additional()
+    msg = parser.parse_archive(buf, "foo/_vendor/*/METADATA")
+    assert dict(msg) == {"Metadata-Version": "2.1", "Name": "dep"}
+
+
+def test_parse_archive_no_member(tmp_path: Path) -> None:
+    whl = tmp_path / "foo-1.0-py3-none-any.whl"
+    make_wheel(whl, "foo")
+    parser = HeaderParser()
+    with pytest.raises(KeyError) as excinfo:
+        parser.parse_archive(whl, "*.egg-info/PKG-INFO")
+    assert excinfo.value.args == (
+        "no member matching '*.egg-info/PKG-INFO' found in archive",
+    )
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parse_archives(tmp_path: Path, executor: str) -> None:
+    paths = []
+    for i in range(10):
+        whl = tmp_path / f"pkg{i}-1.0-py3-none-any.whl"
+        make_wheel(whl, f"pkg{i}")
+        paths.append(whl)
+    notzip = tmp_path / "notzip.whl"
+    notzip.write_text("Name: nope\n")
+    paths.append(notzip)
+    parser = HeaderParser()
+    parser.add_field("Name")
+    parser.add_additional()
+    results = list(
+        parser.parse_archives(paths, workers=2, executor=executor, chunksize=4)
+    )
+    assert [p for p, _ in results] == paths
+    for i, (_, r) in enumerate(results[:-1]):
+        assert isinstance(r, NormalizedDict)
+        assert r["Name"] == f"pkg{i}"
+    assert isinstance(results[-1][1], BadZipFile)
+
+
+def test_parse_archives_bad_executor() -> None:
+    with pytest.raises(ValueError) as excinfo:
+        HeaderParser().parse_archives([], executor="fiber")
+    assert str(excinfo.value) == "executor must be 'thread' or 'process', not 'fiber'"
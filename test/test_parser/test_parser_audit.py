@@ -0,0 +1,145 @@
+from __future__ import annotations
+import pytest
+from headerparser import (
+    FieldTypeError,
+    HeaderParser,
+    MalformedHeaderError,
+    MissingFieldError,
+    Problem,
+    UnexpectedFoldingError,
+    UnknownFieldError,
+    ValidationReport,
+)
+
+DATA = (
+    "Name: a\n"  # 1
+    "Size: 1\n"
+    "\n"
+    "Name: b\n"  # 4
+    "Size: big\n"
+    "Color: red\n"
+    "\n"
+    "\n"
+    "Name: c\n"  # 9
+    "Bad line\n"  # 10
+    "Size: 3\n"
+    "\n"
+    "Size: 4\n"  # 13
+    "\n"
+    " folded\n"  # 15
+    "Name: e\n"
+)
+
+
+def test_audit_stanzas() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    report = parser.audit_stanzas(DATA)
+    assert report.stanzas == 5
+    assert report.invalid_stanzas == 4
+    assert report.total == 5
+    assert not report.ok
+    assert [(p.stanza, p.lineno, type(p.error)) for p in report.problems] == [
+        (1, 4, FieldTypeError),
+        (1, 4, UnknownFieldError),
+        (2, 10, MalformedHeaderError),
+        (3, 13, MissingFieldError),
+        (4, 15, UnexpectedFoldingError),
+    ]
+    assert report.by_type == {
+        "FieldTypeError": 1,
+        "UnknownFieldError": 1,
+        "MalformedHeaderError": 1,
+        "MissingFieldError": 1,
+        "UnexpectedFoldingError": 1,
+    }
+    assert report.by_field == {"Size": 1, "Color": 1, "Name": 1}
+
+
+def test_audit_stanzas_matches_validate() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    data = "Name: a\n\nSize: x\n\nName: c\nName: d\nColor: red\n"
+    report = parser.audit_stanzas(data)
+    expected = [
+        (i, type(e), str(e))
+        for i, errs in enumerate(parser.validate_stanzas(data))
+        for e in errs
+    ]
+    assert [(p.stanza, type(p.error), str(p.error)) for p in report.problems] == (
+        expected
+    )
+
+
+def test_audit_stanzas_ok() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    report = parser.audit_stanzas("Name: a\n\n\nName: b\nSize: 2\n")
+    assert report.ok
+    assert report.stanzas == 2
+    assert report.total == 0
+    assert report.problems == []
+    expected = ValidationReport()
+    expected.stanzas = 2
+    assert report == expected
+
+
+@pytest.mark.parametrize(
+    "data,stanzas,problems",
+    [
+        ("", 0, []),
+        ("\n", 1, [(0, 1, MissingFieldError)]),
+        ("Bad\n", 1, [(0, 1, MalformedHeaderError)]),
+        ("Bad\n\n", 1, [(0, 1, MalformedHeaderError)]),
+        ("Bad\n\nName: b\n", 2, [(0, 1, MalformedHeaderError)]),
+        ("Name: a\n\nBad", 2, [(1, 3, MalformedHeaderError)]),
+    ],
+)
+def test_audit_stanzas_edges(
+    data: str, stanzas: int, problems: list[tuple[int, int, type]]
+) -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    report = parser.audit_stanzas(data)
+    assert report.stanzas == stanzas
+    assert [(p.stanza, p.lineno, type(p.error)) for p in report.problems] == problems
+
+
+def test_audit_stanzas_max_problems() -> None:
+    data = "".join(f"Color{i}: x\nName: a\n\n" for i in range(10))
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    report = parser.audit_stanzas(data, max_problems=3)
+    assert report.total == 10
+    assert report.invalid_stanzas == 10
+    assert len(report.problems) == 3
+    assert report.problems[2] == Problem(2, 7, report.problems[2].error)
+    assert len(report.by_field) == 10
+
+
+def test_audit_stanzas_skip_leading_newlines() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    report = parser.audit_stanzas("\n\nSize: 1\n")
+    assert [(p.stanza, p.lineno) for p in report.problems] == [(0, 1), (1, 3)]
+    parser = HeaderParser(skip_leading_newlines=True)
+    parser.add_field("Name", required=True)
+    report = parser.audit_stanzas("\n\nSize: 1\n")
+    assert [(p.stanza, p.lineno) for p in report.problems] == [(0, 3), (0, 3)]
+
+
+def test_summary() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    report = parser.audit_stanzas(DATA)
+    summary = report.summary()
+    assert summary.startswith("5 stanzas checked, 4 invalid, 5 problems\n")
+    assert "    MalformedHeaderError: 1\n" in summary
+    assert "By field:\n" in summary
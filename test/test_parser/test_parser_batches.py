@@ -0,0 +1,60 @@
+from __future__ import annotations
+from typing import Any
+import pytest
+from headerparser import FieldTypeError, HeaderParser, ParseHook
+
+DATA = "".join(f"Name: pkg{i}\nSize: {i}\n\n" for i in range(7))
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 7, 10])
+def test_parse_stanza_batches(batch_size: int) -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    batches = list(parser.parse_stanza_batches(DATA, batch_size))
+    assert [len(b) for b in batches[:-1]] == [batch_size] * (len(batches) - 1)
+    assert [d for b in batches for d in b] == list(parser.parse_stanzas(DATA))
+
+
+def test_parse_stanza_batches_scanner_opts() -> None:
+    parser = HeaderParser(separator_regex=r"\s*=\s*")
+    parser.add_additional()
+    assert list(parser.parse_stanza_batches("a = 1\n\nb = 2\n", 5)) == [
+        [{"a": "1"}, {"b": "2"}]
+    ]
+
+
+def test_parse_stanza_batches_error() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    batches = parser.parse_stanza_batches(
+        "Name: a\n\nName: b\n\nName: c\nSize: big\n", 2
+    )
+    assert next(batches) == [{"Name": "a"}, {"Name": "b"}]
+    with pytest.raises(FieldTypeError):
+        next(batches)
+
+
+def test_parse_stanza_batches_bad_size() -> None:
+    with pytest.raises(ValueError):
+        HeaderParser().parse_stanza_batches(DATA, 0)
+
+
+def test_parse_stanza_batches_stats_and_hooks() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    stats = parser.enable_stats()
+    starts: list[int | None] = []
+
+    class Hook(ParseHook):
+        def on_parse_start(self, source: Any, stanza: int | None) -> None:
+            assert source is DATA
+            starts.append(stanza)
+
+    parser.add_hook(Hook())
+    assert sum(len(b) for b in parser.parse_stanza_batches(DATA, 3)) == 7
+    assert starts == list(range(7))
+    assert stats.phases["scan"].calls == 8
+    assert stats.phases["type"].calls == 7
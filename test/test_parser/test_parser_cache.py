@@ -0,0 +1,108 @@
+from __future__ import annotations
+import pickle
+import pytest
+from pytest_mock import MockerFixture
+from headerparser import CachedConverter, FieldTypeError, HeaderParser, memoize
+
+DATA = (
+    "Version: 1.0\nSize: 10\n\n"
+    "Version: 2.0\nSize: 10\n\n"
+    "Version: 1.0\nSize: 20\n\n"
+    "Version: 1.0\nSize: 10\n"
+)
+
+
+def parse_version(s: str) -> tuple[int, ...]:
+    return tuple(map(int, s.split(".")))
+
+
+def test_cache(mocker: MockerFixture) -> None:
+    conv = mocker.Mock(side_effect=parse_version)
+    parser = HeaderParser()
+    parser.add_field("Version", type=conv, cache=16)
+    parser.add_field("Size", type=int)
+    msgs = list(parser.parse_stanzas(DATA))
+    assert [m["Version"] for m in msgs] == [(1, 0), (2, 0), (1, 0), (1, 0)]
+    assert conv.call_args_list == [mocker.call("1.0"), mocker.call("2.0")]
+    info = parser.cache_info()
+    assert list(info) == ["Version"]
+    assert info["Version"].hits == 2
+    assert info["Version"].misses == 2
+    assert info["Version"].maxsize == 16
+    assert info["Version"].currsize == 2
+
+
+def test_cache_bounded(mocker: MockerFixture) -> None:
+    conv = mocker.Mock(side_effect=int)
+    parser = HeaderParser()
+    parser.add_field("Size", type=conv, cache=1)
+    parser.add_additional()
+    list(parser.parse_stanzas(DATA))
+    assert conv.call_count == 3
+    assert parser.cache_info()["Size"].currsize == 1
+
+
+def test_cache_additional() -> None:
+    parser = HeaderParser()
+    parser.add_additional(type=int, cache=8)
+    assert parser.parse("A: 1\nB: 1\nC: 2\n") == {"A": 1, "B": 1, "C": 2}
+    assert parser.cache_info()[None].hits == 1
+
+
+def test_cache_error() -> None:
+    parser = HeaderParser()
+    parser.add_field("Size", type=int, cache=8)
+    for _ in range(2):
+        with pytest.raises(FieldTypeError) as excinfo:
+            parser.parse("Size: big\n")
+        assert str(excinfo.value) == (
+            "Error while parsing 'Size': 'big': ValueError: invalid literal for"
+            " int() with base 10: 'big'"
+        )
+        assert excinfo.value.name == "Size"
+        assert excinfo.value.value == "big"
+        assert isinstance(excinfo.value.exc_value, ValueError)
+    assert parser.cache_info()["Size"].misses == 2
+
+
+def test_cache_without_type() -> None:
+    parser = HeaderParser()
+    with pytest.raises(ValueError) as excinfo:
+        parser.add_field("Size", cache=8)
+    assert str(excinfo.value) == "`cache` requires `type`"
+    assert parser.cache_info() == {}
+
+
+def test_memoize_type() -> None:
+    conv = memoize(parse_version, 4)
+    parser = HeaderParser()
+    parser.add_field("Version", type=conv)
+    parser.add_additional()
+    list(parser.parse_stanzas(DATA))
+    assert conv.cache_info().hits == 2
+    assert parser.cache_info()["Version"] == conv.cache_info()
+    conv.cache_clear()
+    assert conv.cache_info().currsize == 0
+
+
+def test_cached_converter() -> None:
+    conv = memoize(parse_version)
+    assert isinstance(conv, CachedConverter)
+    assert conv.maxsize == 1024
+    assert conv("1.2") == (1, 2)
+    assert conv == memoize(parse_version)
+    assert conv != memoize(parse_version, 10)
+    assert hash(conv) == hash(memoize(parse_version))
+    assert repr(conv).startswith("CachedConverter(func=<function parse_version")
+    copied = pickle.loads(pickle.dumps(conv))
+    assert copied == conv
+    assert copied.cache_info().currsize == 0
+    assert copied("1.2") == (1, 2)
+
+
+def test_cached_parser_eq() -> None:
+    p1 = HeaderParser()
+    p1.add_field("Version", type=parse_version, cache=16)
+    p2 = HeaderParser()
+    p2.add_field("Version", type=parse_version, cache=16)
+    assert p1 == p2
@@ -1,5 +1,7 @@
+from __future__ import annotations
+from pathlib import Path
 import pytest
-from headerparser import BOOL, HeaderParser, InvalidChoiceError
+from headerparser import BOOL, HeaderParser, InvalidChoiceError, load_choices
 
 
 def test_choices() -> None:
@@ -102,3 +104,49 @@ def test_bool_choices_invalid_choice() -> None:
     assert str(excinfo.value) == "True is not a valid choice for 'Boolean'"
     assert excinfo.value.name == "Boolean"
     assert excinfo.value.value is True
+
+
+def test_unhashable_choices() -> None:
+    parser = HeaderParser()
+    parser.add_field("Tags", type=str.split, choices=[["a", "b"], "c", ["d"]])
+    assert parser.parse("Tags: a b\n") == {"Tags": ["a", "b"]}
+    assert parser.parse("Tags: d\n") == {"Tags": ["d"]}
+    with pytest.raises(InvalidChoiceError) as excinfo:
+        parser.parse("Tags: c\n")
+    assert str(excinfo.value) == "['c'] is not a valid choice for 'Tags'"
+    assert excinfo.value.value == ["c"]
+
+
+def test_hashable_value_unhashable_choices() -> None:
+    parser = HeaderParser()
+    parser.add_field("Color", choices=[["red"], "green"])
+    assert parser.parse("Color: green\n") == {"Color": "green"}
+    with pytest.raises(InvalidChoiceError):
+        parser.parse("Color: red\n")
+
+
+def test_set_choices() -> None:
+    parser = HeaderParser()
+    choices = {f"choice-{i}" for i in range(1000)}
+    parser.add_field("Color", choices=choices, multiple=True)
+    assert parser.parse("Color: choice-999\nColor: choice-0\n") == {
+        "Color": ["choice-999", "choice-0"]
+    }
+    with pytest.raises(InvalidChoiceError) as excinfo:
+        parser.parse("Color: choice-1000\n")
+    assert excinfo.value.value == "choice-1000"
+
+
+def test_load_choices(tmp_path: Path) -> None:
+    path = tmp_path / "sections.txt"
+    path.write_text(
+        "# Debian sections\nadmin\n  devel  \n\nlibs\r\n# net\nlibs\n",
+        encoding="utf-8",
+    )
+    choices = load_choices(path)
+    assert choices == frozenset({"admin", "devel", "libs"})
+    parser = HeaderParser()
+    parser.add_field("Section", choices=choices)
+    assert parser.parse("Section: devel\n") == {"Section": "devel"}
+    with pytest.raises(InvalidChoiceError):
+        parser.parse("Section: net\n")
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any
+import pytest
+from headerparser import FieldTypeError, HeaderParser, NormalizedDict
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> list[Path]:
+    paths = []
+    for i in range(20):
+        p = tmp_path / f"file{i:02d}.txt"
+        if i == 7:
+            p.write_text("Name: seven\nSize: lots\n")
+        else:
+            p.write_text(f"Name: file {i}\nSize: {i}\n\nBody {i}\n")
+        paths.append(p)
+    paths.append(tmp_path / "nonexistent.txt")
+    return paths
+
+
+def check_results(
+    paths: list[Path], results: list[tuple[Path, NormalizedDict | Exception]]
+) -> None:
+    assert len(results) == len(paths)
+    for p, r in results:
+        if p.name == "file07.txt":
+            assert isinstance(r, FieldTypeError)
+            assert r.name == "Size"
+            assert r.value == "lots"
+        elif p.name == "nonexistent.txt":
+            assert isinstance(r, FileNotFoundError)
+        else:
+            i = int(p.stem[4:])
+            assert isinstance(r, NormalizedDict)
+            assert dict(r) == {"Name": f"file {i}", "Size": i}
+            assert r.body == f"Body {i}\n"
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parse_files_ordered(paths: list[Path], executor: str) -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    results = list(
+        parser.parse_files(paths, workers=2, executor=executor, chunksize=3)
+    )
+    assert [p for p, _ in results] == paths
+    check_results(paths, results)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parse_files_unordered(paths: list[Path], executor: str) -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    results = list(
+        parser.parse_files(
+            paths, workers=2, executor=executor, ordered=False, chunksize=3
+        )
+    )
+    assert sorted(p for p, _ in results) == sorted(paths)
+    check_results(paths, results)
+
+
+def test_parse_files_empty() -> None:
+    assert list(HeaderParser().parse_files([])) == []
+
+
+def test_parse_files_bad_executor(paths: list[Path]) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        HeaderParser().parse_files(paths, executor="fiber")
+    assert str(excinfo.value) == "executor must be 'thread' or 'process', not 'fiber'"
+
+
+@pytest.mark.parametrize(
+    "kwargs,msg",
+    [
+        ({"chunksize": 0}, "chunksize must be positive"),
+        ({"workers": 0}, "workers must be positive"),
+    ],
+)
+def test_parse_files_bad_args(
+    paths: list[Path], kwargs: dict[str, Any], msg: str
+) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        HeaderParser().parse_files(paths, **kwargs)
+    assert str(excinfo.value) == msg
@@ -0,0 +1,184 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any
+import pytest
+from headerparser import (
+    FieldTypeError,
+    HeaderParser,
+    MissingFieldError,
+    NormalizedDict,
+    ParseHook,
+)
+
+
+class RecordingHook(ParseHook):
+    def __init__(self) -> None:
+        self.events: list[tuple[Any, ...]] = []
+        self.starts = 0
+        self.sources: list[tuple[Any, int | None]] = []
+
+    def on_parse_start(self, source: Any, stanza: int | None) -> int:
+        self.starts += 1
+        self.sources.append((source, stanza))
+        self.events.append(("start", self.starts))
+        return self.starts
+
+    def on_field(self, ctx: Any, name: str, value: str, elapsed: float) -> None:
+        assert elapsed >= 0
+        self.events.append(("field", ctx, name, value))
+
+    def on_parse_end(
+        self,
+        ctx: Any,
+        result: NormalizedDict,
+        fields: int,
+        chars: int,
+        elapsed: float,
+    ) -> None:
+        assert elapsed >= 0
+        self.events.append(("end", ctx, dict(result), fields, chars))
+
+    def on_error(self, ctx: Any, exc: Exception, elapsed: float) -> None:
+        assert elapsed >= 0
+        self.events.append(("error", ctx, type(exc)))
+
+
+def test_hooks() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    hook = RecordingHook()
+    parser.add_hook(hook)
+    msg = parser.parse("Name: foo\nSize: 42\n\nBody.\n")
+    assert dict(msg) == {"Name": "foo", "Size": 42}
+    assert msg.body == "Body.\n"
+    assert hook.events == [
+        ("start", 1),
+        ("field", 1, "Name", "foo"),
+        ("field", 1, "Size", "42"),
+        ("end", 1, {"Name": "foo", "Size": 42}, 2, 11),
+    ]
+
+
+def test_hooks_stanzas() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name")
+    hook = RecordingHook()
+    parser.add_hook(hook)
+    assert list(parser.parse_stanzas("Name: foo\n\nName: quux\n")) == [
+        {"Name": "foo"},
+        {"Name": "quux"},
+    ]
+    assert hook.events == [
+        ("start", 1),
+        ("field", 1, "Name", "foo"),
+        ("end", 1, {"Name": "foo"}, 1, 3),
+        ("start", 2),
+        ("field", 2, "Name", "quux"),
+        ("end", 2, {"Name": "quux"}, 1, 4),
+    ]
+
+
+def test_hooks_error() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    hook = RecordingHook()
+    parser.add_hook(hook)
+    with pytest.raises(FieldTypeError):
+        parser.parse("Name: foo\nSize: big\n")
+    assert hook.events == [
+        ("start", 1),
+        ("field", 1, "Name", "foo"),
+        ("error", 1, FieldTypeError),
+    ]
+
+
+def test_hooks_missing_field() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    hook = RecordingHook()
+    parser.add_hook(hook)
+    with pytest.raises(MissingFieldError):
+        parser.parse("Size: 42\n")
+    assert hook.events == [
+        ("start", 1),
+        ("field", 1, "Size", "42"),
+        ("error", 1, MissingFieldError),
+    ]
+
+
+def test_multiple_hooks() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name")
+    hook1 = RecordingHook()
+    hook2 = RecordingHook()
+    parser.add_hook(hook1)
+    parser.add_hook(hook2)
+    parser.parse("Name: foo\n")
+    assert hook1.events == hook2.events
+    assert len(hook1.events) == 3
+
+
+def test_remove_hook() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name")
+    hook = RecordingHook()
+    parser.add_hook(hook)
+    parser.parse("Name: foo\n")
+    parser.remove_hook(hook)
+    parser.parse("Name: bar\n")
+    assert hook.starts == 1
+    with pytest.raises(ValueError):
+        parser.remove_hook(hook)
+
+
+def test_default_hook() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name")
+    parser.add_hook(ParseHook())
+    assert parser.parse("Name: foo\n") == {"Name": "foo"}
+
+
+def test_hooks_with_stats() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    stats = parser.enable_stats()
+    hook = RecordingHook()
+    parser.add_hook(hook)
+    parser.parse("Name: foo\nSize: 42\n")
+    assert stats.phases["type"].calls == 1
+    assert hook.events[-1] == ("end", 1, {"Name": "foo", "Size": 42}, 2, 5)
+
+
+def test_hooks_sources(tmp_path: Path) -> None:
+    parser = HeaderParser()
+    parser.add_field("Name")
+    hook = RecordingHook()
+    parser.add_hook(hook)
+    data = "Name: foo\n\nName: bar\n\nName: baz\n"
+    parser.parse("Name: foo\n")
+    assert hook.sources == [("Name: foo\n", None)]
+    hook.sources.clear()
+    list(parser.parse_stanzas(data))
+    assert hook.sources == [(data, 0), (data, 1), (data, 2)]
+    hook.sources.clear()
+    parser.parse_stanzas_into(data, lambda _: None)
+    assert hook.sources == [(data, 0), (data, 1), (data, 2)]
+    hook.sources.clear()
+    list(parser.parse_stanza_batches(data, 2))
+    assert hook.sources == [(data, 0), (data, 1), (data, 2)]
+    hook.sources.clear()
+    parser.parse_stream([("Name", "foo")])
+    list(parser.parse_stanzas_stream([[("Name", "foo")], [("Name", "bar")]]))
+    assert hook.sources == [(None, None), (None, 0), (None, 1)]
+    hook.sources.clear()
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"file{i}.txt"
+        p.write_text(f"Name: file {i}\n")
+        paths.append(p)
+    list(parser.parse_files(paths, workers=2))
+    assert sorted(hook.sources) == [(p, None) for p in paths]
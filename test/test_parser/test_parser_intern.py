@@ -0,0 +1,99 @@
+from __future__ import annotations
+import pickle
+from headerparser import HeaderParser
+from headerparser.util import InternPool
+
+DATA = (
+    "Package: foo\nArchitecture: amd64\nPriority: optional\n\n"
+    "Package: bar\nArchitecture: amd64\nPriority: optional\n\n"
+    "Package: baz\nArchitecture: all\nPriority: optional\n"
+)
+
+
+def test_intern_values() -> None:
+    parser = HeaderParser()
+    parser.add_field("Package")
+    parser.add_field("Architecture", intern=True)
+    parser.add_field("Priority", intern=True)
+    foo, bar, baz = parser.parse_stanzas(DATA)
+    assert foo == {"Package": "foo", "Architecture": "amd64", "Priority": "optional"}
+    assert foo["Architecture"] is bar["Architecture"]
+    assert foo["Priority"] is bar["Priority"] is baz["Priority"]
+    assert baz["Architecture"] == "all"
+    assert len(parser._intern_pool) == 3
+
+
+def test_intern_disabled() -> None:
+    parser = HeaderParser()
+    parser.add_field("Package")
+    parser.add_field("Architecture", intern=False)
+    parser.add_additional()
+    foo, bar, _ = parser.parse_stanzas(DATA)
+    assert foo["Architecture"] == bar["Architecture"]
+    assert foo["Architecture"] is not bar["Architecture"]
+    assert foo["Priority"] is not bar["Priority"]
+    assert len(parser._intern_pool) == 0
+
+
+def test_intern_additional_and_names() -> None:
+    parser = HeaderParser(intern_names=True)
+    parser.add_field("Package")
+    parser.add_additional(intern=True, multiple=True)
+    foo, bar, _ = parser.parse_stanzas(DATA)
+    assert foo["Priority"] == ["optional"]
+    assert foo["Priority"][0] is bar["Priority"][0]
+    foo_keys = list(foo)
+    bar_keys = list(bar)
+    assert foo_keys[1] is bar_keys[1]
+    assert foo_keys[2] is bar_keys[2]
+
+
+def test_intern_typed_value() -> None:
+    parser = HeaderParser()
+    parser.add_field("Size", type=int, intern=True)
+    parser.add_field("Name", type=str.lower, intern=True)
+    a = parser.parse("Size: 42\nName: FOO\n")
+    b = parser.parse("Size: 42\nName: Foo\n")
+    assert a == b == {"Size": 42, "Name": "foo"}
+    assert a["Name"] is b["Name"]
+    assert len(parser._intern_pool) == 1
+
+
+def test_intern_pool_size() -> None:
+    parser = HeaderParser(intern_pool_size=1)
+    parser.add_field("Package", intern=True)
+    parser.add_field("Architecture", intern=True)
+    parser.add_field("Priority")
+    foo, bar, _ = parser.parse_stanzas(DATA)
+    assert foo["Package"] is parser._intern_pool("foo")
+    assert foo["Architecture"] is not bar["Architecture"]
+    assert len(parser._intern_pool) == 1
+
+
+def test_intern_pool() -> None:
+    pool = InternPool(2)
+    a = "".join(["am", "d64"])
+    b = "".join(["amd", "64"])
+    assert a is not b
+    assert pool(a) is a
+    assert pool(b) is a
+    assert pool("x") == "x"
+    assert pool("y") == "y"
+    assert len(pool) == 2
+    assert pool == InternPool(2)
+    assert pool != InternPool(3)
+    assert repr(pool) == "InternPool(maxsize=2)"
+    copied = pickle.loads(pickle.dumps(pool))
+    assert copied == pool
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_parser_eq_ignores_pool_contents() -> None:
+    p1 = HeaderParser()
+    p1.add_field("Priority", intern=True)
+    p2 = HeaderParser()
+    p2.add_field("Priority", intern=True)
+    p1.parse("Priority: optional\n")
+    assert p1 == p2
+    assert HeaderParser(intern_pool_size=10) != HeaderParser()
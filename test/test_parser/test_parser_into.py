@@ -0,0 +1,61 @@
+from __future__ import annotations
+import pytest
+from headerparser import (
+    HeaderParser,
+    MissingFieldError,
+    NormalizedDict,
+    ParseHook,
+)
+
+DATA = "Name: foo\nSize: 1\n\nName: bar\n\n\nName: baz\nSize: 3\n"
+
+
+def test_parse_stanzas_into() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    results: list[NormalizedDict] = []
+    assert parser.parse_stanzas_into(DATA, results.append) == 3
+    assert results == list(parser.parse_stanzas(DATA))
+
+
+def test_parse_stanzas_into_empty() -> None:
+    results: list[NormalizedDict] = []
+    assert HeaderParser().parse_stanzas_into("", results.append) == 0
+    assert results == []
+
+
+def test_parse_stanzas_into_error() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    results: list[NormalizedDict] = []
+    with pytest.raises(MissingFieldError):
+        parser.parse_stanzas_into("Name: foo\n\nSize: 2\n", results.append)
+    assert results == [{"Name": "foo"}]
+
+
+def test_parse_stanzas_into_instrumented() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    stats = parser.enable_stats()
+    ends: list[int] = []
+
+    class Hook(ParseHook):
+        def on_parse_end(
+            self,
+            ctx: object,
+            result: NormalizedDict,
+            fields: int,
+            chars: int,
+            elapsed: float,
+        ) -> None:
+            ends.append(fields)
+
+    parser.add_hook(Hook())
+    results: list[NormalizedDict] = []
+    assert parser.parse_stanzas_into(DATA, results.append) == 3
+    assert ends == [2, 1, 2]
+    assert stats.phases["type"].calls == 2
+    assert len(results) == 3
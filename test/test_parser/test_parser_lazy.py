@@ -0,0 +1,170 @@
+from __future__ import annotations
+from typing import Any
+import pytest
+from headerparser import (
+    BOOL,
+    DuplicateFieldError,
+    FieldTypeError,
+    HeaderParser,
+    InvalidChoiceError,
+    LazyNormalizedDict,
+    MissingFieldError,
+    NormalizedDict,
+    UnknownFieldError,
+)
+
+DATA = (
+    "Name: pkg\n"
+    "Size: 42\n"
+    "Essential: yes\n"
+    "Description: a\n"
+    "  folded value\n"
+    "Depends: foo\n"
+    "Depends: bar\n"
+    "\n"
+    "Body\n"
+)
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, s: str) -> int:
+        self.calls.append(s)
+        return int(s)
+
+
+def lazy_parse(parser: HeaderParser, data: str) -> LazyNormalizedDict:
+    msg = parser.parse(data)
+    assert isinstance(msg, LazyNormalizedDict)
+    return msg
+
+
+def test_lazy_same_result() -> None:
+    parsers = []
+    for lazy in (True, False):
+        parser = HeaderParser(lazy=lazy)
+        parser.add_field("Name", required=True)
+        parser.add_field("Size", type=int)
+        parser.add_field("Essential", type=BOOL, default=False)
+        parser.add_field("Description", unfold=True)
+        parser.add_field("Depends", type=str.upper, multiple=True)
+        parsers.append(parser)
+    msg = lazy_parse(parsers[0], DATA)
+    assert msg.is_deferred("Size")
+    assert not msg.is_deferred("Name")
+    assert msg == parsers[1].parse(DATA)
+    assert msg["Depends"] == ["FOO", "BAR"]
+    assert msg["Description"] == "a folded value"
+    assert msg.body == "Body\n"
+
+
+def test_lazy_converts_on_access() -> None:
+    counter = Counter()
+    parser = HeaderParser(lazy=True)
+    parser.add_field("Size", type=counter)
+    parser.add_additional(multiple=True)
+    msg = lazy_parse(parser, DATA)
+    assert counter.calls == []
+    assert "Size" in msg
+    assert counter.calls == []
+    assert msg["size"] == 42
+    assert msg["SIZE"] == 42
+    assert counter.calls == ["42"]
+
+
+def test_lazy_type_error() -> None:
+    parser = HeaderParser(lazy=True)
+    parser.add_field("Name")
+    parser.add_field("Size", type=int)
+    msg = lazy_parse(parser, "Name: pkg\nSize: big\n")
+    assert msg["Name"] == "pkg"
+    with pytest.raises(FieldTypeError) as excinfo:
+        msg["Size"]
+    assert excinfo.value.name == "Size"
+    assert excinfo.value.value == "big"
+    with pytest.raises(FieldTypeError):
+        msg.validate()
+    with pytest.raises(FieldTypeError):
+        msg.materialize()
+
+
+def test_lazy_choices_error() -> None:
+    parser = HeaderParser(lazy=True)
+    parser.add_field("Name")
+    parser.add_field("Priority", choices=["low", "high"])
+    msg = lazy_parse(parser, "Name: pkg\nPriority: medium\n")
+    with pytest.raises(InvalidChoiceError):
+        msg.validate()
+
+
+def test_lazy_materialize() -> None:
+    parser = HeaderParser(lazy=True)
+    parser.add_field("Size", type=int)
+    parser.add_field("Essential", type=BOOL)
+    parser.add_field("Description", unfold=True)
+    parser.add_field("Depends", multiple=True)
+    parser.add_additional()
+    msg = lazy_parse(parser, DATA).materialize()
+    assert type(msg) is NormalizedDict
+    assert dict(msg) == {
+        "Name": "pkg",
+        "Size": 42,
+        "Essential": True,
+        "Description": "a folded value",
+        "Depends": ["foo", "bar"],
+    }
+    assert msg.body == "Body\n"
+
+
+@pytest.mark.parametrize(
+    "data,exc",
+    [
+        ("Size: 1\n", MissingFieldError),
+        ("Name: a\nSize: 1\nSize: 2\n", DuplicateFieldError),
+        ("Name: a\nColor: red\n", UnknownFieldError),
+    ],
+)
+def test_lazy_eager_errors(data: str, exc: type[Exception]) -> None:
+    parser = HeaderParser(lazy=True)
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    with pytest.raises(exc):
+        parser.parse(data)
+
+
+def test_lazy_action_is_eager() -> None:
+    seen: list[Any] = []
+
+    def action(d: NormalizedDict, name: str, value: Any) -> None:
+        seen.append(value)
+        d[name] = value
+
+    parser = HeaderParser(lazy=True)
+    parser.add_field("Size", type=int, action=action)
+    msg = lazy_parse(parser, "Size: 3\n")
+    assert seen == [3]
+    assert not msg.is_deferred("Size")
+
+
+def test_lazy_additional_and_intern() -> None:
+    parser = HeaderParser(lazy=True)
+    parser.add_additional(type=str.strip, multiple=True, intern=True)
+    msg = lazy_parse(parser, "Arch: amd64\narch: i386\n")
+    assert msg.is_deferred("ARCH")
+    assert msg == {"Arch": ["amd64", "i386"]}
+
+
+def test_lazy_stanzas() -> None:
+    parser = HeaderParser(lazy=True)
+    parser.add_field("Name")
+    parser.add_field("Size", type=int)
+    data = "Name: a\nSize: 1\n\nName: b\nSize: x\n"
+    stanzas = list(parser.parse_stanzas(data))
+    assert stanzas[0]["Size"] == 1
+    assert isinstance(stanzas[1], LazyNormalizedDict)
+    with pytest.raises(FieldTypeError):
+        stanzas[1].validate()
+    batches = list(parser.parse_stanza_batches(data, 2))
+    assert all(isinstance(d, LazyNormalizedDict) for d in batches[0])
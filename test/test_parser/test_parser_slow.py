@@ -0,0 +1,112 @@
+from __future__ import annotations
+import threading
+from typing import Any
+import pytest
+from headerparser import (
+    FieldTypeError,
+    HeaderParser,
+    InvalidChoiceError,
+    NormalizedDict,
+    ParseHook,
+)
+
+DATA = "".join(f"Name: pkg{i}\nSize: {i}\n\n" for i in range(10))
+
+
+class Lookup:
+    """A thread-recording converter"""
+
+    def __init__(self) -> None:
+        self.threads: set[int] = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, s: str) -> int:
+        with self.lock:
+            self.threads.add(threading.get_ident())
+        return int(s)
+
+
+def test_slow_results() -> None:
+    lookup = Lookup()
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=lookup, slow=True)
+    batches = list(parser.parse_stanza_batches(DATA, 4, workers=3))
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert [d for b in batches for d in b] == [
+        {"Name": f"pkg{i}", "Size": i} for i in range(10)
+    ]
+    assert threading.get_ident() not in lookup.threads
+
+
+def test_slow_concurrent() -> None:
+    barrier = threading.Barrier(2, timeout=10)
+
+    def wait(s: str) -> str:
+        barrier.wait()
+        return s.upper()
+
+    parser = HeaderParser()
+    parser.add_field("Name", type=wait, slow=True)
+    assert list(parser.parse_stanza_batches("Name: a\n\nName: b\n", 2, workers=2)) == [
+        [{"Name": "A"}, {"Name": "B"}]
+    ]
+
+
+def test_slow_first_error() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name")
+    parser.add_field("Size", type=int, slow=True)
+    batches = parser.parse_stanza_batches(
+        "Name: a\nSize: 1\n\nName: b\nSize: x\n\nName: c\nSize: y\n", 3
+    )
+    with pytest.raises(FieldTypeError) as excinfo:
+        next(batches)
+    assert excinfo.value.name == "Size"
+    assert excinfo.value.value == "x"
+    assert isinstance(excinfo.value.exc_value, ValueError)
+
+
+def test_slow_field_type_error_passthrough() -> None:
+    e = FieldTypeError("Other", "v", ValueError("nope"))
+
+    def convert(_: str) -> Any:
+        raise e
+
+    parser = HeaderParser()
+    parser.add_additional(type=convert, slow=True)
+    with pytest.raises(FieldTypeError) as excinfo:
+        list(parser.parse_stanza_batches("Foo: bar\n", 1))
+    assert excinfo.value is e
+
+
+def test_slow_unfold_choices_action() -> None:
+    seen: list[tuple[str, Any]] = []
+
+    def action(d: NormalizedDict, name: str, value: Any) -> None:
+        assert threading.current_thread() is threading.main_thread()
+        seen.append((name, value))
+
+    parser = HeaderParser()
+    parser.add_field(
+        "Words", type=str.split, unfold=True, slow=True, multiple=True, action=action
+    )
+    parser.add_field("Size", type=int, choices=[1, 2], slow=True)
+    assert list(
+        parser.parse_stanza_batches("Words: a\n b\nSize: 1\nWords: c\n\nSize: 2\n", 2)
+    ) == [[{"Size": 1}, {"Size": 2}]]
+    assert seen == [("Words", ["a", "b"]), ("Words", ["c"])]
+    with pytest.raises(InvalidChoiceError):
+        list(parser.parse_stanza_batches("Size: 3\n", 2))
+
+
+def test_slow_with_hooks() -> None:
+    lookup = Lookup()
+    parser = HeaderParser()
+    parser.add_field("Name")
+    parser.add_field("Size", type=lookup, slow=True)
+    parser.add_hook(ParseHook())
+    assert [d for b in parser.parse_stanza_batches(DATA, 4) for d in b] == list(
+        parser.parse_stanzas(DATA)
+    )
+    assert lookup.threads == {threading.get_ident()}
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import pickle
+import pytest
+from pytest_mock import MockerFixture
+from headerparser import (
+    FieldTypeError,
+    HeaderParser,
+    ParseStats,
+    PhaseStats,
+    Scanner,
+)
+
+
+def test_stats_disabled() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    assert parser.stats is None
+    parser.parse("Name: foo\nSize: 42\n")
+    assert parser.stats is None
+
+
+def test_stats() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    parser.add_field("Color", choices=["red", "green"], unfold=True)
+    parser.add_field(
+        "Tag", action=lambda d, _, v: d.setdefault("Tags", set()).add(v)
+    )
+    parser.add_additional()
+    stats = parser.enable_stats()
+    assert parser.enable_stats() is stats
+    assert parser.stats is stats
+    assert stats == ParseStats()
+    msgs = list(
+        parser.parse_stanzas(
+            "Name: foo\nSize: 42\nColor: red\nTag: a\nTag: b\n\n"
+            "Name: bar\nColor: green\nExtra: yes\n"
+        )
+    )
+    assert msgs == [
+        {"Name": "foo", "Size": 42, "Color": "red", "Tags": {"a", "b"}},
+        {"Name": "bar", "Color": "green", "Extra": "yes"},
+    ]
+    assert {k: v.calls for k, v in stats.phases.items()} == {
+        "scan": 2,
+        "normalize": 8,
+        "unfold": 2,
+        "type": 1,
+        "choices": 2,
+        "action": 2,
+        "store": 6,
+    }
+    assert all(v.time >= 0 for v in stats.phases.values())
+    calls = {f: {k: v.calls for k, v in fs.items()} for f, fs in stats.fields.items()}
+    assert calls == {
+        "Name": {"store": 2},
+        "Size": {"type": 1, "store": 1},
+        "Color": {"unfold": 2, "choices": 2, "store": 2},
+        "Tag": {"action": 2},
+        "Extra": {"store": 1},
+    }
+    d = stats.as_dict()
+    assert d["phases"]["scan"]["calls"] == 2
+    assert d["fields"]["Size"]["type"]["calls"] == 1
+    stats.reset()
+    assert stats == ParseStats()
+
+
+def test_stats_error() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    stats = parser.enable_stats()
+    with pytest.raises(FieldTypeError):
+        parser.parse("Name: foo\nSize: big\n")
+    assert stats.phases["type"].calls == 1
+    assert stats.fields["Size"] == {"type": stats.fields["Size"]["type"]}
+
+
+def test_disable_stats() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name")
+    stats = parser.enable_stats()
+    parser.parse("Name: foo\n")
+    parser.disable_stats()
+    assert parser.stats is None
+    parser.parse("Name: foo\n")
+    assert stats.phases["store"].calls == 1
+
+
+def test_slow_type(mocker: MockerFixture) -> None:
+    clock = mocker.patch(
+        "headerparser.stats.perf_counter", side_effect=[0.0, 0.5, 1.0, 4.0, 4.0, 4.25]
+    )
+    parser = HeaderParser()
+    parser.add_field("Size", type=int)
+    stats = parser.enable_stats()
+    msg = parser.parse_stream([("Size", "42")])
+    assert msg == {"Size": 42}
+    assert clock.call_count == 6
+    assert stats.phases == {
+        "normalize": PhaseStats(1, 0.5),
+        "type": PhaseStats(1, 3.0),
+        "store": PhaseStats(1, 0.25),
+    }
+    assert stats.fields == {
+        "Size": {"type": PhaseStats(1, 3.0), "store": PhaseStats(1, 0.25)}
+    }
+
+
+def test_scanner_stats() -> None:
+    stats = ParseStats()
+    sc = Scanner("Foo: bar\n\nBaz: quux\n", stats=stats)
+    assert list(sc.scan_stanzas()) == [[("Foo", "bar")], [("Baz", "quux")]]
+    assert stats.phases["scan"].calls == 2
+    assert stats.fields == {}
+
+
+def test_stats_pickle() -> None:
+    stats = ParseStats()
+    stats.add("type", 1.5, "Size")
+    stats2 = pickle.loads(pickle.dumps(stats))
+    assert stats2 == stats
+    stats2.add("type", 1.0, "Size")
+    assert stats2.fields["Size"]["type"] == PhaseStats(2, 2.5)
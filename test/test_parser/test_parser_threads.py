@@ -0,0 +1,25 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from headerparser import HeaderParser, NormalizedDict
+
+
+def test_shared_parser_threads() -> None:
+    parser = HeaderParser()
+    parser.add_field("Index", type=int, required=True)
+    parser.add_field("Tag", multiple=True)
+    parser.add_field("Description", unfold=True)
+
+    def task(i: int) -> list[NormalizedDict]:
+        data = "".join(
+            f"Index: {i * 100 + j}\nTag: a\nTag: b\nDescription: x\n  y\n\n\n"
+            for j in range(100)
+        )
+        return list(parser.parse_stanzas(data))
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(task, range(32)))
+    for i, stanzas in enumerate(results):
+        assert stanzas == [
+            {"Index": i * 100 + j, "Tag": ["a", "b"], "Description": "x y"}
+            for j in range(100)
+        ]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+from typing import Any
+import pytest
+from headerparser import (
+    BOOL,
+    BodyNotAllowedError,
+    DuplicateFieldError,
+    FieldTypeError,
+    HeaderParser,
+    InvalidChoiceError,
+    MalformedHeaderError,
+    MissingBodyError,
+    MissingFieldError,
+    NormalizedDict,
+    ParserError,
+    UnknownFieldError,
+)
+
+
+def describe(errs: list[ParserError]) -> list[tuple[type, str]]:
+    return [(type(e), str(e)) for e in errs]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "Name: a\n",
+        "Name: a\nSize: 1\nDepends: x\nDepends: y\n",
+        "Size: 1\n",
+        "Name: a\nSize: big\n",
+        "Name: a\nName: b\n",
+        "Name: a\nTitle: b\n",
+        "Name: a\nSize: x\nSize: y\n",
+        "Name: a\nColor: red\nShape: round\n",
+        "Name: a\nPriority: medium\nEssential: maybe\n",
+        "Name: a\nPriority:\n  high\n",
+        "Name: a\n\nBody\n",
+        "Color: red\nSize: x\n\nBody\n",
+    ],
+)
+@pytest.mark.parametrize("body", [None, True, False])
+def test_validate_matches_parse(data: str, body: bool | None) -> None:
+    parser = HeaderParser(body=body)
+    parser.add_field("Name", "Title", required=True)
+    parser.add_field("Size", type=int)
+    parser.add_field("Essential", type=BOOL, default=False)
+    parser.add_field("Priority", choices=["low", "high"], unfold=True)
+    parser.add_field("Depends", multiple=True)
+    errs = parser.validate(data)
+    try:
+        parser.parse(data)
+    except ParserError as e:
+        assert errs
+        assert (type(errs[0]), str(errs[0])) == (type(e), str(e))
+    else:
+        assert errs == []
+
+
+def test_validate_collects_all() -> None:
+    parser = HeaderParser(body=False)
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    parser.add_field("Priority", choices=["low", "high"])
+    errs = parser.validate(
+        "Size: x\nColor: red\nPriority: medium\nSize: 2\nShape: round\n\nBody\n"
+    )
+    assert describe(errs) == [
+        (FieldTypeError, str(errs[0])),
+        (UnknownFieldError, str(UnknownFieldError("Color"))),
+        (InvalidChoiceError, str(InvalidChoiceError("Priority", "medium"))),
+        (DuplicateFieldError, str(DuplicateFieldError("Size"))),
+        (UnknownFieldError, str(UnknownFieldError("Shape"))),
+        (BodyNotAllowedError, str(BodyNotAllowedError())),
+        (MissingFieldError, str(MissingFieldError("Name"))),
+    ]
+    assert isinstance(errs[0], FieldTypeError)
+    assert errs[0].value == "x"
+
+
+def test_validate_missing_body() -> None:
+    parser = HeaderParser(body=True)
+    parser.add_field("Name")
+    errs = parser.validate("Name: a\n")
+    assert describe(errs) == [(MissingBodyError, str(MissingBodyError()))]
+
+
+def test_validate_additional() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name")
+    parser.add_additional(type=int)
+    errs = parser.validate("Name: a\nX: 1\nx: 2\nY: y\nName: b\n")
+    assert describe(errs) == [
+        (DuplicateFieldError, str(DuplicateFieldError("x"))),
+        (FieldTypeError, str(errs[1])),
+        (DuplicateFieldError, str(DuplicateFieldError("Name"))),
+    ]
+
+
+def test_validate_does_not_call_actions() -> None:
+    calls: list[Any] = []
+
+    def action(d: NormalizedDict, name: str, value: Any) -> None:
+        calls.append(value)
+
+    parser = HeaderParser()
+    parser.add_field("Size", type=int, action=action)
+    assert parser.validate("Size: 1\nSize: 2\n") == []
+    assert parser.validate("Size: one\n") != []
+    assert calls == []
+
+
+def test_validate_stanzas() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    parser.add_field("Size", type=int)
+    assert [
+        describe(errs)
+        for errs in parser.validate_stanzas(
+            "Name: a\n\nSize: 1\n\nName: c\nColor: red\n"
+        )
+    ] == [
+        [],
+        [(MissingFieldError, str(MissingFieldError("Name")))],
+        [(UnknownFieldError, str(UnknownFieldError("Color")))],
+    ]
+
+
+def test_validate_stanzas_scanner_error() -> None:
+    parser = HeaderParser()
+    parser.add_field("Name", required=True)
+    results = parser.validate_stanzas("Name: a\n\nBad line\n")
+    assert next(results) == []
+    with pytest.raises(MalformedHeaderError):
+        next(results)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+from pathlib import Path
+from pytest_mock import MockerFixture
+from headerparser import Scanner, follow
+
+
+def test_follow_stanzas(tmp_path: Path, mocker: MockerFixture) -> None:
+    logfile = tmp_path / "records.log"
+    logfile.write_text("Foo: red\nBar: gre")
+    chunks = ["en\n\nFoo: blue\n", "Bar: yellow\n", "\n", ""]
+
+    def append(_: float) -> None:
+        with logfile.open("a") as fp:
+            fp.write(chunks.pop(0))
+
+    sleep = mocker.patch("headerparser.scanner.sleep", side_effect=append)
+    with logfile.open() as fp:
+        stanzas = Scanner(follow(fp)).scan_stanzas()
+        assert next(stanzas) == [("Foo", "red"), ("Bar", "green")]
+        assert sleep.call_count == 1
+        assert next(stanzas) == [("Foo", "blue"), ("Bar", "yellow")]
+        assert sleep.call_count == 3
+        assert chunks == [""]
+
+
+def test_follow_idle_timeout(tmp_path: Path, mocker: MockerFixture) -> None:
+    logfile = tmp_path / "records.log"
+    logfile.write_text("Foo: red\nBar: green")
+    sleep = mocker.patch("headerparser.scanner.sleep")
+    mocker.patch("headerparser.scanner.monotonic", side_effect=[0, 2, 5, 6])
+    with logfile.open() as fp:
+        lines = list(follow(fp, poll_interval=2, idle_timeout=5))
+    assert lines == ["Foo: red\n", "Bar: green"]
+    assert sleep.call_count == 2
+    sleep.assert_called_with(2)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+from array import array
+import math
+import pytest
+from headerparser import (
+    Columns,
+    DuplicateFieldError,
+    FieldTypeError,
+    scan_columns,
+)
+
+DATA = (
+    "Package: foo\nVersion: 1.0\nSize: 100\n\n"
+    "Package: bar\nSize: 2500\nEssential: yes\n\n\n"
+    "Package: baz\nVersion: 2.3\n"
+)
+
+
+def test_scan_columns() -> None:
+    cols = scan_columns(DATA)
+    assert isinstance(cols, Columns)
+    assert cols.rows == 3
+    assert list(cols) == ["Package", "Version", "Size", "Essential"]
+    assert dict(cols) == {
+        "Package": ["foo", "bar", "baz"],
+        "Version": ["1.0", None, "2.3"],
+        "Size": ["100", "2500", None],
+        "Essential": [None, "yes", None],
+    }
+    assert cols.row(1) == {"Package": "bar", "Size": "2500", "Essential": "yes"}
+    assert cols.row(-1) == {"Package": "baz", "Version": "2.3"}
+    with pytest.raises(IndexError):
+        cols.row(3)
+    assert repr(cols) == (
+        "Columns(rows=3, fields=['Package', 'Version', 'Size', 'Essential'])"
+    )
+
+
+def test_scan_columns_empty() -> None:
+    cols = scan_columns("")
+    assert cols.rows == 0
+    assert dict(cols) == {}
+
+
+def test_scan_columns_missing_marker() -> None:
+    marker = object()
+    cols = scan_columns(DATA, missing=marker)
+    assert cols["Version"] == ["1.0", marker, "2.3"]
+    assert cols.row(0) == {"Package": "foo", "Version": "1.0", "Size": "100"}
+
+
+def test_scan_columns_fields() -> None:
+    cols = scan_columns(DATA, fields=["Size", "Package", "Homepage"])
+    assert dict(cols) == {
+        "Size": ["100", "2500", None],
+        "Package": ["foo", "bar", "baz"],
+        "Homepage": [None, None, None],
+    }
+
+
+def test_scan_columns_typecodes() -> None:
+    cols = scan_columns(DATA, typecodes={"Size": "q", "Version": "d"})
+    assert cols["Size"] == array("q", [100, 2500, 0])
+    version = cols["Version"]
+    assert isinstance(version, array)
+    assert version[0] == 1.0
+    assert math.isnan(version[1])
+    assert version[2] == 2.3
+    assert cols.row(2)["Size"] == 0
+
+
+def test_scan_columns_fill() -> None:
+    cols = scan_columns(DATA, typecodes={"Size": "l"}, fill=-1)
+    assert cols["Size"] == array("l", [100, 2500, -1])
+
+
+@pytest.mark.parametrize(
+    "typecodes,name,value,stanza,exc_type",
+    [
+        ({"Package": "l"}, "Package", "foo", 0, ValueError),
+        ({"Size": "l", "Version": "l"}, "Version", "1.0", 0, ValueError),
+        ({"Size": "b"}, "Size", "2500", 1, OverflowError),
+    ],
+)
+def test_scan_columns_bad_value(
+    typecodes: dict[str, str],
+    name: str,
+    value: str,
+    stanza: int,
+    exc_type: type[Exception],
+) -> None:
+    with pytest.raises(FieldTypeError) as excinfo:
+        scan_columns(DATA, typecodes=typecodes)
+    assert excinfo.value.name == name
+    assert excinfo.value.value == value
+    assert excinfo.value.stanza == stanza
+    assert isinstance(excinfo.value.exc_value, exc_type)
+    assert str(excinfo.value).startswith(
+        f"Error while parsing {name!r} in stanza {stanza}: {value!r}:"
+    )
+
+
+def test_scan_columns_mask() -> None:
+    data = DATA + "\nPackage: quux\nSize: 0\n"
+    cols = scan_columns(data, typecodes={"Size": "q"})
+    assert cols["Size"] == array("q", [100, 2500, 0, 0])
+    assert cols.mask("Size") == array("B", [0, 0, 1, 0])
+    assert cols.mask("Version") == array("B", [0, 1, 0, 1])
+    assert cols.mask("Package") == array("B", [0, 0, 0, 0])
+    with pytest.raises(KeyError):
+        cols.mask("Homepage")
+    cols = scan_columns(data, fields=["Homepage"], typecodes={"Homepage": "d"})
+    assert cols.mask("Homepage") == array("B", [1, 1, 1, 1])
+
+
+def test_scan_columns_duplicate() -> None:
+    with pytest.raises(DuplicateFieldError) as excinfo:
+        scan_columns("Foo: 1\n\nFoo: 2\nFoo: 3\n")
+    assert excinfo.value.name == "Foo"
+
+
+def test_scan_columns_scanner_options() -> None:
+    cols = scan_columns("\n\nFoo = 1\n", separator_regex=r"\s*=\s*")
+    assert dict(cols) == {"Foo": [None, "1"]}
+    cols = scan_columns("\n\nFoo: 1\n", skip_leading_newlines=True)
+    assert dict(cols) == {"Foo": ["1"]}
+
+
+def test_to_numpy() -> None:
+    np = pytest.importorskip("numpy")
+    arrays = scan_columns(DATA, typecodes={"Size": "q"}).to_numpy()
+    assert arrays["Size"].dtype == np.dtype("q")
+    assert list(arrays["Size"]) == [100, 2500, 0]
+    assert arrays["Package"].dtype == np.dtype(object)
+    assert list(arrays["Version"]) == ["1.0", None, "2.3"]
+
+
+def test_to_pandas() -> None:
+    pytest.importorskip("pandas")
+    df = scan_columns(DATA, typecodes={"Size": "q"}).to_pandas()
+    assert list(df.columns) == ["Package", "Version", "Size", "Essential"]
+    assert list(df["Size"]) == [100, 2500, 0]
+    assert len(df) == 3
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import Any
+import pytest
+from headerparser import (
+    MalformedHeaderError,
+    Scanner,
+    ScannerCounters,
+    ScannerEOFError,
+    scan,
+    scan_into,
+    scan_stanzas,
+    scan_stanzas_into,
+)
+
+INPUTS = [
+    "",
+    "\n\n",
+    "Foo: red\nBar: green\n  and blue\n",
+    "Foo: red\n\nBody text\n",
+    "\nFoo: red\n\nBar: green\n\n\n",
+    "Foo: red\r\n\r\nBar: green\r\n\r\n\r\nBaz: blue",
+]
+
+
+@pytest.mark.parametrize("data", INPUTS)
+def test_scan_into(data: str) -> None:
+    fields: list[tuple[str | None, str]] = []
+    scan_into(data, lambda k, v: fields.append((k, v)))
+    assert fields == list(scan(data))
+
+
+@pytest.mark.parametrize("data", INPUTS[:3] + INPUTS[4:])
+@pytest.mark.parametrize("skip_leading_newlines", [False, True])
+def test_scan_stanzas_into(data: str, skip_leading_newlines: bool) -> None:
+    stanzas: list[list[tuple[str, str]]] = [[]]
+    n = scan_stanzas_into(
+        data,
+        lambda k, v: stanzas[-1].append((k, v)),
+        lambda: stanzas.append([]),
+        skip_leading_newlines=skip_leading_newlines,
+    )
+    assert stanzas.pop() == []
+    assert stanzas == list(
+        scan_stanzas(data, skip_leading_newlines=skip_leading_newlines)
+    )
+    assert n == len(stanzas)
+
+
+def test_scan_stanzas_into_no_end_callback() -> None:
+    fields: list[tuple[str, str]] = []
+    assert scan_stanzas_into("a: 1\n\nb: 2\n", lambda k, v: fields.append((k, v))) == 2
+    assert fields == [("a", "1"), ("b", "2")]
+
+
+def test_scan_stanzas_into_error() -> None:
+    fields: list[tuple[str, str]] = []
+    sc = Scanner("a: 1\n\nb: 2\nc\n")
+    with pytest.raises(MalformedHeaderError):
+        sc.scan_stanzas_into(lambda k, v: fields.append((k, v)))
+    assert fields == [("a", "1")]
+
+
+def test_scan_stanzas_into_eof() -> None:
+    sc = Scanner("a: 1\n")
+    assert sc.scan_stanzas_into(lambda _k, _v: None) == 1
+    with pytest.raises(ScannerEOFError):
+        sc.scan_stanzas_into(lambda _k, _v: None)
+    with pytest.raises(ScannerEOFError):
+        sc.scan_into(lambda _k, _v: None)
+
+
+def test_scan_stanzas_into_progress() -> None:
+    reports: list[ScannerCounters] = []
+    sc = Scanner("a: 1\n\nb: 2\n\nc: 3\n", progress=reports.append, progress_every=2)
+    seen: list[Any] = []
+    sc.scan_stanzas_into(lambda k, _: seen.append(k), lambda: seen.append(None))
+    assert seen == ["a", None, "b", None, "c", None]
+    assert [r.stanzas for r in reports] == [2, 3]
+    assert sc.counters.fields == 3
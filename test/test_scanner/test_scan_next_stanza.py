@@ -1,8 +1,10 @@
 from __future__ import annotations
+from typing import Any
 import pytest
 from headerparser import (
     Scanner,
     ScannerEOFError,
+    ScannerError,
     scan_next_stanza,
     scan_next_stanza_string,
 )
@@ -246,3 +248,37 @@ def test_scan_next_stanza(
     assert scan_next_stanza_string(
         "".join(lines), skip_leading_newlines=skip_leading_newlines
     ) == (fields, "".join(trailer))
+
+
+def first_stanza(sc: Scanner, via_generator: bool) -> Any:
+    try:
+        if via_generator:
+            return list(sc.scan_next_stanza())
+        else:
+            return next(sc.scan_stanzas())
+    except ScannerError as e:
+        return (type(e), str(e))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "Foo: red\nBad line\nBar: green\n",
+        " folded\nFoo: red\n",
+        "Foo: red\n  folded\nBad line\n",
+        "\n\n  folded\n",
+        "\n\nFoo: red\nBad\n\nBar: green\n",
+        "Foo: red\r\n\tfolded\r\n\r\nBar: green\n",
+    ],
+)
+@pytest.mark.parametrize("skip_leading_newlines", [False, True])
+def test_scan_next_stanza_matches_scan_stanzas(
+    data: str, skip_leading_newlines: bool
+) -> None:
+    results = []
+    for via_generator in [True, False]:
+        sc = Scanner(data, skip_leading_newlines=skip_leading_newlines)
+        # Only `scan_stanzas()` counts stanzas:
+        counters = sc.counters._replace(stanzas=0)
+        results.append((first_stanza(sc, via_generator), counters))
+    assert results[0] == results[1]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from io import StringIO
+import pytest
+from headerparser import MalformedHeaderError, Scanner, ScannerEOFError
+
+INPUT = (
+    "\n\nFoo: 1\nBar: a\n  b\n\n\n"
+    "Foo: 2\n\n"
+    "Foo: 3\r\nBar: c\r\n\r\n"
+    "Foo: 4\n\n"
+    "Foo: 5\n\n\n"
+)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 5, 100])
+@pytest.mark.parametrize("skip_leading_newlines", [False, True])
+def test_scan_stanza_batches(batch_size: int, skip_leading_newlines: bool) -> None:
+    expected = list(
+        Scanner(INPUT, skip_leading_newlines=skip_leading_newlines).scan_stanzas()
+    )
+    sc = Scanner(INPUT, skip_leading_newlines=skip_leading_newlines)
+    batches = list(sc.scan_stanza_batches(batch_size))
+    assert all(len(b) == batch_size for b in batches[:-1])
+    assert 1 <= len(batches[-1]) <= batch_size
+    assert [st for b in batches for st in b] == expected
+    assert sc.counters.stanzas == len(expected)
+    with pytest.raises(ScannerEOFError):
+        next(sc.scan_stanza_batches(batch_size))
+
+
+def test_scan_stanza_batches_file() -> None:
+    sc = Scanner(StringIO(INPUT), skip_leading_newlines=True)
+    assert list(sc.scan_stanza_batches(4)) == [
+        [
+            [("Foo", "1"), ("Bar", "a\n  b")],
+            [("Foo", "2")],
+            [("Foo", "3"), ("Bar", "c")],
+            [("Foo", "4")],
+        ],
+        [[("Foo", "5")]],
+    ]
+    assert sc.counters == (17, len(INPUT), 7, 1, 5, 0)
+
+
+def test_scan_stanza_batches_empty() -> None:
+    assert list(Scanner("").scan_stanza_batches(10)) == []
+    assert list(Scanner("\n\n").scan_stanza_batches(10)) == [[[]]]
+
+
+def test_scan_stanza_batches_checkpoint() -> None:
+    sc = Scanner(INPUT, skip_leading_newlines=True)
+    batches = sc.scan_stanza_batches(2)
+    next(batches)
+    checkpoint = sc.checkpoint()
+    assert checkpoint.stanzas == 2
+    rest = Scanner.from_checkpoint(INPUT, checkpoint)
+    assert list(rest.scan_stanzas()) == [
+        [("Foo", "3"), ("Bar", "c")],
+        [("Foo", "4")],
+        [("Foo", "5")],
+    ]
+
+
+def test_scan_stanza_batches_error() -> None:
+    sc = Scanner("Foo: 1\n\nFoo: 2\nBar\n\nFoo: 3\n")
+    batches = sc.scan_stanza_batches(1)
+    assert next(batches) == [[("Foo", "1")]]
+    with pytest.raises(MalformedHeaderError):
+        next(batches)
+    assert sc.counters.fields == 2
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_scan_stanza_batches_bad_size(batch_size: int) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        Scanner(INPUT).scan_stanza_batches(batch_size)
+    assert str(excinfo.value) == "batch_size must be positive"
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from io import StringIO
+import pytest
+from headerparser import (
+    MalformedHeaderError,
+    Scanner,
+    ScannerError,
+    UnexpectedFoldingError,
+    scan_stanzas,
+)
+
+INPUT = (
+    "Foo: 1\n"  # 1
+    "\n"
+    "Foo: 2\n"  # 3
+    "Oops\n"  # 4
+    "Bar: x\n"
+    "\n"
+    "\n"
+    " folded\n"  # 8
+    "Foo: 3\n"
+    "\n"
+    "Foo: 4\n"  # 11
+    "Bar: y\n"
+)
+
+GOOD = [[("Foo", "1")], [("Foo", "4"), ("Bar", "y")]]
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.errors: list[tuple[type, int]] = []
+
+    def __call__(self, e: ScannerError, lineno: int) -> None:
+        self.errors.append((type(e), lineno))
+
+
+@pytest.mark.parametrize("data", [INPUT, StringIO(INPUT), INPUT.splitlines(True)])
+def test_scan_stanzas_on_error(data: object) -> None:
+    rec = Recorder()
+    sc = Scanner(data)  # type: ignore[arg-type]
+    assert list(sc.scan_stanzas(on_error=rec)) == GOOD
+    assert rec.errors == [(MalformedHeaderError, 4), (UnexpectedFoldingError, 8)]
+    assert sc.counters.stanzas == 4
+    assert sc.counters.lines == 12
+
+
+def test_scan_stanzas_without_on_error() -> None:
+    stanzas = scan_stanzas(INPUT)
+    assert next(stanzas) == [("Foo", "1")]
+    with pytest.raises(MalformedHeaderError):
+        next(stanzas)
+
+
+def test_scan_stanzas_function_on_error() -> None:
+    rec = Recorder()
+    assert list(scan_stanzas(INPUT, on_error=rec)) == GOOD
+    assert [lineno for _, lineno in rec.errors] == [4, 8]
+
+
+@pytest.mark.parametrize(
+    "data,stanzas,linenos",
+    [
+        ("Oops\n", [], [1]),
+        ("Oops", [], [1]),
+        ("Oops\n\n\n", [], [1]),
+        (" folded\nFoo: 1\n\nFoo: 2\n", [[("Foo", "2")]], [1]),
+        ("Foo: 1\n\nOops\nOops\n", [[("Foo", "1")]], [3]),
+        ("Oops\n\nOops\n\nFoo: 1\n\n", [[("Foo", "1")]], [1, 3]),
+    ],
+)
+def test_scan_stanzas_on_error_edges(
+    data: str, stanzas: list[list[tuple[str, str]]], linenos: list[int]
+) -> None:
+    rec = Recorder()
+    assert list(scan_stanzas(data, on_error=rec)) == stanzas
+    assert [lineno for _, lineno in rec.errors] == linenos
+
+
+def test_scan_stanzas_on_error_checkpoint() -> None:
+    checkpoints = []
+    sc = Scanner(INPUT)
+
+    def on_error(e: ScannerError, lineno: int) -> None:
+        checkpoints.append(sc.checkpoint())
+
+    list(sc.scan_stanzas(on_error=on_error))
+    assert [cp.lineno for cp in checkpoints] == [6, 10]
+    resumed = Scanner.from_checkpoint(INPUT, checkpoints[0])
+    with pytest.raises(UnexpectedFoldingError):
+        list(resumed.scan_stanzas())
+    resumed = Scanner.from_checkpoint(INPUT, checkpoints[1])
+    assert list(resumed.scan_stanzas()) == [GOOD[1]]
+    assert resumed.counters.stanzas == 4
+
+
+def test_scan_stanzas_on_error_counters() -> None:
+    sc = Scanner(INPUT)
+    seen: list[tuple[str, int, int]] = []
+
+    def on_error(e: ScannerError, lineno: int) -> None:
+        seen.append(("error", sc.counters.stanzas, sc.checkpoint().stanzas))
+
+    for _ in sc.scan_stanzas(on_error=on_error):
+        seen.append(("stanza", sc.counters.stanzas, sc.stanza_lineno))
+    # Skipped stanzas are counted along with the yielded ones:
+    assert seen == [
+        ("stanza", 1, 1),
+        ("error", 2, 2),
+        ("error", 3, 3),
+        ("stanza", 4, 11),
+    ]
+
+
+def test_scan_stanza_batches_on_error() -> None:
+    rec = Recorder()
+    batches = list(Scanner(INPUT).scan_stanza_batches(5, on_error=rec))
+    assert batches == [GOOD]
+    assert len(rec.errors) == 2
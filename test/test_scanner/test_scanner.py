@@ -296,3 +296,37 @@ def test_separator_regex_default_separator(scanner: ScannerType) -> None:
         list(scanner("Foo = red\nBar: green\n", separator_regex=r"\s*=\s*"))
     assert str(excinfo.value) == "Invalid header line encountered: 'Bar: green'"
     assert excinfo.value.line == "Bar: green"
+
+
+@pytest.mark.parametrize("intern_names", [False, True])
+def test_intern_names(intern_names: bool) -> None:
+    # Build the names at runtime so that they aren't interned as constants:
+    text = "".join(f"{'Foo' + str(i % 2)}: {i}\n" for i in range(4))
+    fields = list(scan(text, intern_names=intern_names))
+    assert fields == [("Foo0", "0"), ("Foo1", "1"), ("Foo0", "2"), ("Foo1", "3")]
+    assert (fields[0][0] is fields[2][0]) is intern_names
+    assert (fields[1][0] is fields[3][0]) is intern_names
+
+
+def test_scanner_eq() -> None:
+    lines = iter(["Foo: red\n"])
+    sc = headerparser.Scanner(lines)
+    assert sc == headerparser.Scanner(lines)
+    assert sc != headerparser.Scanner(lines, skip_leading_newlines=True)
+    assert sc != headerparser.Scanner(["Foo: red\n"])
+    assert sc != ("Foo", "red")
+    with pytest.raises(TypeError):
+        hash(sc)
+
+
+def test_scanner_repr() -> None:
+    lines = iter(["Foo=red\n"])
+    sc = headerparser.Scanner(lines, separator_regex="=")
+    assert repr(sc) == (
+        f"Scanner(_data={lines!r}, separator_regex=re.compile('='),"
+        " skip_leading_newlines=False, intern_names=False, stats=None,"
+        " progress=None, progress_every=None, progress_interval=None,"
+        " _eof=False)"
+    )
+    list(sc.scan())
+    assert repr(sc).endswith(", _eof=True)")
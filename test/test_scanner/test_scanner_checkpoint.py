@@ -0,0 +1,126 @@
+from __future__ import annotations
+from io import StringIO
+import json
+from pathlib import Path
+import pytest
+from headerparser import Scanner, ScannerCheckpoint, ScannerCounters
+
+INPUT = (
+    "Foo: red\n"
+    "Bar: green\n"
+    "\n"
+    "\n"
+    "Foo: blue\n"
+    "Bar: yellow\n"
+    "  and purple\n"
+    "\r\n"
+    "Foo: cyan\n"
+    "Bar: magenta\n"
+)
+
+STANZAS = [
+    [("Foo", "red"), ("Bar", "green")],
+    [("Foo", "blue"), ("Bar", "yellow\n  and purple")],
+    [("Foo", "cyan"), ("Bar", "magenta")],
+]
+
+
+def test_checkpoints() -> None:
+    sc = Scanner(INPUT)
+    assert sc.checkpoint() == ScannerCheckpoint(0, 0, 0, False)
+    checkpoints = []
+    for _ in sc.scan_stanzas():
+        checkpoints.append(sc.checkpoint())
+    assert checkpoints == [
+        ScannerCheckpoint(offset=21, lineno=3, stanzas=1, skip_leading_newlines=True),
+        ScannerCheckpoint(offset=59, lineno=8, stanzas=2, skip_leading_newlines=True),
+        ScannerCheckpoint(offset=82, lineno=10, stanzas=3, skip_leading_newlines=True),
+    ]
+
+
+@pytest.mark.parametrize("n", range(4))
+@pytest.mark.parametrize("as_file", [False, True])
+def test_resume(n: int, as_file: bool) -> None:
+    sc = Scanner(INPUT)
+    stanzas = sc.scan_stanzas()
+    for _ in range(n):
+        next(stanzas)
+    cp = ScannerCheckpoint(*json.loads(json.dumps(sc.checkpoint())))
+    sc2 = Scanner.from_checkpoint(StringIO(INPUT) if as_file else INPUT, cp)
+    assert list(sc2.scan_stanzas()) == STANZAS[n:]
+    assert sc2.checkpoint().stanzas == 3
+    assert sc2.checkpoint().lineno == 10
+
+
+def test_resume_after_scan_next_stanza() -> None:
+    sc = Scanner("Foo: red\n\nThis is the body.\n")
+    assert list(sc.scan_next_stanza()) == [("Foo", "red")]
+    sc2 = Scanner.from_checkpoint(
+        ["Foo: red\n", "\n", "This is the body.\n"], sc.checkpoint()
+    )
+    assert sc2.get_unscanned() == "This is the body.\n"
+
+
+def test_checkpoint_position() -> None:
+    sc = Scanner(StringIO(INPUT))
+    assert sc.checkpoint().position == 0
+    positions = []
+    for _ in sc.scan_stanzas():
+        positions.append(sc.checkpoint().position)
+    assert positions == [21, 59, 82]
+    assert Scanner(INPUT).checkpoint().position is None
+    assert Scanner(INPUT.splitlines(True)).checkpoint().position is None
+
+
+@pytest.mark.parametrize("n", range(4))
+def test_resume_seeks(n: int) -> None:
+    sc = Scanner(StringIO(INPUT))
+    stanzas = sc.scan_stanzas()
+    for _ in range(n):
+        next(stanzas)
+    cp = ScannerCheckpoint(*json.loads(json.dumps(sc.checkpoint())))
+    assert cp.position is not None
+    # If the resumed scanner reread the input before the checkpoint instead of
+    # seeking, it would see this garbage:
+    fp = StringIO("x" * cp.position + INPUT[cp.position :])
+    sc2 = Scanner.from_checkpoint(fp, cp)
+    assert list(sc2.scan_stanzas()) == STANZAS[n:]
+    assert sc2.checkpoint().lineno == 10
+
+
+def test_resume_seeks_real_file(tmp_path: Path) -> None:
+    path = tmp_path / "stanzas.txt"
+    path.write_text(INPUT.replace("red", "réd"), encoding="utf-8")
+    with path.open(encoding="utf-8", newline="") as fp:
+        sc = Scanner(fp)
+        assert next(sc.scan_stanzas()) == [("Foo", "réd"), ("Bar", "green")]
+        cp = sc.checkpoint()
+    with path.open(encoding="utf-8", newline="") as fp:
+        sc2 = Scanner.from_checkpoint(fp, cp)
+        assert list(sc2.scan_stanzas()) == STANZAS[1:]
+
+
+def test_resume_file_from_string_checkpoint() -> None:
+    sc = Scanner(INPUT)
+    next(sc.scan_stanzas())
+    sc2 = Scanner.from_checkpoint(StringIO(INPUT), sc.checkpoint())
+    assert list(sc2.scan_stanzas()) == STANZAS[1:]
+    assert sc2.checkpoint().position == 82
+
+
+def test_resume_kwargs() -> None:
+    sc = Scanner("Foo=red\n\nFoo=blue\n", separator_regex="=")
+    next(sc.scan_stanzas())
+    seen: list[ScannerCounters] = []
+    sc2 = Scanner.from_checkpoint(
+        "Foo=red\n\nFoo=blue\n",
+        sc.checkpoint(),
+        separator_regex="=",
+        intern_names=True,
+        progress=seen.append,
+        progress_every=1,
+    )
+    assert sc2.intern_names
+    assert sc2.skip_leading_newlines
+    assert list(sc2.scan_stanzas()) == [[("Foo", "blue")]]
+    assert [c.stanzas for c in seen] == [2]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+from pytest_mock import MockerFixture
+from headerparser import HeaderParser, Scanner, ScannerCounters, scan_stanzas
+
+STANZAS = "".join(
+    f"Index: {i}\nDescription: line one\n  line two\n  line three\n\n"
+    for i in range(10)
+)
+
+
+def test_counters() -> None:
+    sc = Scanner(STANZAS)
+    assert sc.counters == ScannerCounters(0, 0, 0, 0, 0, 0)
+    for _ in sc.scan_stanzas():
+        pass
+    assert sc.counters == ScannerCounters(
+        lines=50,
+        chars=len(STANZAS),
+        fields=20,
+        continuation_lines=20,
+        stanzas=10,
+        body_chars=0,
+    )
+
+
+def test_counters_body() -> None:
+    sc = Scanner("Foo: bar\nBaz: quux\n\nThis is a body.\nSo is this.\n")
+    assert list(sc.scan()) == [
+        ("Foo", "bar"),
+        ("Baz", "quux"),
+        (None, "This is a body.\nSo is this.\n"),
+    ]
+    assert sc.counters == ScannerCounters(
+        lines=5,
+        chars=48,
+        fields=2,
+        continuation_lines=0,
+        stanzas=0,
+        body_chars=28,
+    )
+
+
+def test_progress_every() -> None:
+    reports: list[ScannerCounters] = []
+    for _ in scan_stanzas(STANZAS, progress=reports.append, progress_every=4):
+        pass
+    assert [r.stanzas for r in reports] == [4, 8, 10]
+    assert [r.fields for r in reports] == [8, 16, 20]
+
+
+def test_progress_every_exact() -> None:
+    reports: list[ScannerCounters] = []
+    for _ in scan_stanzas(STANZAS, progress=reports.append, progress_every=5):
+        pass
+    assert [r.stanzas for r in reports] == [5, 10]
+
+
+def test_progress_final_only() -> None:
+    reports: list[ScannerCounters] = []
+    stanzas = scan_stanzas(STANZAS, progress=reports.append)
+    for _ in range(9):
+        next(stanzas)
+    assert reports == []
+    assert len(list(stanzas)) == 1
+    assert [r.stanzas for r in reports] == [10]
+
+
+def test_progress_interval(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "headerparser.scanner.monotonic",
+        side_effect=[0, 1, 2, 3, 6, 100, 101, 104, 105, 106, 107, 108, 111, 112],
+    )
+    reports: list[ScannerCounters] = []
+    for _ in scan_stanzas(STANZAS, progress=reports.append, progress_interval=5):
+        pass
+    assert [r.stanzas for r in reports] == [4, 7, 10]
+
+
+def test_parser_progress() -> None:
+    reports: list[ScannerCounters] = []
+    parser = HeaderParser(progress=reports.append, progress_every=6)
+    parser.add_additional()
+    assert len(list(parser.parse_stanzas(STANZAS))) == 10
+    assert [r.stanzas for r in reports] == [6, 10]
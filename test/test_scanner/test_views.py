@@ -0,0 +1,100 @@
+from __future__ import annotations
+from collections.abc import Callable
+from typing import Any
+import pytest
+from headerparser import (
+    FieldView,
+    MalformedHeaderError,
+    UnexpectedFoldingError,
+    scan,
+    scan_stanza_views,
+    scan_stanzas,
+    scan_views,
+)
+
+INPUTS = [
+    "",
+    "\n",
+    "\n\n\n",
+    "Foo: red\nBar: green\n",
+    "Foo: red\nBar: green",
+    "Foo: red\r\nBar: green\r\n\r\nBody\r\ntext\r\n",
+    "Foo: red\rBar: green\r\rBody",
+    "Foo: red\n  and\r\n\tpurple\rBar: green\n",
+    "Foo: red\n\n",
+    "\nFoo: red\n\nBody\n",
+    "Foo: red\n\n\n\nBar: green\n\n\n",
+    "Foo:\nBar  :  \nBaz: \n  \n",
+    "Foo: red\n\nBar: green\n  and blue\n\nBaz: yellow\n",
+    "Key: value: with: colons\n",
+]
+
+
+def outcome(func: Callable[[], Any]) -> Any:
+    try:
+        return func()
+    except Exception as e:
+        return (type(e), e.args)
+
+
+@pytest.mark.parametrize("data", INPUTS)
+@pytest.mark.parametrize("skip_leading_newlines", [False, True])
+def test_scan_views(data: str, skip_leading_newlines: bool) -> None:
+    views = list(scan_views(data, skip_leading_newlines=skip_leading_newlines))
+    assert all(isinstance(v, FieldView) for v in views)
+    assert [tuple(v) for v in views] == list(
+        scan(data, skip_leading_newlines=skip_leading_newlines)
+    )
+
+
+@pytest.mark.parametrize("data", INPUTS)
+@pytest.mark.parametrize("skip_leading_newlines", [False, True])
+def test_scan_stanza_views(data: str, skip_leading_newlines: bool) -> None:
+    assert outcome(
+        lambda: [
+            [tuple(v) for v in st]
+            for st in scan_stanza_views(
+                data, skip_leading_newlines=skip_leading_newlines
+            )
+        ]
+    ) == outcome(
+        lambda: list(scan_stanzas(data, skip_leading_newlines=skip_leading_newlines))
+    )
+
+
+def test_views_are_lazy() -> None:
+    data = "Foo: red\n  and\r\n  blue\nBar: green\n\nBody\n"
+    foo, bar, body = scan_views(data)
+    assert foo._name is None
+    assert foo._value is None
+    assert data[foo.start : foo.end] == "red\n  and\r\n  blue"
+    assert foo.value == "red\n  and\n  blue"
+    assert foo.name == "Foo"
+    assert foo.name is foo.name
+    assert bar == ("Bar", "green")
+    assert body.name is None
+    assert body.value == "Body\n"
+    assert repr(bar) == "FieldView(name='Bar', value='green')"
+    assert hash(bar) == hash(("Bar", "green"))
+    name, value = bar
+    assert (name, value) == ("Bar", "green")
+
+
+def test_views_separator_regex() -> None:
+    assert list(scan_views("Foo = red\nBar=green\n", separator_regex=r"\s*=\s*")) == [
+        ("Foo", "red"),
+        ("Bar", "green"),
+    ]
+
+
+def test_views_malformed() -> None:
+    views = scan_stanza_views("Foo: red\nBar green\n")
+    with pytest.raises(MalformedHeaderError) as excinfo:
+        next(views)
+    assert excinfo.value.line == "Bar green"
+
+
+def test_views_unexpected_folding() -> None:
+    with pytest.raises(UnexpectedFoldingError) as excinfo:
+        list(scan_views("  Foo: red\r\n"))
+    assert excinfo.value.line == "  Foo: red"